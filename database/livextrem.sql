@@ -60,6 +60,20 @@ INSERT INTO `content` (`content_id`, `titel`, `beschreibung`, `kategorie`, `plat
 
 -- --------------------------------------------------------
 
+--
+-- Tabellenstruktur für Tabelle `dashboard_tombstones`
+--
+
+CREATE TABLE `dashboard_tombstones` (
+  `tombstone_id` bigint(20) UNSIGNED NOT NULL,
+  `table_name` varchar(40) NOT NULL,
+  `row_id` bigint(20) UNSIGNED NOT NULL,
+  `streamer_id` bigint(20) UNSIGNED NOT NULL,
+  `deleted_at` datetime NOT NULL DEFAULT current_timestamp()
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci;
+
+-- --------------------------------------------------------
+
 --
 -- Tabellenstruktur für Tabelle `finanzen`
 --
@@ -110,6 +124,30 @@ INSERT INTO `roles` (`role_id`, `name`) VALUES
 
 -- --------------------------------------------------------
 
+--
+-- Tabellenstruktur für Tabelle `schema_version`
+--
+
+CREATE TABLE `schema_version` (
+  `version` int(10) UNSIGNED NOT NULL,
+  `beschreibung` varchar(200) NOT NULL,
+  `applied_at` datetime NOT NULL DEFAULT current_timestamp()
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci;
+
+--
+-- Daten für Tabelle `schema_version`
+--
+
+INSERT INTO `schema_version` (`version`, `beschreibung`, `applied_at`) VALUES
+(1, 'Dashboard-Tabellen: ToDos, Finanzen, Content, Streamplanung', '2026-04-02 06:23:00'),
+(2, 'streamer_id in streamer_todos/streamer_finances an streamer angleichen (BIGINT UNSIGNED)', '2026-04-02 06:23:00'),
+(3, 'Delta-Sync: updated_at gepflegt + indiziert, Tombstones für Löschungen', '2026-04-02 06:23:00'),
+(4, 'stream_planung: Composite-Index (streamer_id, datum) für Kalender und Planung', '2026-04-02 06:23:00'),
+(5, 'Delta-Sync: Tombstones nach Zeit lesen (streamer_id, deleted_at)', '2026-04-02 06:23:00'),
+(6, 'Delta-Sync: Index auf deleted_at zum Aufräumen alter Tombstones', '2026-04-02 06:23:00');
+
+-- --------------------------------------------------------
+
 --
 -- Tabellenstruktur für Tabelle `streamer`
 --
@@ -132,13 +170,13 @@ CREATE TABLE `streamer` (
 
 CREATE TABLE `streamer_finances` (
   `finance_id` int(11) NOT NULL,
-  `streamer_id` int(11) NOT NULL,
+  `streamer_id` bigint(20) UNSIGNED NOT NULL,
   `booking_date` datetime NOT NULL,
   `description` varchar(255) NOT NULL,
   `amount` decimal(10,2) NOT NULL,
   `entry_type` varchar(20) NOT NULL,
   `created_at` datetime NOT NULL DEFAULT current_timestamp(),
-  `updated_at` datetime DEFAULT NULL
+  `updated_at` datetime NOT NULL DEFAULT current_timestamp() ON UPDATE current_timestamp()
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci;
 
 -- --------------------------------------------------------
@@ -171,11 +209,11 @@ CREATE TABLE `streamer_moderator` (
 
 CREATE TABLE `streamer_todos` (
   `todo_id` int(11) NOT NULL,
-  `streamer_id` int(11) NOT NULL,
+  `streamer_id` bigint(20) UNSIGNED NOT NULL,
   `task` varchar(60) NOT NULL,
   `done` tinyint(1) NOT NULL DEFAULT 0,
   `created_at` datetime NOT NULL DEFAULT current_timestamp(),
-  `updated_at` datetime DEFAULT NULL
+  `updated_at` datetime NOT NULL DEFAULT current_timestamp() ON UPDATE current_timestamp()
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci;
 
 -- --------------------------------------------------------
@@ -262,6 +300,15 @@ CREATE TABLE `user_roles` (
 ALTER TABLE `content`
   ADD PRIMARY KEY (`content_id`);
 
+--
+-- Indizes für die Tabelle `dashboard_tombstones`
+--
+ALTER TABLE `dashboard_tombstones`
+  ADD PRIMARY KEY (`tombstone_id`),
+  ADD KEY `idx_tombstones_streamer` (`streamer_id`,`tombstone_id`),
+  ADD KEY `idx_tombstones_streamer_time` (`streamer_id`,`deleted_at`),
+  ADD KEY `idx_tombstones_time` (`deleted_at`);
+
 --
 -- Indizes für die Tabelle `finanzen`
 --
@@ -284,6 +331,12 @@ ALTER TABLE `roles`
   ADD PRIMARY KEY (`role_id`),
   ADD UNIQUE KEY `name` (`name`);
 
+--
+-- Indizes für die Tabelle `schema_version`
+--
+ALTER TABLE `schema_version`
+  ADD PRIMARY KEY (`version`);
+
 --
 -- Indizes für die Tabelle `streamer`
 --
@@ -298,7 +351,8 @@ ALTER TABLE `streamer`
 ALTER TABLE `streamer_finances`
   ADD PRIMARY KEY (`finance_id`),
   ADD KEY `idx_streamer_finances_streamer` (`streamer_id`),
-  ADD KEY `idx_streamer_finances_date` (`booking_date`);
+  ADD KEY `idx_streamer_finances_date` (`booking_date`),
+  ADD KEY `idx_streamer_finances_sync` (`streamer_id`,`updated_at`);
 
 --
 -- Indizes für die Tabelle `streamer_manager`
@@ -319,7 +373,8 @@ ALTER TABLE `streamer_moderator`
 --
 ALTER TABLE `streamer_todos`
   ADD PRIMARY KEY (`todo_id`),
-  ADD KEY `idx_streamer_todos_streamer` (`streamer_id`);
+  ADD KEY `idx_streamer_todos_streamer` (`streamer_id`),
+  ADD KEY `idx_streamer_todos_sync` (`streamer_id`,`updated_at`);
 
 --
 -- Indizes für die Tabelle `stream_planung`
@@ -329,7 +384,8 @@ ALTER TABLE `stream_planung`
   ADD KEY `fk_sp_streamer` (`streamer_id`),
   ADD KEY `fk_sp_content` (`content_id`),
   ADD KEY `datum` (`datum`),
-  ADD KEY `status` (`status`);
+  ADD KEY `status` (`status`),
+  ADD KEY `idx_sp_streamer_datum` (`streamer_id`,`datum`);
 
 --
 -- Indizes für die Tabelle `todo_liste`
@@ -373,6 +429,12 @@ ALTER TABLE `user_roles`
 ALTER TABLE `content`
   MODIFY `content_id` bigint(20) UNSIGNED NOT NULL AUTO_INCREMENT, AUTO_INCREMENT=19;
 
+--
+-- AUTO_INCREMENT für Tabelle `dashboard_tombstones`
+--
+ALTER TABLE `dashboard_tombstones`
+  MODIFY `tombstone_id` bigint(20) UNSIGNED NOT NULL AUTO_INCREMENT;
+
 --
 -- AUTO_INCREMENT für Tabelle `finanzen`
 --
@@ -0,0 +1,265 @@
+import atexit
+import itertools
+import queue
+import threading
+
+from config import Config
+
+# -----------------------------------------------------------------------------
+# Gemeinsamer Hintergrund-Executor + Tk-Dispatch-Queue
+# -----------------------------------------------------------------------------
+# Statt pro Aktion einen eigenen threading.Thread zu starten, laufen alle
+# blockierenden Arbeiten (DB, Twitch-API, OAuth) auf einer festen Anzahl
+# Worker-Threads. Ergebnisse gehen NICHT per widget.after() aus dem Worker
+# zurück (nicht thread-sicher), sondern über eine Queue, die der Tk-Mainloop
+# regelmäßig per after() leert:
+#
+#     background.attach_ui(self)                       # einmal pro Fenster
+#     background.submit(self._db_load, streamer_id,
+#                       on_done=self._apply, on_error=self._show_error,
+#                       key="dashboard-load")
+#
+# on_done/on_error laufen immer im Tk-Thread. Mit `key` wird ein bereits
+# laufender/wartender Task gleichen Namens wiederverwendet (Doppelklicks
+# erzeugen keine zusätzlichen Threads/DB-Zugriffe); die Callbacks jedes
+# Aufrufers werden an diesen Task angehängt und laufen alle.
+# -----------------------------------------------------------------------------
+
+PRIORITY_HIGH = 0      # direkte Nutzeraktionen (Login, Speichern, Löschen)
+PRIORITY_NORMAL = 10   # Daten laden
+PRIORITY_LOW = 20      # Statistiken, Vorausladen
+
+DEFAULT_POLL_MS = 30
+_MAX_CALLBACKS_PER_TICK = 50
+
+
+class Task:
+    """Handle auf eine eingereichte Arbeit."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    def __init__(self, fn, args, kwargs, on_done, on_error, priority, key):
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.callbacks = [(on_done, on_error)]   # ein Eintrag pro submit() mit diesem key
+        self.priority = priority
+        self.key = key
+        self.state = Task.PENDING
+        self.result = None
+        self.error = None
+        self._lock = threading.Lock()
+        self._finished = threading.Event()
+
+    @property
+    def cancelled(self):
+        return self.state == Task.CANCELLED
+
+    def done(self):
+        return self._finished.is_set()
+
+    def wait(self, timeout=None):
+        """Blockiert bis der Task fertig ist (nicht aus dem Tk-Thread aufrufen)."""
+        return self._finished.wait(timeout)
+
+    def cancel(self):
+        """Bricht den Task ab.
+
+        Wartende Tasks laufen gar nicht erst; bei laufenden wird nur das
+        Ergebnis verworfen (on_done/on_error werden nicht mehr aufgerufen –
+        auch nicht die per key angehängten anderer Aufrufer).
+        """
+        with self._lock:
+            if self.state in (Task.DONE, Task.FAILED, Task.CANCELLED):
+                return False
+            self.state = Task.CANCELLED
+        return True
+
+
+class BackgroundExecutor:
+    def __init__(self, max_workers=None):
+        self.max_workers = max(1, int(max_workers if max_workers is not None else Config.BG_WORKERS))
+        self._queue = queue.PriorityQueue()
+        self._seq = itertools.count()      # FIFO innerhalb gleicher Priorität
+        self._threads = []
+        self._by_key = {}                  # key -> Task (wartend oder laufend)
+        self._lock = threading.Lock()
+        self._ui_queue = queue.SimpleQueue()
+        self._closed = False
+
+    # ---------- Einreichen ----------
+    def submit(self, fn, *args, on_done=None, on_error=None, priority=PRIORITY_NORMAL, key=None, **kwargs):
+        """Reiht fn(*args, **kwargs) ein und gibt den Task zurück.
+
+        Wartet oder läuft bereits ein Task mit demselben key, wird kein neuer
+        gestartet: on_done/on_error werden an den vorhandenen Task angehängt
+        und laufen mit dessen Ergebnis (fn, args, kwargs und priority dieses
+        Aufrufs werden dann ignoriert). Jeder Aufrufer bekommt also seinen
+        Callback, solange der Task nicht abgebrochen wird.
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Der Hintergrund-Executor wurde bereits beendet.")
+            if key is not None:
+                existing = self._by_key.get(key)
+                if existing is not None:
+                    with existing._lock:
+                        if existing.state in (Task.PENDING, Task.RUNNING):
+                            existing.callbacks.append((on_done, on_error))
+                            return existing
+                    # Gerade fertig geworden: neu starten, damit die Callbacks sicher laufen
+            task = Task(fn, args, kwargs, on_done, on_error, priority, key)
+            if key is not None:
+                self._by_key[key] = task
+            self._ensure_workers()
+        self._queue.put((priority, next(self._seq), task))
+        return task
+
+    def call_in_ui(self, callback, *args):
+        """Reiht einen Aufruf für den Tk-Thread ein (aus beliebigem Thread nutzbar)."""
+        self._ui_queue.put((callback, args))
+
+    def _ensure_workers(self):
+        # Threads werden erst beim ersten Bedarf gestartet
+        while len(self._threads) < self.max_workers:
+            t = threading.Thread(target=self._worker, name=f"livextrem-bg-{len(self._threads) + 1}", daemon=True)
+            self._threads.append(t)
+            t.start()
+
+    # ---------- Worker ----------
+    def _worker(self):
+        while True:
+            _prio, _seq, task = self._queue.get()
+            if task is None:
+                return
+            with task._lock:
+                if task.state == Task.CANCELLED:
+                    self._forget(task)
+                    continue
+                task.state = Task.RUNNING
+            try:
+                result = task.fn(*task.args, **task.kwargs)
+            except Exception as e:
+                self._finish(task, Task.FAILED, error=e)
+            else:
+                self._finish(task, Task.DONE, result=result)
+
+    def _finish(self, task, state, result=None, error=None):
+        with task._lock:
+            cancelled = task.state == Task.CANCELLED
+            if not cancelled:
+                task.state = state
+                task.result = result
+                task.error = error
+            # Ab hier hängt submit() nichts mehr an (Zustand ist nicht mehr wartend/laufend)
+            callbacks = list(task.callbacks)
+        self._forget(task)
+
+        if cancelled:
+            return
+        if error is not None:
+            handlers = [on_error for _on_done, on_error in callbacks if on_error is not None]
+            for on_error in handlers:
+                self.call_in_ui(on_error, error)
+            if not handlers:
+                print(f"Hintergrund-Fehler ({getattr(task.fn, '__name__', task.fn)}):", repr(error))
+        else:
+            for on_done, _on_error in callbacks:
+                if on_done is not None:
+                    self.call_in_ui(on_done, result)
+
+    def _forget(self, task):
+        task._finished.set()
+        if task.key is None:
+            return
+        with self._lock:
+            if self._by_key.get(task.key) is task:
+                del self._by_key[task.key]
+
+    # ---------- Tk-Seite ----------
+    def drain_ui(self, limit=_MAX_CALLBACKS_PER_TICK):
+        """Führt wartende UI-Callbacks aus. Nur aus dem Tk-Thread aufrufen."""
+        for _ in range(limit):
+            try:
+                callback, args = self._ui_queue.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                callback(*args)
+            except Exception as e:
+                print("UI-Callback-Fehler:", repr(e))
+
+    def attach_ui(self, widget, interval_ms=DEFAULT_POLL_MS):
+        """Startet die after()-Schleife, die die UI-Queue auf dem Tk-Thread leert.
+
+        Endet von selbst, sobald das Widget zerstört ist.
+        """
+        interval_ms = int(interval_ms)
+
+        def _poll():
+            try:
+                if not widget.winfo_exists():
+                    return
+            except Exception:
+                return
+            self.drain_ui()
+            try:
+                widget.after(interval_ms, _poll)
+            except Exception:
+                pass
+
+        widget.after(interval_ms, _poll)
+
+    # ---------- Verwaltung ----------
+    def stats(self):
+        with self._lock:
+            return {"workers": len(self._threads), "queued": self._queue.qsize(), "keyed": len(self._by_key)}
+
+    def shutdown(self):
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            threads = list(self._threads)
+        # Sentinels hinter alle regulären Prioritäten einreihen
+        for _ in threads:
+            self._queue.put((float("inf"), next(self._seq), None))
+
+
+# ---------- Modulweiter Zugriff ----------
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = BackgroundExecutor()
+        return _executor
+
+
+def submit(fn, *args, **kwargs):
+    """Kurzform für get_executor().submit(...)."""
+    return get_executor().submit(fn, *args, **kwargs)
+
+
+def call_in_ui(callback, *args):
+    get_executor().call_in_ui(callback, *args)
+
+
+def attach_ui(widget, interval_ms=DEFAULT_POLL_MS):
+    get_executor().attach_ui(widget, interval_ms=interval_ms)
+
+
+@atexit.register
+def shutdown():
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown()
@@ -0,0 +1,191 @@
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from config import Config
+
+# -----------------------------------------------------------------------------
+# VOD-Chat-Cache auf der Platte (SQLite, append-only)
+# -----------------------------------------------------------------------------
+# Der Chat eines archivierten VODs ändert sich nicht mehr. Pro VOD-ID werden
+# die Nachrichten in Seitenreihenfolge und der Pagination-Cursor der nächsten
+# noch fehlenden Seite gespeichert:
+#
+#     cache = VodChatCache()
+#     cached = cache.load(vod_id)            # CachedChat(messages, cursor, completed)
+#     if not cached.completed:
+#         for page, next_cursor in tapi_mod.iter_vod_chat_pages(token, vod_id, cached.cursor):
+#             cache.append_page(vod_id, page, next_cursor)
+#
+# Eine Seite und ihr Cursor werden in EINER Transaktion geschrieben – nach
+# einem Abbruch setzt der nächste Ladevorgang genau hinter der letzten
+# vollständigen Seite fort. Nur die zuletzt benutzten Config.CHAT_CACHE_MAX_VODS
+# VODs werden behalten.
+# -----------------------------------------------------------------------------
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS vods (
+        vod_id     TEXT PRIMARY KEY,
+        cursor     TEXT,
+        completed  INTEGER NOT NULL DEFAULT 0,
+        used_at    REAL NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS messages (
+        vod_id     TEXT NOT NULL,
+        seq        INTEGER NOT NULL,
+        username   TEXT NOT NULL,
+        message    TEXT NOT NULL,
+        timestamp  TEXT,
+        PRIMARY KEY (vod_id, seq)
+    ) WITHOUT ROWID
+    """,
+)
+
+
+class CachedChat:
+    __slots__ = ("messages", "cursor", "completed")
+
+    def __init__(self, messages, cursor, completed):
+        self.messages = messages    # Liste von {"user", "message", "timestamp"}
+        self.cursor = cursor        # Cursor der nächsten fehlenden Seite (None = von vorne / fertig)
+        self.completed = completed  # alle Seiten geladen → kein Request mehr nötig
+
+
+class VodChatCache:
+    def __init__(self, path=None, max_vods=None):
+        self.path = Path(path or Path(Config.CACHE_DIR) / "vod_chat.sqlite3")
+        self.max_vods = Config.CHAT_CACHE_MAX_VODS if max_vods is None else int(max_vods)
+        self._lock = threading.Lock()
+        self._ready = False
+
+    # ---------- Verbindung ----------
+    def _connect(self):
+        # Eine Verbindung pro Aufruf: die Worker-Threads teilen sich kein sqlite-Objekt
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.path), timeout=10)
+        if not self._ready:
+            with self._lock:
+                if not self._ready:
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    for stmt in _SCHEMA:
+                        conn.execute(stmt)
+                    conn.commit()
+                    self._ready = True
+        return conn
+
+    # ---------- Zugriff ----------
+    def load(self, vod_id):
+        """Liefert den gespeicherten Stand für vod_id (leer, wenn nichts im Cache)."""
+        vod_id = str(vod_id)
+        try:
+            conn = self._connect()
+        except Exception as e:
+            print("Chat-Cache nicht verfügbar:", repr(e))
+            return CachedChat([], None, False)
+        try:
+            row = conn.execute("SELECT cursor, completed FROM vods WHERE vod_id = ?", (vod_id,)).fetchone()
+            if row is None:
+                return CachedChat([], None, False)
+            messages = [
+                {"user": user, "message": message, "timestamp": timestamp}
+                for user, message, timestamp in conn.execute(
+                    "SELECT username, message, timestamp FROM messages WHERE vod_id = ? ORDER BY seq",
+                    (vod_id,),
+                )
+            ]
+            with conn:
+                conn.execute("UPDATE vods SET used_at = ? WHERE vod_id = ?", (time.time(), vod_id))
+            cursor, completed = row
+            if not completed and messages and not cursor:
+                # Inkonsistenter Stand (sollte nicht vorkommen) → neu laden
+                return CachedChat([], None, False)
+            return CachedChat(messages, cursor, bool(completed))
+        except Exception as e:
+            print("Chat-Cache unlesbar, lade neu:", repr(e))
+            return CachedChat([], None, False)
+        finally:
+            conn.close()
+
+    def append_page(self, vod_id, messages, next_cursor):
+        """Hängt eine Seite an und merkt sich den Cursor der nächsten (None = letzte Seite).
+
+        Fehler werden nur geloggt – der Cache ist eine Optimierung, kein Muss.
+        """
+        vod_id = str(vod_id)
+        try:
+            conn = self._connect()
+        except Exception as e:
+            print("Chat-Cache nicht verfügbar:", repr(e))
+            return
+        try:
+            with conn:
+                row = conn.execute("SELECT COALESCE(MAX(seq), 0) FROM messages WHERE vod_id = ?", (vod_id,)).fetchone()
+                seq = row[0]
+                conn.executemany(
+                    "INSERT INTO messages (vod_id, seq, username, message, timestamp) VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (vod_id, seq + i, m["user"], m["message"], m.get("timestamp"))
+                        for i, m in enumerate(messages, start=1)
+                    ],
+                )
+                conn.execute(
+                    """
+                    INSERT INTO vods (vod_id, cursor, completed, used_at) VALUES (?, ?, ?, ?)
+                    ON CONFLICT(vod_id) DO UPDATE SET
+                        cursor = excluded.cursor, completed = excluded.completed, used_at = excluded.used_at
+                    """,
+                    (vod_id, next_cursor, 0 if next_cursor else 1, time.time()),
+                )
+            if not next_cursor:
+                self._prune(conn)
+        except Exception as e:
+            print("Chat-Cache konnte nicht geschrieben werden:", repr(e))
+        finally:
+            conn.close()
+
+    def delete(self, vod_id):
+        vod_id = str(vod_id)
+        try:
+            conn = self._connect()
+        except Exception as e:
+            print("Chat-Cache nicht verfügbar:", repr(e))
+            return
+        try:
+            with conn:
+                conn.execute("DELETE FROM messages WHERE vod_id = ?", (vod_id,))
+                conn.execute("DELETE FROM vods WHERE vod_id = ?", (vod_id,))
+        except Exception as e:
+            print("Chat-Cache konnte nicht geschrieben werden:", repr(e))
+        finally:
+            conn.close()
+
+    def _prune(self, conn):
+        """Entfernt die am längsten nicht benutzten VODs über max_vods hinaus."""
+        if self.max_vods <= 0:
+            return
+        with conn:
+            old = [
+                row[0] for row in conn.execute(
+                    "SELECT vod_id FROM vods ORDER BY used_at DESC LIMIT -1 OFFSET ?", (self.max_vods,)
+                )
+            ]
+            for vod_id in old:
+                conn.execute("DELETE FROM messages WHERE vod_id = ?", (vod_id,))
+                conn.execute("DELETE FROM vods WHERE vod_id = ?", (vod_id,))
+
+
+_default = None
+_default_lock = threading.Lock()
+
+
+def get_cache():
+    """Prozessweiter Cache unter Config.CACHE_DIR."""
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = VodChatCache()
+        return _default
@@ -0,0 +1,97 @@
+import sys
+from array import array
+import time
+from datetime import datetime, timezone
+
+# -----------------------------------------------------------------------------
+# Kompakter Speicher für geladene Chat-Nachrichten
+# -----------------------------------------------------------------------------
+# Statt einem dict pro Nachricht hält der ChatStore parallele Spalten:
+#
+#     users   Liste internierter Usernamen (jeder Name existiert nur einmal)
+#     texts   Liste der Nachrichtentexte
+#     times   array("q") mit Unix-Zeit in Millisekunden (UTC)
+#
+# Nachrichten werden nur angehängt, in Ladereihenfolge (die Chat-Seiten eines
+# VODs kommen chronologisch). "Die neuesten N" ist damit ein Slice vom Ende,
+# ohne Sortieren. Die Nachrichten-ID ist die Position + 1.
+#
+# Ein Lade-Thread darf anhängen, während der Tk-Thread liest: _count wird erst
+# erhöht, wenn alle Spalten die neuen Einträge enthalten.
+# -----------------------------------------------------------------------------
+
+
+def parse_timestamp(value):
+    """ISO-Zeitstempel (z.B. "2024-05-01T18:03:12.345Z") → Unix-Zeit in ms, None wenn unlesbar.
+
+    Zeitangaben ohne Zeitzone gelten wie bei Twitch als UTC.
+    """
+    if not isinstance(value, datetime):
+        if not value:
+            return None
+        try:
+            text = str(value)
+            if text.endswith("Z"):
+                text = text[:-1] + "+00:00"
+            value = datetime.fromisoformat(text)
+        except (TypeError, ValueError):
+            return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp() * 1000)
+
+
+class ChatStore:
+    __slots__ = ("users", "texts", "times", "_count")
+
+    def __init__(self):
+        self.users = []
+        self.texts = []
+        self.times = array("q")
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def extend(self, messages):
+        """Hängt Nachrichten im tapi_mod-Format an ({"user", "message", "timestamp"})."""
+        intern = sys.intern
+        last = self.times[-1] if self.times else None
+        users, texts, times = [], [], []
+        for msg in messages:
+            ts = parse_timestamp(msg.get("timestamp"))
+            if ts is not None:
+                last = ts
+            elif last is None:
+                # Noch kein Vorgänger: Ladezeitpunkt statt 1970
+                last = int(time.time() * 1000)
+            # sonst: Vorgänger übernehmen, damit die Reihenfolge erhalten bleibt
+            users.append(intern(msg.get("user") or "Unknown"))
+            texts.append(msg.get("message") or "")
+            times.append(last)
+        self.users.extend(users)
+        self.texts.extend(texts)
+        self.times.extend(times)
+        self._count += len(users)
+        return len(users)
+
+    def append(self, user, text, timestamp=None):
+        return self.extend([{"user": user, "message": text, "timestamp": timestamp}])
+
+    # ---------- Lesen ----------
+    def row(self, index):
+        """(nachricht_id, username, text, datetime) für Position index; datetime ist UTC (tz-aware)."""
+        return (index + 1, self.users[index], self.texts[index],
+                datetime.fromtimestamp(self.times[index] / 1000, tz=timezone.utc))
+
+    def rows(self, start, stop):
+        """Zeilen im Bereich [start, stop) in Ladereihenfolge."""
+        count = self._count
+        start = max(0, start)
+        stop = min(count, stop)
+        return [self.row(i) for i in range(start, stop)]
+
+    def latest(self, n):
+        """Die n neuesten Nachrichten, neueste zuerst (Slice, kein Sortieren)."""
+        count = self._count
+        return [self.row(i) for i in range(count - 1, max(0, count - n) - 1, -1)]
@@ -0,0 +1,218 @@
+import tkinter as tk
+import customtkinter as ctk
+
+# -----------------------------------------------------------------------------
+# Virtualisierte Chat-Ansicht (ein tk.Text statt Widgets pro Nachricht)
+# -----------------------------------------------------------------------------
+# Zeigt einen ChatStore (siehe chat_store.py) in EINEM tk.Text an. Jede
+# Nachricht ist genau eine logische Zeile ("HH:MM:SS  user: text"), gestylt
+# über Tags. Im Text steht immer nur ein Fenster von höchstens 2 * window
+# Nachrichten; die eigene Scrollbar bildet dagegen den ganzen Store ab.
+# Scrollt der Benutzer an den Rand des Fensters, wird es um die sichtbare
+# Nachricht herum neu aufgebaut.
+#
+#     view = ChatView(parent, store)
+#     view.pack(fill="both", expand=True)
+#     ...                      # Lade-Thread hängt an den Store an
+#     view.refresh()           # im Tk-Thread: nur neue Zeilen anhängen
+#
+# Steht die Ansicht am Ende (Follow-Modus), werden neue Nachrichten unten
+# angehängt und oben abgeschnitten, ohne vorhandene Zeilen neu zu layouten.
+# -----------------------------------------------------------------------------
+
+DEFAULT_WINDOW = 150   # Nachrichten, um die herum das Fenster aufgebaut wird
+
+_COLORS = {
+    # (hell, dunkel)
+    "bg": ("gray95", "#2a2a2a"),
+    "fg": ("#1c1c1c", "#f0f0f0"),
+    "time": ("gray40", "gray60"),
+    "user": ("#1f538d", "#CA6931"),
+}
+
+
+class ChatView(ctk.CTkFrame):
+    def __init__(self, master, store, window=DEFAULT_WINDOW, empty_text="", **kwargs):
+        kwargs.setdefault("fg_color", "transparent")
+        super().__init__(master, **kwargs)
+        self.window = max(10, int(window))
+        self._store = store
+        self._offset = 0          # Store-Index der ersten Zeile im Text
+        self._end = 0             # Store-Index hinter der letzten Zeile im Text
+        self._follow = True       # Ansicht klebt am Ende
+        self._pending_shift = None
+        self._empty_text = empty_text
+
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(0, weight=1)
+
+        self._text = tk.Text(self, wrap="word", borderwidth=0, highlightthickness=0,
+                             padx=10, pady=6, spacing1=3, spacing3=3, cursor="arrow",
+                             font=("Arial", 16), yscrollcommand=self._on_text_scroll)
+        self._text.grid(row=0, column=0, sticky="nsew")
+        self._scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar)
+        self._scrollbar.grid(row=0, column=1, sticky="ns")
+
+        self._text.tag_configure("time", font=("Arial", 13))
+        self._text.tag_configure("user", font=("Arial", 16, "bold"))
+        self._text.tag_configure("empty", font=("Arial", 19), justify="center")
+        # Nur lesen: "disabled" sperrt Tippen, Einfügen und Löschen; Markieren/Kopieren bleibt
+        # möglich. Nur die Schreibmethoden schalten kurz auf "normal".
+        self._text.configure(state="disabled")
+        self._apply_colors()
+
+        self._render(self._tail_offset())
+
+    # ---------- Daten ----------
+    @property
+    def store(self):
+        return self._store
+
+    def set_store(self, store):
+        """Zeigt einen anderen Store an; beim selben Store werden nur neue Zeilen angehängt."""
+        if store is self._store:
+            self.refresh()
+            return
+        self._store = store
+        self._follow = True
+        self._render(self._tail_offset())
+
+    def refresh(self):
+        """Übernimmt inzwischen angehängte Nachrichten."""
+        count = len(self._store)
+        if count <= self._end:
+            return
+        if self._end == 0 or (self._follow and count - self._end > 2 * self.window):
+            # Erste Nachrichten oder sehr viele neue: Ende direkt neu aufbauen
+            self._render(self._tail_offset())
+            return
+        if self._follow:
+            self._insert_rows(self._end, count)
+            self._trim_top()
+            self._text.see("end")
+        elif self._end - self._offset < 2 * self.window:
+            # Fenster reicht bis ans Ende und ist noch nicht voll: nur unten anfügen
+            self._insert_rows(self._end, min(count, self._offset + 2 * self.window))
+        self._update_scrollbar()
+
+    def scroll_to_end(self):
+        self._follow = True
+        self._render(self._tail_offset())
+
+    # ---------- Rendern ----------
+    def _tail_offset(self):
+        return max(0, len(self._store) - self.window)
+
+    def _write(self, start, stop):
+        text = self._text
+        text.configure(state="normal")
+        try:
+            for msg_id, user, message, ts in self._store.rows(start, stop):
+                # Store liefert UTC, angezeigt wird lokale Zeit
+                text.insert("end", ts.astimezone().strftime("%H:%M:%S") + "  ", "time")
+                text.insert("end", user, "user")
+                text.insert("end", ": " + message + "\n")
+        finally:
+            text.configure(state="disabled")
+
+    def _render(self, offset, anchor=None):
+        """Baut das Fenster ab offset neu auf; anchor = Store-Index, der oben stehen soll."""
+        count = len(self._store)
+        self._offset = max(0, min(offset, count))
+        self._end = min(count, self._offset + 2 * self.window)
+        text = self._text
+        text.configure(state="normal")
+        try:
+            text.delete("1.0", "end")
+            if count == 0:
+                if self._empty_text:
+                    text.insert("end", "\n" + self._empty_text, "empty")
+            else:
+                self._write(self._offset, self._end)
+        finally:
+            text.configure(state="disabled")
+        if anchor is not None and count:
+            text.yview(f"{anchor - self._offset + 1}.0")
+        elif self._follow:
+            text.see("end")
+        self._update_scrollbar()
+
+    def _insert_rows(self, start, stop):
+        if stop <= start:
+            return
+        self._write(start, stop)
+        self._end = stop
+
+    def _trim_top(self):
+        excess = (self._end - self._offset) - 2 * self.window
+        if excess > 0:
+            self._text.configure(state="normal")
+            try:
+                self._text.delete("1.0", f"{excess + 1}.0")
+            finally:
+                self._text.configure(state="disabled")
+            self._offset += excess
+
+    # ---------- Scrollen ----------
+    def _first_visible(self):
+        line = int(self._text.index("@0,0").split(".")[0])
+        return self._offset + line - 1
+
+    def _last_visible(self):
+        line = int(self._text.index(f"@0,{self._text.winfo_height()}").split(".")[0])
+        return min(self._end, self._offset + line)
+
+    def _update_scrollbar(self):
+        count = len(self._store)
+        if count == 0:
+            self._scrollbar.set(0, 1)
+            return
+        first = self._first_visible()
+        last = self._last_visible()
+        self._scrollbar.set(first / count, max(first + 1, last) / count)
+
+    def _on_text_scroll(self, first, last):
+        first, last = float(first), float(last)
+        count = len(self._store)
+        self._follow = last >= 1.0 and self._end >= count
+        # Am Fensterrand: Fenster nachladen (nicht während Tk gerade scrollt)
+        if (first <= 0.0 and self._offset > 0) or (last >= 1.0 and self._end < count):
+            if self._pending_shift is None:
+                self._pending_shift = self.after_idle(self._shift_window)
+        self._update_scrollbar()
+
+    def _shift_window(self):
+        self._pending_shift = None
+        anchor = self._first_visible()
+        count = len(self._store)
+        offset = max(0, min(anchor - self.window // 2, count - 2 * self.window))
+        if offset != self._offset:
+            self._render(offset, anchor=anchor)
+
+    def _on_scrollbar(self, *args):
+        if not args:
+            return
+        if args[0] == "moveto":
+            count = len(self._store)
+            target = max(0, min(count - 1, int(float(args[1]) * count)))
+            self._follow = False
+            if self._offset <= target < self._end:
+                self._text.yview(f"{target - self._offset + 1}.0")
+            else:
+                self._render(target - self.window // 2, anchor=target)
+        elif args[0] == "scroll":
+            self._text.yview_scroll(int(float(args[1])), args[2] if len(args) > 2 else "units")
+
+    # ---------- Appearance ----------
+    def _apply_colors(self):
+        dark = 1 if ctk.get_appearance_mode() == "Dark" else 0
+        bg = _COLORS["bg"][dark]
+        self._text.configure(bg=bg, fg=_COLORS["fg"][dark], selectbackground=_COLORS["time"][dark],
+                             insertbackground=bg)
+        self._text.tag_configure("time", foreground=_COLORS["time"][dark])
+        self._text.tag_configure("user", foreground=_COLORS["user"][dark])
+        self._text.tag_configure("empty", foreground=_COLORS["time"][dark])
+
+    def _set_appearance_mode(self, mode_string):
+        super()._set_appearance_mode(mode_string)
+        self._apply_colors()
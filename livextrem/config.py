@@ -28,11 +28,40 @@ class Config:
     DB_USER = _cfg("LIVEXTREM_DB_USER", "")
     DB_PASS = _cfg("LIVEXTREM_DB_PASS", "")
 
+    # DB-Connection-Pool (siehe db_pool.py)
+    DB_POOL_SIZE = int(_cfg("LIVEXTREM_DB_POOL_SIZE", "5"))
+    DB_POOL_TIMEOUT = float(_cfg("LIVEXTREM_DB_POOL_TIMEOUT", "10"))
+    DB_POOL_MAX_LIFETIME = int(_cfg("LIVEXTREM_DB_POOL_MAX_LIFETIME", "1800"))
+    DB_POOL_PING_AFTER = int(_cfg("LIVEXTREM_DB_POOL_PING_AFTER", "30"))
+
+    # Hintergrund-Worker (siehe background.py) – kleiner als der DB-Pool halten
+    BG_WORKERS = int(_cfg("LIVEXTREM_BG_WORKERS", "4"))
+
     # Twitch OAuth
     TWITCH_CLIENT_ID = _cfg("LIVEXTREM_TWITCH_CLIENT_ID", "")
     TWITCH_CLIENT_SECRET = _cfg("LIVEXTREM_TWITCH_CLIENT_SECRET", "")
     TWITCH_REDIRECT_URI = _cfg("LIVEXTREM_TWITCH_REDIRECT_URI", "http://localhost:8080")
 
+    # Default-Timeout (Sekunden) für alle Twitch-Requests (siehe fremdsys/helix.py)
+    TWITCH_HTTP_TIMEOUT = float(_cfg("LIVEXTREM_TWITCH_HTTP_TIMEOUT", "15"))
+    # Wiederholungen bei 429 / 5xx (mit gejittertem Backoff)
+    TWITCH_MAX_RETRIES = int(_cfg("LIVEXTREM_TWITCH_MAX_RETRIES", "3"))
+    # Parallele Chat-Verfügbarkeitsprüfungen pro VOD-Liste (tapi_mod.get_vod_chat)
+    TWITCH_PROBE_WORKERS = int(_cfg("LIVEXTREM_TWITCH_PROBE_WORKERS", "4"))
+    # Deadline (Sekunden) pro Helix-Request für die Overview-Statistiken
+    TWITCH_STATS_TIMEOUT = float(_cfg("LIVEXTREM_TWITCH_STATS_TIMEOUT", "8"))
+
+    # Lokaler Cache (siehe local_cache.py) – liegt bewusst außerhalb des Repos
+    CACHE_DIR = Path(_cfg("LIVEXTREM_CACHE_DIR", str(Path.home() / ".livextrem" / "cache")))
+    # Overview-Statistiken: bis TTL gelten sie als frisch, bis MAX_AGE als "veraltet, aber anzeigbar"
+    OVERVIEW_STATS_TTL = int(_cfg("LIVEXTREM_OVERVIEW_STATS_TTL", "900"))
+    OVERVIEW_STATS_MAX_AGE = int(_cfg("LIVEXTREM_OVERVIEW_STATS_MAX_AGE", "604800"))
+    # Delta-Sync: Tombstones älter als das werden gelöscht; Clients mit älterem
+    # Wasserstand laden vollständig neu (siehe migrations.prune_tombstones)
+    SYNC_TOMBSTONE_RETENTION = int(_cfg("LIVEXTREM_SYNC_TOMBSTONE_RETENTION", "604800"))
+    # VOD-Chat-Cache (siehe chat_cache.py): so viele VODs bleiben auf der Platte
+    CHAT_CACHE_MAX_VODS = int(_cfg("LIVEXTREM_CHAT_CACHE_MAX_VODS", "20"))
+
     @classmethod
     def validate(cls):
         missing = []
@@ -1,54 +1,47 @@
 import mariadb
-from config import Config
+import db_pool
 import sys
 
 class DatabaseManager:
-    def __init__(self):
-        self.conn = None
-        self.cur = None
+    """Dünne Query-Schicht; die eigentlichen Verbindungen kommen aus db_pool."""
 
     def connection(self):
-        """Stellt eine Verbindung zur Datenbank her"""
+        """Prüft, ob eine Verbindung zur Datenbank hergestellt werden kann"""
         try:
-            Config.validate()
-            self.conn = mariadb.connect(
-                user=Config.DB_USER,
-                password=Config.DB_PASS,
-                host=Config.DB_HOST,
-                port=Config.DB_PORT,
-                database=Config.DB_NAME
-            )
-            self.cur = self.conn.cursor()
+            with db_pool.connection() as conn:
+                conn.ping()
             print("Erfolgreich mit der Datenbank verbunden!")
             return True
-        except mariadb.Error as e:
+        except (mariadb.Error, db_pool.PoolTimeoutError) as e:
             print(f"Fehler bei der Verbindung: {e}")
             sys.exit(1)
 
     def execute_query(self, query, params=None):
         """Führt eine SQL-Abfrage aus und gibt die Ergebnisse zurück"""
         try:
-            if params:
-                self.cur.execute(query, params)
-            else:
-                self.cur.execute(query)
-            
-            # Für SELECT-Abfragen und SHOW-Befehle Ergebnisse zurückgeben
-            if (query.strip().upper().startswith('SELECT') or 
-                query.strip().upper().startswith('SHOW') or
-                query.strip().upper().startswith('DESCRIBE')):
-                result = self.cur.fetchall()
-                # Spaltennamen abrufen
-                if self.cur.description:
-                    columns = [desc[0] for desc in self.cur.description]
-                    return {"columns": columns, "data": result}
-                return {"columns": [], "data": result}
-            # Für INSERT, UPDATE, DELETE - Änderungen speichern
-            else:
-                self.conn.commit()
-                return {"affected_rows": self.cur.rowcount}
-                
-        except mariadb.Error as e:
+            with db_pool.connection() as conn:
+                cur = conn.cursor()
+                if params:
+                    cur.execute(query, params)
+                else:
+                    cur.execute(query)
+
+                # Für SELECT-Abfragen und SHOW-Befehle Ergebnisse zurückgeben
+                if (query.strip().upper().startswith('SELECT') or
+                    query.strip().upper().startswith('SHOW') or
+                    query.strip().upper().startswith('DESCRIBE')):
+                    result = cur.fetchall()
+                    # Spaltennamen abrufen
+                    if cur.description:
+                        columns = [desc[0] for desc in cur.description]
+                        return {"columns": columns, "data": result}
+                    return {"columns": [], "data": result}
+                # Für INSERT, UPDATE, DELETE - Änderungen speichern
+                else:
+                    conn.commit()
+                    return {"affected_rows": cur.rowcount}
+
+        except (mariadb.Error, db_pool.PoolTimeoutError) as e:
             print(f"Fehler bei der Abfrage: {e}")
             return None
 
@@ -75,7 +68,5 @@ class DatabaseManager:
         return self.execute_query(f"DESCRIBE {table_name}")
 
     def connClose(self):
-        """Schließt die Datenbankverbindung"""
-        if self.conn:
-            self.conn.close()
+        """Gibt die Datenbankverbindungen frei (der Pool schließt sie beim Beenden)"""
         print("Datenbankverbindung geschlossen")
\ No newline at end of file
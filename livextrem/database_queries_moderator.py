@@ -3,6 +3,8 @@ Moderator Queries - Integration mit Twitch API
 Chat-Nachrichten von VODs und echte Moderationsaktionen
 """
 
+import chat_cache
+from chat_store import ChatStore
 from database_connection import DatabaseManager
 from datetime import datetime, timedelta
 
@@ -16,25 +18,38 @@ class ModeratorQueries:
         self.moderation_actions = []
         self.action_id_counter = 1
         
-        # Chat-Nachrichten (werden aus VODs geladen)
-        self.chat_messages = []
+        # Chat-Nachrichten (werden aus VODs geladen, siehe chat_store.py)
+        self.chat_store = ChatStore()
         self.vod_info = None
         self.chat_load_error = None
+        self.chat_loading = False
+        self.chat_loaded_count = 0
     
     # ========== CHAT-NACHRICHTEN AUS VOD ==========
     
-    def load_vod_chat(self):
-        """Lädt Chat-Nachrichten vom letzten VOD via Twitch API"""
+    def load_vod_chat(self, on_progress=None):
+        """Lädt Chat-Nachrichten vom letzten VOD via Twitch API – seitenweise.
+
+        Blockiert (im Hintergrund-Thread aufrufen). Die v5-API blättert nur
+        vorwärts ab VOD-Anfang, deshalb wird zuerst eine Seite vom VOD-Ende
+        als Vorschau geholt: get_chat_store() zeigt sofort die neuesten
+        Nachrichten, der vollständige Chat ersetzt sie nach dem Download.
+        Ohne Vorschau sind die bisher geladenen Nachrichten nach jeder Seite
+        sichtbar. on_progress(anzahl) meldet die heruntergeladenen Nachrichten
+        (ebenfalls im Lade-Thread).
+        """
         if not self.token:
             self.chat_load_error = "Kein Twitch-Token vorhanden"
             return False
         
+        self.chat_loading = True
+        self.chat_loaded_count = 0
         try:
             # Importiere tapi_mod dynamisch
             from fremdsys import tapi_mod
             
-            # Chat vom VOD laden
-            all_messages, vod_with_chat, error_code = tapi_mod.get_vod_chat(self.token)
+            # Neuestes VOD mit Chat suchen
+            vod_with_chat, _status_list, error_code = tapi_mod.find_vod_with_chat(self.token)
             
             if error_code == 404:
                 self.chat_load_error = "Leider ist Chat-Replay für diesen Twitch Account nicht verfügbar"
@@ -44,38 +59,84 @@ class ModeratorQueries:
                 self.chat_load_error = f"Fehler beim Laden des Chats (Code: {error_code})"
                 return False
             
-            # Nachrichten konvertieren
-            self.chat_messages = []
-            msg_id = 1
-            for msg in all_messages:
-                self.chat_messages.append({
-                    "nachricht_id": msg_id,
-                    "username": msg["user"],
-                    "nachricht": msg["message"],
-                    "timestamp": msg["timestamp"]
-                })
-                msg_id += 1
-            
             self.vod_info = vod_with_chat
             self.chat_load_error = None
+            
+            vod_id = vod_with_chat["id"]
+            cache = chat_cache.get_cache()
+            cached = cache.load(vod_id)
+            
+            # Alten Store erst ersetzen, wenn neue Nachrichten da sind
+            store = ChatStore()
+            store.extend(cached.messages)
+            self.chat_loaded_count = len(store)
+            
+            def show():
+                self.chat_store = store
+                if on_progress:
+                    on_progress(len(store))
+            
+            if cached.completed:
+                show()
+                return True
+            
+            # Vorschau vom VOD-Ende, damit die neuesten Nachrichten nicht erst mit der letzten Seite kommen
+            try:
+                tail = tapi_mod.fetch_vod_chat_tail(self.token, vod_with_chat)
+            except RuntimeError as e:
+                print("❌", e)
+                tail = []
+            preview = None
+            if tail:
+                preview = ChatStore()
+                preview.extend(tail)
+                self.chat_store = preview
+                if on_progress:
+                    on_progress(len(store))
+            elif len(store):
+                show()
+            
+            # Nur die fehlenden Seiten laden (die nächste lädt jeweils schon parallel)
+            try:
+                for page, next_cursor in tapi_mod.iter_vod_chat_pages(self.token, vod_id, cached.cursor):
+                    cache.append_page(vod_id, page, next_cursor)
+                    store.extend(page)
+                    self.chat_loaded_count = len(store)
+                    if preview is None:
+                        show()
+                    elif on_progress:
+                        on_progress(len(store))
+            except RuntimeError as e:
+                # Abbruch mitten im Download: Bisheriges behalten, nächster Aufruf setzt fort
+                print("❌", e)
+                if preview is not None:
+                    return True  # Vorschau bleibt stehen, sie zeigt das VOD-Ende
+                if not len(store):
+                    self.chat_load_error = str(e)
+                    return False
+            
+            show()
             return True
             
         except Exception as e:
             self.chat_load_error = f"Fehler beim Laden: {str(e)}"
             return False
+        finally:
+            self.chat_loading = False
     
-    def get_all_messages(self, limit=100):
-        """Gibt Chat-Nachrichten zurück"""
-        messages = sorted(self.chat_messages, key=lambda x: x["timestamp"], reverse=True)[:limit]
-        
-        data = []
-        for msg in messages:
-            data.append((
-                msg["nachricht_id"], msg["username"], 
-                msg["nachricht"], msg["timestamp"]
-            ))
-        
-        return {"columns": [], "data": data}
+    def is_chat_loading(self):
+        return self.chat_loading
+    
+    def get_message_count(self):
+        return len(self.chat_store)
+    
+    def get_loaded_count(self):
+        """Bisher heruntergeladene Nachrichten (kann von get_message_count() abweichen, solange die Vorschau steht)."""
+        return self.chat_loaded_count
+    
+    def get_chat_store(self):
+        """Der aktuelle ChatStore (wächst während des Ladens weiter)."""
+        return self.chat_store
     
     def get_vod_info(self):
         """Gibt VOD-Informationen zurück"""
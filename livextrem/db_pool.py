@@ -0,0 +1,203 @@
+import atexit
+import threading
+import time
+from contextlib import contextmanager
+
+import mariadb
+from config import Config
+
+# -----------------------------------------------------------------------------
+# Prozessweiter Connection-Pool
+# -----------------------------------------------------------------------------
+# Alle Module (Login, Dashboards, DatabaseManager) leihen sich ihre Verbindung
+# hier aus, statt pro Aufruf einen neuen TCP+Auth-Handshake zu machen:
+#
+#     with db_pool.connection() as db:
+#         cur = db.cursor()
+#         ...
+#         db.commit()
+#
+# Innerhalb eines Threads ist connection() reentrant: verschachtelte Aufrufe
+# bekommen dieselbe Verbindung (und damit dieselbe Transaktion).
+# -----------------------------------------------------------------------------
+
+
+class PoolTimeoutError(RuntimeError):
+    """Innerhalb des Checkout-Timeouts wurde keine Verbindung frei."""
+
+
+class _PoolEntry:
+    __slots__ = ("conn", "created_at", "last_used")
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+
+
+class ConnectionPool:
+    def __init__(self, size=None, timeout=None, max_lifetime=None, ping_after=None):
+        self.size = max(1, int(size if size is not None else Config.DB_POOL_SIZE))
+        self.timeout = float(timeout if timeout is not None else Config.DB_POOL_TIMEOUT)
+        self.max_lifetime = float(max_lifetime if max_lifetime is not None else Config.DB_POOL_MAX_LIFETIME)
+        self.ping_after = float(ping_after if ping_after is not None else Config.DB_POOL_PING_AFTER)
+
+        self._idle = []      # LIFO: zuletzt benutzte Verbindung zuerst (ist am ehesten noch "warm")
+        self._total = 0      # offene + gerade verliehene Verbindungen
+        self._closed = False
+        self._cond = threading.Condition()
+        self._local = threading.local()
+
+    # ---------- Verbindungen anlegen / prüfen ----------
+    def _connect(self):
+        Config.validate()
+        conn = mariadb.connect(
+            host=Config.DB_HOST,
+            port=Config.DB_PORT,
+            user=Config.DB_USER,
+            password=Config.DB_PASS,
+            database=Config.DB_NAME
+        )
+        return _PoolEntry(conn)
+
+    def _is_healthy(self, entry):
+        now = time.monotonic()
+        if self.max_lifetime > 0 and now - entry.created_at > self.max_lifetime:
+            return False
+        if now - entry.last_used > self.ping_after:
+            try:
+                entry.conn.ping()
+            except Exception:
+                return False
+        return True
+
+    @staticmethod
+    def _close_quietly(entry):
+        try:
+            entry.conn.close()
+        except Exception:
+            pass
+
+    # ---------- Checkout / Rückgabe ----------
+    def _acquire(self, timeout):
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Der Connection-Pool wurde bereits geschlossen.")
+                if self._idle:
+                    entry = self._idle.pop()
+                    break
+                if self._total < self.size:
+                    # Slot reservieren, die Verbindung wird außerhalb des Locks aufgebaut
+                    self._total += 1
+                    entry = None
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise PoolTimeoutError(
+                        f"Keine freie DB-Verbindung nach {timeout:.1f}s (Poolgröße {self.size})."
+                    )
+                self._cond.wait(remaining)
+
+        if entry is not None:
+            if self._is_healthy(entry):
+                return entry
+            # Kaputte/zu alte Verbindung ersetzen, Slot bleibt reserviert
+            self._close_quietly(entry)
+
+        try:
+            return self._connect()
+        except Exception:
+            with self._cond:
+                self._total -= 1
+                self._cond.notify()
+            raise
+
+    def _release(self, entry, broken=False):
+        if not broken:
+            # Offene Transaktion/Lese-Snapshot beenden, damit der nächste
+            # Ausleiher keinen veralteten Stand sieht.
+            try:
+                entry.conn.rollback()
+            except Exception:
+                broken = True
+
+        with self._cond:
+            if broken or self._closed:
+                self._total -= 1
+            else:
+                entry.last_used = time.monotonic()
+                self._idle.append(entry)
+                entry = None
+            self._cond.notify()
+
+        if entry is not None:
+            self._close_quietly(entry)
+
+    @contextmanager
+    def connection(self, timeout=None):
+        """Leiht eine Verbindung aus dem Pool (Context-Manager)."""
+        local = self._local
+        entry = getattr(local, "entry", None)
+        if entry is not None:
+            local.depth += 1
+            try:
+                yield entry.conn
+            finally:
+                local.depth -= 1
+            return
+
+        entry = self._acquire(self.timeout if timeout is None else float(timeout))
+        local.entry = entry
+        local.depth = 1
+        broken = False
+        try:
+            yield entry.conn
+        except (mariadb.InterfaceError, mariadb.OperationalError):
+            broken = True
+            raise
+        finally:
+            local.entry = None
+            local.depth = 0
+            self._release(entry, broken=broken)
+
+    def stats(self):
+        with self._cond:
+            return {"size": self.size, "open": self._total, "idle": len(self._idle)}
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._total -= len(idle)
+            self._cond.notify_all()
+        for entry in idle:
+            self._close_quietly(entry)
+
+
+# ---------- Modulweiter Zugriff ----------
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ConnectionPool()
+        return _pool
+
+
+def connection(timeout=None):
+    """Kurzform für get_pool().connection()."""
+    return get_pool().connection(timeout=timeout)
+
+
+@atexit.register
+def close_pool():
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.close()
@@ -0,0 +1,301 @@
+import random
+import threading
+import time
+import weakref
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from config import Config
+from .helix_paging import iter_pages
+from .ratelimit import RateLimiter, PRIORITY_HIGH, PRIORITY_NORMAL, PRIORITY_LOW
+
+# -----------------------------------------------------------------------------
+# Gemeinsamer HTTP-Zugang zu Twitch (Helix, OAuth, v5)
+# -----------------------------------------------------------------------------
+# Alle fremdsys-Funktionen gehen über EINE requests.Session mit Keep-Alive-
+# Pool, statt pro Aufruf einen neuen TCP+TLS-Handshake zu machen. Jeder
+# Request bekommt einen Default-Timeout.
+#
+#     client = helix.client_for(token)
+#     data = client.get_json("channels/followers", params={"broadcaster_id": token.userid})
+#     for video in client.paginate("videos", {"user_id": token.userid}, max_items=10):
+#         ...
+#
+# Für Aufrufe ohne User-Token (OAuth-Endpunkte, v5) gibt es helix.request().
+#
+# Jeder HelixClient hat einen eigenen Token-Bucket (siehe ratelimit.py);
+# 429 und 5xx werden mit gejittertem Backoff wiederholt.
+#
+# Token-Refresh: Bei 401 wird der Token genau einmal erneuert, auch wenn
+# mehrere Worker gleichzeitig scheitern (Single-Flight); alle wiederholen
+# danach ihren Request. Zusätzlich erneuert ein Timer den Token kurz vor
+# token.expires_at.
+#
+# App-Access-Tokens (client_credentials, z.B. für die v5-Chat-API) werden pro
+# Client-ID gecacht und erst kurz vor Ablauf neu geholt: helix.app_token(...).
+# -----------------------------------------------------------------------------
+
+HELIX_BASE = "https://api.twitch.tv/helix/"
+
+RETRY_BASE_DELAY = 0.5     # Sekunden, verdoppelt sich pro Versuch
+RETRY_MAX_DELAY = 8.0
+
+REFRESH_MARGIN = 300       # Sekunden vor Ablauf proaktiv erneuern
+REFRESH_RETRY_DELAY = 60   # nach fehlgeschlagenem proaktivem Refresh
+APP_TOKEN_MARGIN = 300     # App-Token so lange vor Ablauf schon neu holen
+APP_TOKEN_MIN_AGE = 60     # jüngere App-Tokens werden nach 401 nicht ersetzt
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def session():
+    """Prozessweite Session (thread-sicher für parallele Requests über den Pool)."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            s = requests.Session()
+            # Ein Pool pro Host; so viele Verbindungen wie parallele Worker + Reserve
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max(4, Config.BG_WORKERS * 2))
+            s.mount("https://", adapter)
+            s.mount("http://", adapter)
+            _session = s
+        return _session
+
+
+def _timeout(timeout):
+    return Config.TWITCH_HTTP_TIMEOUT if timeout is None else timeout
+
+
+def request(method, url, timeout=None, **kwargs):
+    """Roher Request über die gemeinsame Session (liefert requests.Response)."""
+    return session().request(method, url, timeout=_timeout(timeout), **kwargs)
+
+
+class HelixClient:
+    """Helix-Zugriff für genau einen OAuth-Token (Client-ID + Bearer werden automatisch gesetzt)."""
+
+    def __init__(self, token):
+        self.token = token
+        self.limiter = RateLimiter()
+        self._auth_for = None
+        self._auth_headers = None
+        self._refresh_lock = threading.Lock()
+        self._refresh_timer = None
+        self._schedule_refresh()
+
+    def _headers(self, extra=None):
+        # Header nur neu bauen, wenn sich der Access-Token geändert hat (z.B. nach Refresh)
+        key = (self.token.clientid, self.token.atoken)
+        if key != self._auth_for:
+            self._auth_headers = {
+                "Client-ID": self.token.clientid,
+                "Authorization": f"Bearer {self.token.atoken}",
+            }
+            self._auth_for = key
+        if extra:
+            return {**self._auth_headers, **extra}
+        return self._auth_headers
+
+    @staticmethod
+    def _url(path):
+        if path.startswith("https://") or path.startswith("http://"):
+            return path
+        return HELIX_BASE + path.lstrip("/")
+
+    def request(self, method, path, params=None, json=None, headers=None, timeout=None,
+                priority=PRIORITY_NORMAL):
+        """Request mit Rate-Limit-Budget, Token-Refresh bei 401 und Wiederholung bei 429/5xx.
+
+        429 wird für alle Methoden wiederholt (Twitch hat den Request nicht
+        verarbeitet). Verbindungsfehler und 5xx nur bei GET: ein POST/DELETE
+        (z.B. Bann) kann trotz 5xx bereits ausgeführt worden sein.
+        Nach ausgeschöpften Versuchen wird die letzte Antwort zurückgegeben
+        (Aufrufer prüfen status_code wie bisher).
+        """
+        url = self._url(path)
+        retries = max(0, Config.TWITCH_MAX_RETRIES)
+        refreshed = False
+        attempt = 0
+        while True:
+            self.limiter.acquire(priority, timeout=_timeout(timeout))
+            used_token = self.token.atoken
+            try:
+                resp = request(method, url, params=params, json=json,
+                               headers=self._headers(headers), timeout=timeout)
+            except (requests.ConnectionError, requests.Timeout):
+                # Nur lesende Requests blind wiederholen
+                if method != "GET" or attempt >= retries:
+                    raise
+                time.sleep(_backoff(attempt))
+                attempt += 1
+                continue
+
+            self.limiter.update_from_headers(resp.headers)
+            if resp.status_code == 401 and not refreshed:
+                # Einmal pro Aufruf erneuern und transparent wiederholen
+                refreshed = True
+                if self.refresh_token(stale_atoken=used_token):
+                    continue
+                return resp
+            if attempt < retries:
+                if resp.status_code == 429:
+                    reset = resp.headers.get("Ratelimit-Reset")
+                    self.limiter.exhaust(reset)
+                    time.sleep(_retry_after(reset, attempt))
+                    attempt += 1
+                    continue
+                if 500 <= resp.status_code < 600 and method == "GET":
+                    time.sleep(_backoff(attempt))
+                    attempt += 1
+                    continue
+            return resp
+
+    # ---------- Token-Refresh ----------
+    def refresh_token(self, stale_atoken=None):
+        """Erneuert den Access-Token (Single-Flight). Gibt True zurück, wenn ein gültiger Token vorliegt.
+
+        stale_atoken: der Token, mit dem der Aufrufer gescheitert ist. Wurde er
+        inzwischen von einem anderen Thread ersetzt, wird nicht erneut erneuert.
+        """
+        with self._refresh_lock:
+            if stale_atoken is not None and self.token.atoken != stale_atoken:
+                return True
+            if not getattr(self.token, "rtoken", None):
+                return False
+            from . import oauth  # spät importieren: oauth nutzt selbst helix
+            try:
+                oauth.refresh(self.token)
+            except Exception as e:
+                print("Twitch Token-Refresh Fehler:", repr(e))
+                return False
+            print("Twitch-Token erneuert.")
+            self._schedule_refresh()
+            return True
+
+    def _schedule_refresh(self, delay=None):
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+            self._refresh_timer = None
+        if delay is None:
+            expires_at = getattr(self.token, "expires_at", None)
+            if not expires_at or not getattr(self.token, "rtoken", None):
+                return
+            delay = max(1.0, expires_at - time.time() - REFRESH_MARGIN)
+        # Timer hält den Client nur schwach, damit er mit dem Token freigegeben werden kann
+        ref = weakref.ref(self)
+        timer = threading.Timer(delay, _proactive_refresh, args=(ref,))
+        timer.daemon = True
+        self._refresh_timer = timer
+        timer.start()
+
+    def get(self, path, params=None, timeout=None, priority=PRIORITY_NORMAL):
+        return self.request("GET", path, params=params, timeout=timeout, priority=priority)
+
+    def post(self, path, params=None, json=None, timeout=None, priority=PRIORITY_NORMAL):
+        return self.request("POST", path, params=params, json=json, timeout=timeout, priority=priority)
+
+    def put(self, path, params=None, json=None, timeout=None, priority=PRIORITY_NORMAL):
+        return self.request("PUT", path, params=params, json=json, timeout=timeout, priority=priority)
+
+    def delete(self, path, params=None, timeout=None, priority=PRIORITY_NORMAL):
+        return self.request("DELETE", path, params=params, timeout=timeout, priority=priority)
+
+    def get_json(self, path, params=None, timeout=None, priority=PRIORITY_NORMAL):
+        return self.get(path, params=params, timeout=timeout, priority=priority).json()
+
+    def paginate(self, path, params=None, page_size=100, max_items=None, stop=None, timeout=None,
+                 priority=PRIORITY_NORMAL):
+        """Lazy Pagination (siehe helix_paging.iter_pages)."""
+        return iter_pages(lambda query: self.get_json(path, params=query, timeout=timeout, priority=priority),
+                          params, page_size=page_size, max_items=max_items, stop=stop)
+
+
+def _proactive_refresh(client_ref):
+    client = client_ref()
+    if client is None:
+        return
+    if not client.refresh_token(stale_atoken=client.token.atoken):
+        client._schedule_refresh(delay=REFRESH_RETRY_DELAY)
+
+
+def _backoff(attempt):
+    """Exponentielles Backoff mit Jitter (verhindert, dass alle Worker gleichzeitig wiederholen)."""
+    delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * (2 ** attempt))
+    return random.uniform(delay / 2, delay)
+
+
+def _retry_after(reset_epoch, attempt):
+    """Wartezeit nach 429: bis Ratelimit-Reset (plus Jitter), sonst Backoff."""
+    try:
+        wait = float(reset_epoch) - time.time()
+    except (TypeError, ValueError):
+        return _backoff(attempt)
+    return min(RETRY_MAX_DELAY * 8, max(0.0, wait)) + random.uniform(0, RETRY_BASE_DELAY)
+
+
+# Ein Client pro Token-Objekt – damit teilen sich alle Aufrufe eines Tokens einen Rate-Limit-Bucket
+_clients = weakref.WeakKeyDictionary()
+_clients_lock = threading.Lock()
+
+
+def client_for(token):
+    with _clients_lock:
+        client = _clients.get(token)
+        if client is None:
+            client = HelixClient(token)
+            _clients[token] = client
+        return client
+
+
+# ---------- App-Access-Token (client_credentials) ----------
+_app_tokens = {}           # client_id -> (access_token, expires_at, fetched_at)
+_app_token_locks = {}
+_app_tokens_lock = threading.Lock()
+
+
+def _app_token_lock(client_id):
+    with _app_tokens_lock:
+        lock = _app_token_locks.get(client_id)
+        if lock is None:
+            lock = _app_token_locks[client_id] = threading.Lock()
+        return lock
+
+
+def app_token(client_id, client_secret, reject=None):
+    """App-Access-Token für client_id – aus dem Cache, solange er noch gültig ist.
+
+    reject: Token, der gerade mit 401 abgelehnt wurde. Er wird nur ersetzt,
+    wenn er nicht ganz frisch ist (ein 401 auf einen neuen Token liegt an der
+    Ressource, nicht am Token). Parallele Aufrufer warten auf denselben Request.
+    """
+    with _app_token_lock(client_id):
+        now = time.time()
+        cached = _app_tokens.get(client_id)
+        if cached:
+            token, expires_at, fetched_at = cached
+            if reject is not None and token == reject:
+                if now - fetched_at < APP_TOKEN_MIN_AGE:
+                    return token
+            elif expires_at - APP_TOKEN_MARGIN > now:
+                return token
+
+        resp = request(
+            "POST",
+            "https://id.twitch.tv/oauth2/token",
+            data={
+                "client_id": client_id,
+                "client_secret": client_secret,
+                "grant_type": "client_credentials",
+            },
+        ).json()
+        access_token = resp.get("access_token")
+        if not access_token:
+            raise RuntimeError(f"App-Token konnte nicht geholt werden: {resp}")
+        try:
+            expires_at = now + int(resp.get("expires_in"))
+        except (TypeError, ValueError):
+            expires_at = now + APP_TOKEN_MARGIN * 2
+        _app_tokens[client_id] = (access_token, expires_at, now)
+        return access_token
@@ -0,0 +1,51 @@
+HELIX_MAX_PAGE_SIZE = 100  # Obergrenze für "first" bei den meisten Helix-Endpunkten
+
+
+def iter_pages(fetch, params=None, page_size=HELIX_MAX_PAGE_SIZE, max_items=None, stop=None):
+    """
+    Lazy Helix-Pagination: liefert die Einträge aus "data" Seite für Seite.
+
+    Die nächste Seite wird erst angefragt, wenn der Aufrufer weiter iteriert –
+    wer nach den ersten Einträgen aufhört, verursacht keine weiteren Requests.
+
+    Args:
+        fetch (callable): fetch(query) -> JSON-Antwort einer Seite
+        params (dict): weitere Query-Parameter
+        page_size (int): Einträge pro Seite (1..100)
+        max_items (int): höchstens so viele Einträge liefern (None = alle)
+        stop (callable): stop(item) -> True beendet die Iteration VOR diesem Eintrag
+    """
+    page_size = max(1, min(HELIX_MAX_PAGE_SIZE, int(page_size)))
+    if max_items is not None and max_items <= 0:
+        return
+
+    query = dict(params or {})
+    yielded = 0
+    cursor = None
+
+    while True:
+        first = page_size
+        if max_items is not None:
+            # Letzte Seite nicht größer anfragen als nötig
+            first = min(page_size, max_items - yielded)
+        query["first"] = first
+        if cursor:
+            query["after"] = cursor
+        else:
+            query.pop("after", None)
+
+        data = fetch(dict(query))
+        if "data" not in data:
+            raise Exception(f"Fehler beim Abruf der Twitch-Daten: {data}")
+
+        for item in data["data"]:
+            if stop is not None and stop(item):
+                return
+            yield item
+            yielded += 1
+            if max_items is not None and yielded >= max_items:
+                return
+
+        cursor = data.get("pagination", {}).get("cursor")
+        if not data["data"] or not cursor:
+            return
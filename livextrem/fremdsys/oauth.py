@@ -1,9 +1,10 @@
 import http.server
+import time
 import webbrowser
-import requests
 import threading
 import urllib.parse
 from . import tw_privdata
+from . import helix
 
 twd = tw_privdata.Daten()
 from config import Config
@@ -66,6 +67,7 @@ def gen_direct():
             self.atoken = None
             self.rtoken = None
             self.expire = None
+            self.expires_at = None   # Unix-Zeit, berechnet aus expire
             self.clientid = CLIENT_ID
             self.clientsecret = CLIENT_SECRET
             self.userid = None
@@ -121,7 +123,7 @@ def gen_direct():
                         "redirect_uri": REDIRECT_URI
                     }
 
-                    r = requests.post(token_url, data=data)
+                    r = helix.request("POST", token_url, data=data)
                     token_info = r.json()
 
                     self.send_response(200)
@@ -191,16 +193,13 @@ def gen_direct():
     token.atoken = token_info.get("access_token")
     token.rtoken = token_info.get("refresh_token")
     token.expire = token_info.get("expires_in")
+    token.expires_at = _expires_at(token.expire)
 
     print("\n✅ Login abgeschlossen!")
 
     # User-Daten laden
     def load_user_data():
-        headers = {
-            "Client-ID": CLIENT_ID,
-            "Authorization": f"Bearer {token.atoken}"
-        }
-        user = requests.get("https://api.twitch.tv/helix/users", headers=headers).json()
+        user = helix.client_for(token).get_json("users")
         print("User-Response:", user)
 
         if "data" not in user or not user["data"]:
@@ -221,15 +220,24 @@ def gen_direct():
     return token
 
 
+def _expires_at(expires_in):
+    try:
+        return time.time() + int(expires_in)
+    except (TypeError, ValueError):
+        return None
+
+
 def refresh(token):
     """
     Aktualisiert den Token eines bereits angemeldeten Benutzers. Der Token läuft nach 4 Stunden ab und muss durch den Refresh-Token aktualisiert werden.
+    Wird automatisch vom Helix-Client aufgerufen (bei 401 und kurz vor Ablauf).
     """
     if token is None:
         print("Benutzer ist nicht angemeldet.")
         return
 
-    r = requests.post(
+    r = helix.request(
+        "POST",
         "https://id.twitch.tv/oauth2/token",
         data={
             "grant_type": "refresh_token",
@@ -239,6 +247,10 @@ def refresh(token):
         }
     )
     new_token_info = r.json()
+    if not new_token_info.get("access_token"):
+        # Alten Token nicht mit None überschreiben
+        raise RuntimeError(f"Token-Refresh fehlgeschlagen: {new_token_info}")
     token.atoken = new_token_info.get("access_token")
-    token.rtoken = new_token_info.get("refresh_token")
+    token.rtoken = new_token_info.get("refresh_token") or token.rtoken
     token.expire = new_token_info.get("expires_in")
+    token.expires_at = _expires_at(token.expire)
@@ -0,0 +1,127 @@
+import heapq
+import itertools
+import threading
+import time
+
+# -----------------------------------------------------------------------------
+# Token-Bucket für die Helix-Rate-Limits (pro OAuth-Token)
+# -----------------------------------------------------------------------------
+# Twitch meldet mit jeder Antwort das aktuelle Budget:
+#     Ratelimit-Limit      Größe des Buckets (typisch 800 Punkte / Minute)
+#     Ratelimit-Remaining  verbleibende Punkte
+#     Ratelimit-Reset      Unix-Zeit, zu der der Bucket wieder voll ist
+#
+# Vor jedem Request wird ein Punkt abgebucht; ist das Budget knapp, warten
+# die Aufrufer in Prioritätsreihenfolge. Hintergrundabfragen (NORMAL/LOW)
+# lassen eine Reserve übrig, damit Moderationsaktionen (HIGH) auch bei
+# knappem Budget sofort durchgehen.
+# -----------------------------------------------------------------------------
+
+PRIORITY_HIGH = 0      # interaktive Aktionen (Ban, Timeout, Unban)
+PRIORITY_NORMAL = 10
+PRIORITY_LOW = 20      # Hintergrund-Statistiken
+
+DEFAULT_LIMIT = 800
+DEFAULT_WINDOW = 60.0      # Sekunden bis zum vollständigen Auffüllen
+RESERVE_RATIO = 0.1        # Anteil des Buckets, der für HIGH reserviert bleibt
+
+
+class RateLimitTimeout(RuntimeError):
+    """Innerhalb des Timeouts wurde kein Rate-Limit-Budget frei."""
+
+
+class RateLimiter:
+    def __init__(self, limit=DEFAULT_LIMIT, window=DEFAULT_WINDOW, reserve_ratio=RESERVE_RATIO):
+        self.limit = int(limit)
+        self.window = float(window)
+        self.reserve_ratio = float(reserve_ratio)
+        self.tokens = float(self.limit)
+        self._updated = time.monotonic()
+        self._reset_at = None      # monotonic: Bucket laut Server wieder voll
+        self._cond = threading.Condition()
+        self._waiters = []         # Heap aus (priority, seq)
+        self._seq = itertools.count()
+
+    # ---------- Budget ----------
+    def _refill(self, now):
+        if self._reset_at is not None and now >= self._reset_at:
+            self.tokens = float(self.limit)
+            self._reset_at = None
+        else:
+            self.tokens = min(float(self.limit), self.tokens + (now - self._updated) * self.limit / self.window)
+        self._updated = now
+
+    def _needed(self, priority):
+        if priority <= PRIORITY_HIGH:
+            return 1.0
+        return 1.0 + max(1, int(self.limit * self.reserve_ratio))
+
+    def _wait_time(self, priority, now):
+        deficit = max(0.0, self._needed(priority) - self.tokens)
+        wait = deficit * self.window / max(1, self.limit)
+        if self._reset_at is not None:
+            wait = min(wait, max(0.0, self._reset_at - now))
+        return min(max(wait, 0.01), 1.0)
+
+    def acquire(self, priority=PRIORITY_NORMAL, timeout=None):
+        """Bucht einen Punkt ab; wartet bei knappem Budget (höhere Priorität zuerst)."""
+        entry = (priority, next(self._seq))
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            heapq.heappush(self._waiters, entry)
+            try:
+                while True:
+                    now = time.monotonic()
+                    self._refill(now)
+                    if self._waiters[0] == entry and self.tokens >= self._needed(priority):
+                        self.tokens -= 1.0
+                        return
+                    wait = self._wait_time(priority, now)
+                    if deadline is not None:
+                        remaining = deadline - now
+                        if remaining <= 0:
+                            raise RateLimitTimeout("Twitch-Rate-Limit: kein Budget innerhalb des Timeouts.")
+                        wait = min(wait, remaining)
+                    self._cond.wait(wait)
+            finally:
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+                self._cond.notify_all()
+
+    def update_from_headers(self, headers):
+        """Übernimmt den vom Server gemeldeten Stand (Server hat immer recht)."""
+        try:
+            limit = headers.get("Ratelimit-Limit")
+            remaining = headers.get("Ratelimit-Remaining")
+            reset = headers.get("Ratelimit-Reset")
+        except Exception:
+            return
+        if remaining is None:
+            return
+        with self._cond:
+            now = time.monotonic()
+            try:
+                if limit is not None:
+                    self.limit = max(1, int(limit))
+                self.tokens = float(int(remaining))
+                if reset is not None:
+                    self._reset_at = now + max(0.0, float(reset) - time.time())
+            except (TypeError, ValueError):
+                return
+            self._updated = now
+            self._cond.notify_all()
+
+    def exhaust(self, reset_epoch=None):
+        """Nach einem 429: Budget auf 0 setzen, bis der Server wieder auffüllt."""
+        with self._cond:
+            now = time.monotonic()
+            self.tokens = 0.0
+            self._updated = now
+            if reset_epoch is not None:
+                self._reset_at = now + max(0.0, float(reset_epoch) - time.time())
+            self._cond.notify_all()
+
+    def stats(self):
+        with self._cond:
+            self._refill(time.monotonic())
+            return {"limit": self.limit, "tokens": int(self.tokens), "waiting": len(self._waiters)}
@@ -1,8 +1,9 @@
-import requests
 from datetime import datetime, timedelta
+from .helix import client_for, PRIORITY_NORMAL, PRIORITY_LOW
 
 
 def header(token): # Fertig
+    """Auth-Header für eigene Requests (die Funktionen hier nutzen den Helix-Client)."""
     CLIENT_ID = token.clientid
     ACCESS_TOKEN = token.atoken
     USER_ID = token.userid
@@ -14,64 +15,39 @@ def header(token): # Fertig
     return headers
 
 
-def laststreams(token, limit_per_page=100): # Fertig
+def laststreams(token, limit_per_page=100, timeout=None, max_items=None, stop=None, priority=PRIORITY_NORMAL): # Fertig
     """
-    Ruft alle verfügbaren archivierten Streams (VODs) eines Nutzers ab.
+    Ruft die archivierten Streams (VODs) eines Nutzers ab, neueste zuerst.
     Twitch speichert VODs normalerweise 14-60 Tage (je nach Accounttyp).
+    Ohne max_items/stop wird das komplette Archiv geladen; mit max_items bzw.
+    stop(video) endet die Pagination, sobald genug Einträge da sind.
+    timeout gilt pro HTTP-Request.
     """
-    
-    CLIENT_ID = token.clientid
-    ACCESS_TOKEN = token.atoken
-    USER_ID = token.userid
-
-    headers = {
-        "Client-ID": CLIENT_ID,
-        "Authorization": f"Bearer {ACCESS_TOKEN}"
-    }
+    params = {"user_id": token.userid, "type": "archive"}
 
-    url = f"https://api.twitch.tv/helix/videos?user_id={USER_ID}&type=archive&first={limit_per_page}"
     all_streams = []
-    cursor = None  # für Pagination
-
-    while True:
-        # Falls Pagination vorhanden, Cursor anhängen
-        final_url = url + (f"&after={cursor}" if cursor else "")
-        response = requests.get(final_url, headers=headers)
-        data = response.json()
-
-        if "data" not in data:
-            raise Exception(f"Fehler beim Abruf der Twitch-Daten: {data}")
-
-        # Keine weiteren Ergebnisse mehr
-        if not data["data"]:
-            break
-
-        for video in data["data"]:
-            stream_info = {
-                #"id": video["id"],
-                "title": video["title"],
-                "created_at": video["created_at"],
-                "duration": video["duration"],
-                "views": video["view_count"],
-                #"language": video.get("language"),
-                #"game_id": video.get("game_id"),
-                #"thumbnail_url": video.get("thumbnail_url"),
-                #"url": video.get("url")
-            }
-
-            all_streams.append(stream_info)
-
-        # Pagination: Nächste Seite abrufen, falls vorhanden
-        cursor = data.get("pagination", {}).get("cursor")
-        if not cursor:
-            break
+    for video in client_for(token).paginate("videos", params, page_size=limit_per_page,
+                                            max_items=max_items, stop=stop, timeout=timeout,
+                                            priority=priority):
+        stream_info = {
+            #"id": video["id"],
+            "title": video["title"],
+            "created_at": video["created_at"],
+            "duration": video["duration"],
+            "views": video["view_count"],
+            #"language": video.get("language"),
+            #"game_id": video.get("game_id"),
+            #"thumbnail_url": video.get("thumbnail_url"),
+            #"url": video.get("url")
+        }
+
+        all_streams.append(stream_info)
 
     return all_streams
 
 
 def topbits(token):
-    headers = header(token)
-    bits = requests.get("https://api.twitch.tv/helix/bits/leaderboard", headers=headers).json()
+    bits = client_for(token).get_json("bits/leaderboard")
     print(bits)
     return bits
 
@@ -80,8 +56,7 @@ def followlist(token, days=5): # Fertig
     """
     Ruft alle aktuellen Follower auf und gib sie als Liste zurück. Mit "days" wird der Zeitraum der neuen Follower definiert.
     """
-    headers = header(token)
-    response = requests.get(f"https://api.twitch.tv/helix/channels/followers?broadcaster_id={token.userid}&first=100",headers=headers).json()
+    response = client_for(token).get_json("channels/followers", params={"broadcaster_id": token.userid, "first": 100})
     lastfive = _lastfive(response, days)
     usernames = _extract_usernames(response)
     return usernames, lastfive
@@ -93,8 +68,7 @@ def sublist(token): # Fertig, jedoch kann keine "letzten Subs" Liste zurück geg
     """
     Ruft alle aktuellen Abonnenten (Subs) auf und gibt sie als Liste zurück.
     """
-    headers = header(token)
-    subslist = requests.get(f"https://api.twitch.tv/helix/subscriptions?broadcaster_id={token.userid}", headers=headers).json()
+    subslist = client_for(token).get_json("subscriptions", params={"broadcaster_id": token.userid})
     subslist = _extract_usernames(subslist)
     return subslist
 
@@ -126,11 +100,11 @@ def _extract_usernames(list): # Fertig
 # VOD: [{'id': '2607193563', 'title': 'Stream Together mit Tim 🎮🤝 | REPO + Chained Together', 'created_at': '2025-11-01T19:21:55Z', 'duration': '3h56m22s', 'views': 28, 'language': 'de', 'game_id': None, 'thumbnail_url': 'https://static-cdn.jtvnw.net/cf_vods/d3fi1amfgojobc/c6ed1943ca34bece2dd5_derflaavius_315023494631_1762024907//thumb/thumb0-%{width}x%{height}.jpg', 'url': 'https://www.twitch.tv/videos/2607193563', 'game_name': None}, {'id': '2602889239', 'title': 'Genesungsstream 🤒 | Ihr Entscheidet! 🎮', 'created_at': '2025-10-27T19:15:07Z', 'duration': '2h42m33s', 'views': 35, 'language': 'de', 'game_id': None, 'thumbnail_url': 'https://static-cdn.jtvnw.net/cf_vods/d3fi1amfgojobc/bc058d5aa3c07c15b8fe_derflaavius_314970933607_1761592501//thumb/thumb0-%{width}x%{height}.jpg', 'url': 'https://www.twitch.tv/videos/2602889239', 'game_name': None}]
 
 
-def follower_stats(token, days=7):
+def follower_stats(token, days=7, timeout=None):
     """Gibt Follower-Gesamtzahl und neue Follower im Zeitraum zurück."""
-    headers = header(token)
-    url = f"https://api.twitch.tv/helix/channels/followers?broadcaster_id={token.userid}&first=100"
-    resp = requests.get(url, headers=headers).json()
+    resp = client_for(token).get_json("channels/followers",
+                                      params={"broadcaster_id": token.userid, "first": 100},
+                                      timeout=timeout, priority=PRIORITY_LOW)
 
     if "data" not in resp:
         raise Exception(f"Fehler beim Abruf der Follower: {resp}")
@@ -140,21 +114,24 @@ def follower_stats(token, days=7):
     return {"total": total, "new_count": len(new_list), "new_usernames": new_list}
 
 
-def subscriber_total(token):
+def subscriber_total(token, timeout=None):
     """Gibt die Gesamtzahl der Subs zurück (Scope: channel:read:subscriptions)."""
-    headers = header(token)
-    resp = requests.get(f"https://api.twitch.tv/helix/subscriptions?broadcaster_id={token.userid}&first=1", headers=headers).json()
+    resp = client_for(token).get_json("subscriptions",
+                                      params={"broadcaster_id": token.userid, "first": 1},
+                                      timeout=timeout, priority=PRIORITY_LOW)
     if "data" not in resp:
         # kann z.B. 401/403 sein → Twitch liefert dann oft 'message' etc.
         raise Exception(f"Fehler beim Abruf der Subs: {resp}")
     return resp.get("total")
 
 
-def avg_vod_views(token, limit=10):
+def avg_vod_views(token, limit=10, timeout=None):
     """Durchschnittliche Aufrufe der letzten VODs (Archiv)."""
-    streams = laststreams(token, limit_per_page=min(100, max(1, int(limit))))
+    # Nur die neuesten `limit` VODs anfragen – bei limit <= 100 genau ein Request
+    limit = max(1, int(limit))
+    streams = laststreams(token, limit_per_page=limit, timeout=timeout, max_items=limit, priority=PRIORITY_LOW)
     if not streams:
         return 0
     # laststreams liefert bereits dicts mit 'views'
-    views = [int(s.get("views", 0) or 0) for s in streams[:limit]]
+    views = [int(s.get("views", 0) or 0) for s in streams]
     return int(round(sum(views) / max(1, len(views))))
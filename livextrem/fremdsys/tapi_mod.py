@@ -1,6 +1,13 @@
+import re
 import socket
 import time
-import requests
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+from config import Config
+from . import helix
+from .helix import client_for, PRIORITY_HIGH
+
+CHAT_TAIL_SECONDS = 120  # so weit vor VOD-Ende beginnt die Vorschau (fetch_vod_chat_tail)
 
 def get_live_messages(token): # Funktioniert nicht
     oauth_token = f"oauth:{token.atoken}"
@@ -85,144 +92,228 @@ def live_test_irc_connection(token): # Bewertung ausstehend, wird möglicherweis
     sock.close()
 
 
-def get_vod_chat(token): # Fertig
+def _v5_get(url, client_id, client_secret, params=None):
+    """GET gegen die v5-API mit gecachtem App-Token; bei 401 höchstens einmal mit neuem Token."""
+    app_token = helix.app_token(client_id, client_secret)
+    for attempt in range(2):
+        resp = helix.request("GET", url, params=params, headers={
+            "Client-ID": client_id,
+            "Accept": "application/vnd.twitchtv.v5+json",
+            "Authorization": f"OAuth {app_token}",
+        })
+        if resp.status_code != 401 or attempt:
+            return resp
+        renewed = helix.app_token(client_id, client_secret, reject=app_token)
+        if renewed == app_token:
+            return resp
+        app_token = renewed
+    return resp
+
+
+def _probe_vod(vod, v5_get):
+    """Prüft ein VOD auf Chat-Replay und liefert seinen Status-Eintrag."""
+    status = {"video_id": vod["id"], "title": vod["title"]}
+    try:
+        resp = v5_get(f"https://api.twitch.tv/v5/videos/{vod['id']}/comments")
+    except Exception as e:
+        return {**status, "chat_status": f"error_{type(e).__name__}", "chat_available": False}
+
+    # Chat OK
+    if resp.status_code == 200 and resp.text.strip():
+        return {**status, "chat_status": "processed", "chat_available": True}
+    # Chat pending / none
+    if resp.status_code == 200:
+        return {**status, "chat_status": "pending_or_none", "chat_available": False}
+    # Zugriff verweigert
+    if resp.status_code in (401, 403):
+        return {**status, "chat_status": "restricted", "chat_available": False}
+    # Unbekannt
+    return {**status, "chat_status": f"error_{resp.status_code}", "chat_available": False}
+
+
+def probe_vods_for_chat(vods, v5_get, collect_all=False, max_workers=None):
     """
-    Kombinierte Funktion:
-    - Listet alle VODs mit Chat-Status
-    - Findet das neueste VOD mit Chat (processed)
-    - Lädt seinen kompletten Chat
-    - Gibt (chat_messages, selected_vod, status_code) zurück
+    Prüft VODs (neueste zuerst) parallel mit begrenzter Parallelität auf Chat.
 
-    Status 0   = Chat gefunden und geladen
-    Status 404 = Kein einziges VOD mit Chat verfügbar
-    """
+    Sobald feststeht, welches das NEUESTE VOD mit Chat ist (alle neueren sind
+    geprüft und ohne Chat), werden die restlichen Prüfungen abgebrochen.
+    Mit collect_all=True werden trotzdem alle VODs geprüft (vollständige Statusliste).
 
-    client_id = token.clientid
-    client_secret = token.clientsecret
-    access_token = token.atoken
-    user_id = token.userid
+    Returns:
+        (index des neuesten VODs mit Chat oder None, Statusliste der geprüften VODs)
+    """
+    workers = max(1, int(max_workers or Config.TWITCH_PROBE_WORKERS))
+    results = [None] * len(vods)
+    found = None
+    next_idx = 0
+    pending = {}
+
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="livextrem-vod-probe")
+    try:
+        while True:
+            # Fenster auffüllen: nie mehr Prüfungen anstoßen als Worker frei sind
+            while next_idx < len(vods) and len(pending) < workers:
+                pending[pool.submit(_probe_vod, vods[next_idx], v5_get)] = next_idx
+                next_idx += 1
+            if not pending:
+                break
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                results[pending.pop(future)] = future.result()
+
+            if found is None:
+                # Neuestes VOD mit Chat = erster Treffer im lückenlos geprüften Anfang
+                for i, res in enumerate(results):
+                    if res is None:
+                        break
+                    if res["chat_available"]:
+                        found = i
+                        break
+            if found is not None and not collect_all:
+                break
+    finally:
+        # Laufende Prüfungen nicht abwarten, wartende verwerfen
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    return found, [res for res in results if res is not None]
+
+
+def find_vod_with_chat(token, collect_status=False):
+    """
+    Sucht das neueste VOD mit Chat-Replay.
 
+    Returns:
+        (vod, vod_status_list, status_code)
+        vod ist das vollständige Helix-VOD oder None;
+        status_code 0 = gefunden, 404 = kein VOD / kein VOD mit Chat
+    """
     # === 1. VOD-Liste holen (Helix) ===
-    vod_url = f"https://api.twitch.tv/helix/videos?user_id={user_id}&type=archive&first=100"
-    headers_helix = {
-        "Client-ID": client_id,
-        "Authorization": f"Bearer {access_token}",
-    }
-
-    vod_resp = requests.get(vod_url, headers=headers_helix).json()
+    vod_resp = client_for(token).get_json(
+        "videos", params={"user_id": token.userid, "type": "archive", "first": 100}
+    )
 
     if "data" not in vod_resp or not vod_resp["data"]:
         print("❌ Keine VODs gefunden.")
-        return [], None, 404
+        return None, [], 404
 
     vods = vod_resp["data"]
 
-    # === 2. App Access Token (für V5 Chat API) ===
-    app_token = requests.post(
-        "https://id.twitch.tv/oauth2/token",
-        data={
-            "client_id": client_id,
-            "client_secret": client_secret,
-            "grant_type": "client_credentials",
-        },
-    ).json()["access_token"]
-
-    v5_headers = {
-        "Client-ID": client_id,
-        "Accept": "application/vnd.twitchtv.v5+json",
-        "Authorization": f"OAuth {app_token}",
-    }
+    # === 2. VODs parallel auf Chat prüfen (neuestes zuerst, Abbruch sobald gefunden) ===
+    found_index, vod_status_list = probe_vods_for_chat(vods, _v5_getter(token), collect_all=collect_status)
 
-    vod_status_list = []
-    vod_with_chat = None
-
-    # === 3. Prüfung aller VODs auf Chat ===
-    for vod in vods:
-        vod_id = vod["id"]
-        title = vod["title"]
-
-        comments_url = f"https://api.twitch.tv/v5/videos/{vod_id}/comments"
-        resp = requests.get(comments_url, headers=v5_headers)
-
-        # Chat OK
-        if resp.status_code == 200 and resp.text.strip():
-            vod_status_list.append({
-                "video_id": vod_id,
-                "title": title,
-                "chat_status": "processed",
-                "chat_available": True
-            })
-
-            # Das NEUESTE VOD mit Chat auswählen
-            if vod_with_chat is None:
-                vod_with_chat = vod  # Speichere vollständiges Helix-VOD
-            continue
+    if found_index is None:
+        print("❌ Kein VOD enthält Chat.")
+        return None, vod_status_list, 404
 
-        # Chat pending / none
-        if resp.status_code == 200 and not resp.text.strip():
-            vod_status_list.append({
-                "video_id": vod_id,
-                "title": title,
-                "chat_status": "pending_or_none",
-                "chat_available": False
-            })
-            continue
+    vod_with_chat = vods[found_index]
+    print(f"📺 VOD mit Chat gefunden! Video-ID: {vod_with_chat['id']}")
+    return vod_with_chat, vod_status_list, 0
 
-        # Zugriff verweigert
-        if resp.status_code in (401, 403):
-            vod_status_list.append({
-                "video_id": vod_id,
-                "title": title,
-                "chat_status": "restricted",
-                "chat_available": False
-            })
-            continue
 
-        # Unbekannt
-        vod_status_list.append({
-            "video_id": vod_id,
-            "title": title,
-            "chat_status": f"error_{resp.status_code}",
-            "chat_available": False
-        })
+def _v5_getter(token):
+    """v5-GET mit dem (gecachten) App-Token des Token-Clients."""
+    client_id = token.clientid
+    client_secret = token.clientsecret
+    return lambda url, params=None: _v5_get(url, client_id, client_secret, params)
 
-    # === 4. Kein VOD mit Chat gefunden? ===
-    if vod_with_chat is None:
-        print("❌ Kein VOD enthält Chat.")
-        return vod_status_list, None, 404
 
-    # === 5. Chat des gefundenen VODs laden ===
-    selected_vod_id = vod_with_chat["id"]
-    print(f"📺 VOD mit Chat gefunden! Video-ID: {selected_vod_id}")
+def _parse_comments(comments):
+    return [
+        {
+            "user": c["commenter"]["display_name"] if c["commenter"] else "Unknown",
+            "message": c["message"]["body"],
+            "timestamp": c["created_at"]
+        }
+        for c in comments
+    ]
+
 
-    comments_url = f"https://api.twitch.tv/v5/videos/{selected_vod_id}/comments"
+def _duration_seconds(duration):
+    """Helix-Dauer wie "3h2m15s" -> Sekunden (0 wenn unlesbar)."""
+    units = {"h": 3600, "m": 60, "s": 1}
+    return sum(int(value) * units[unit] for value, unit in re.findall(r"(\d+)([hms])", duration or ""))
 
-    all_messages = []
-    cursor = None
 
-    while True:
-        params = {"cursor": cursor} if cursor else {}
+def fetch_vod_chat_tail(token, vod, seconds=CHAT_TAIL_SECONDS):
+    """
+    Eine Chat-Seite vom ENDE des VODs (ab content_offset_seconds = Dauer - seconds).
+
+    Die Cursor-Pagination von iter_vod_chat_pages läuft nur vorwärts ab dem
+    VOD-Anfang; die neuesten Nachrichten kämen erst mit der letzten Seite.
+    Diese Seite liefert sie mit einem einzigen Request als Vorschau.
+    Bei einem HTTP-Fehler: RuntimeError.
+    """
+    offset = max(0, _duration_seconds(vod.get("duration")) - int(seconds))
+    resp = _v5_getter(token)(
+        f"https://api.twitch.tv/v5/videos/{vod['id']}/comments",
+        params={"content_offset_seconds": offset},
+    )
+    if resp.status_code != 200:
+        raise RuntimeError(f"Fehler beim Laden des Chats (HTTP {resp.status_code}): {resp.text[:200]}")
+    return _parse_comments(resp.json().get("comments") or [])
+
+
+def iter_vod_chat_pages(token, vod_id, cursor=None):
+    """
+    Generator über die Chat-Seiten eines VODs: liefert (nachrichten, next_cursor).
 
-        resp_raw = requests.get(comments_url, headers=v5_headers, params=params)
-        if resp_raw.status_code != 200:
-            print("❌ Fehler beim Laden des Chats:", resp_raw.text)
-            break
+    Die v5-API blättert nur vorwärts: die erste Seite enthält die ÄLTESTEN
+    Nachrichten des VODs, die neuesten kommen zuletzt. Wer sofort das Ende
+    zeigen will, holt es vorab mit fetch_vod_chat_tail().
 
-        resp = resp_raw.json()
+    Während der Aufrufer eine Seite verarbeitet, wird die nächste bereits
+    geladen (Prefetch). next_cursor ist None auf der letzten Seite; mit ihm
+    kann ein abgebrochener Download später fortgesetzt werden.
+    Bei einem HTTP-Fehler endet der Generator mit RuntimeError.
+    """
+    v5_get = _v5_getter(token)
+    comments_url = f"https://api.twitch.tv/v5/videos/{vod_id}/comments"
+
+    def fetch(cur):
+        resp = v5_get(comments_url, params={"cursor": cur} if cur else {})
+        if resp.status_code != 200:
+            raise RuntimeError(f"Fehler beim Laden des Chats (HTTP {resp.status_code}): {resp.text[:200]}")
+        return resp.json()
+
+    pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="livextrem-chat-prefetch")
+    try:
+        future = pool.submit(fetch, cursor)
+        while future is not None:
+            page = future.result()
+            if "comments" not in page:
+                return
+            next_cursor = page.get("_next")
+            # Nächste Seite schon anfragen, bevor diese geparst/verarbeitet wird
+            future = pool.submit(fetch, next_cursor) if next_cursor else None
+            yield _parse_comments(page["comments"]), next_cursor
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def get_vod_chat(token, collect_status=False): # Fertig
+    """
+    Kombinierte Funktion:
+    - Prüft die VODs auf Chat (alle nur mit collect_status=True)
+    - Findet das neueste VOD mit Chat (processed)
+    - Lädt seinen kompletten Chat
+    - Gibt (chat_messages, selected_vod, status_code) zurück
 
-        if "comments" not in resp:
-            break
+    Status 0   = Chat gefunden und geladen
+    Status 404 = Kein einziges VOD mit Chat verfügbar
 
-        for c in resp["comments"]:
-            all_messages.append({
-                "user": c["commenter"]["display_name"] if c["commenter"] else "Unknown",
-                "message": c["message"]["body"],
-                "timestamp": c["created_at"]
-            })
+    Für seitenweises Laden: find_vod_with_chat() + iter_vod_chat_pages().
+    """
+    vod_with_chat, vod_status_list, status = find_vod_with_chat(token, collect_status)
+    if vod_with_chat is None:
+        return vod_status_list, None, status
 
-        cursor = resp.get("_next")
-        if not cursor:
-            break
+    all_messages = []
+    try:
+        for messages, _cursor in iter_vod_chat_pages(token, vod_with_chat["id"]):
+            all_messages.extend(messages)
+    except RuntimeError as e:
+        print("❌", e)
 
     print(f"✅ Chat geladen: {len(all_messages)} Nachrichten")
 
@@ -239,26 +330,16 @@ def get_mod_history(token): # Kontrolle Ausstehend, funktioniert noch nicht
     - moderator:read:banned_users Scope
     """
 
-    client_id = token.clientid
-    access_token = token.atoken
     broadcaster_id = token.userid   # DEIN Kanal
     user_id = token.userid          # DU als Mod
 
     # === 1. Dich selbst als Moderator eintragen ================================
-    url_add_mod = (
-        f"https://api.twitch.tv/helix/moderation/moderators"
-        f"?broadcaster_id={broadcaster_id}"
-        f"&user_id={user_id}"
+    client = client_for(token)
+    response = client.put(
+        "moderation/moderators",
+        params={"broadcaster_id": broadcaster_id, "user_id": user_id},
     )
 
-    headers = {
-        "Client-ID": client_id,
-        "Authorization": f"Bearer {access_token}",
-        "Content-Type": "application/json"
-    }
-
-    response = requests.put(url_add_mod, headers=headers)
-
     if response.status_code not in (204, 200):
         print("❌ Konnte dich NICHT als Moderator setzen:", response.text)
     else:
@@ -266,14 +347,11 @@ def get_mod_history(token): # Kontrolle Ausstehend, funktioniert noch nicht
 
     # === 2. Moderations-Historie laden =========================================
 
-    history_url = (
-        f"https://api.twitch.tv/helix/moderation/banned/events"
-        f"?broadcaster_id={broadcaster_id}"
-        f"&moderator_id={user_id}"
+    history_resp = client.get_json(
+        "moderation/banned/events",
+        params={"broadcaster_id": broadcaster_id, "moderator_id": user_id},
     )
 
-    history_resp = requests.get(history_url, headers=headers).json()
-
     if "data" not in history_resp:
         print("❌ Keine Moderationsdaten gefunden:", history_resp)
         return []
@@ -310,20 +388,11 @@ def ban_or_timeout_user(token, username, broadcaster_id, duration=0, reason=""):
         reason (str): Optionaler Grund
     """
 
-    client_id = token.clientid
-    access_token = token.atoken
     moderator_id = token.userid   # 👈 DAS ist der Mod
-
-    headers = {
-        "Client-ID": client_id,
-        "Authorization": f"Bearer {access_token}"
-    }
+    client = client_for(token)
 
     # 1️⃣ Ziel-User-ID ermitteln
-    user_lookup = requests.get(
-        f"https://api.twitch.tv/helix/users?login={username}",
-        headers=headers
-    ).json()
+    user_lookup = client.get_json("users", params={"login": username}, priority=PRIORITY_HIGH)
 
     if not user_lookup.get("data"):
         print("❌ User nicht gefunden:", username)
@@ -332,12 +401,6 @@ def ban_or_timeout_user(token, username, broadcaster_id, duration=0, reason=""):
     target_user_id = user_lookup["data"][0]["id"]
 
     # 2️⃣ Ban / Timeout
-    ban_url = (
-        "https://api.twitch.tv/helix/moderation/bans"
-        f"?broadcaster_id={broadcaster_id}"
-        f"&moderator_id={moderator_id}"
-    )
-
     payload = {
         "data": {
             "user_id": target_user_id,
@@ -348,12 +411,12 @@ def ban_or_timeout_user(token, username, broadcaster_id, duration=0, reason=""):
     if duration > 0:
         payload["data"]["duration"] = duration
 
-    headers_json = {
-        **headers,
-        "Content-Type": "application/json"
-    }
-
-    resp = requests.post(ban_url, json=payload, headers=headers_json)
+    resp = client.post(
+        "moderation/bans",
+        params={"broadcaster_id": broadcaster_id, "moderator_id": moderator_id},
+        json=payload,
+        priority=PRIORITY_HIGH,
+    )
 
     if resp.status_code in (200, 201, 204):
         action = "getimeouted" if duration else "gebannt"
@@ -382,20 +445,11 @@ def unban_user(token, username, broadcaster_id): # Fertig
         500+	Twitch hat Schluckauf
     """
     
-    client_id = token.clientid
-    access_token = token.atoken
     # broadcaster_id wird von außen übergeben (Streamer)
+    client = client_for(token)
 
     # 1) User-ID zum Username ermitteln
-    headers = {
-        "Client-ID": client_id,
-        "Authorization": f"Bearer {access_token}"
-    }
-
-    user_lookup = requests.get(
-        f"https://api.twitch.tv/helix/users?login={username}",
-        headers=headers
-    ).json()
+    user_lookup = client.get_json("users", params={"login": username}, priority=PRIORITY_HIGH)
 
     if "data" not in user_lookup or not user_lookup["data"]:
         print("❌ User nicht gefunden:", username)
@@ -404,20 +458,12 @@ def unban_user(token, username, broadcaster_id): # Fertig
     target_user_id = user_lookup["data"][0]["id"]
 
     # 2) Unban ausführen
-    unban_url = (
-        f"https://api.twitch.tv/helix/moderation/bans"
-        f"?broadcaster_id={broadcaster_id}"
-        f"&moderator_id={token.userid}"
-        f"&user_id={target_user_id}"
+    resp = client.delete(
+        "moderation/bans",
+        params={"broadcaster_id": broadcaster_id, "moderator_id": token.userid, "user_id": target_user_id},
+        priority=PRIORITY_HIGH,
     )
 
-    headers_json = {
-        "Client-ID": client_id,
-        "Authorization": f"Bearer {access_token}"
-    }
-
-    resp = requests.delete(unban_url, headers=headers_json)
-
     if resp.status_code in (200, 204):
         print(f"✅ Erfolg: User '{username}' wurde entbannt!")
         return 0
@@ -0,0 +1,117 @@
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from config import Config
+
+# -----------------------------------------------------------------------------
+# Kleiner JSON-Cache auf der Platte (Stale-While-Revalidate)
+# -----------------------------------------------------------------------------
+# Ein Cache = eine Datei in Config.CACHE_DIR. Jeder Eintrag merkt sich, wann er
+# geschrieben wurde; get() liefert den Wert zusammen mit dem Alter, damit der
+# Aufrufer sofort rendern und entscheiden kann, ob im Hintergrund neu geladen
+# werden muss:
+#
+#     cache = JsonCache("overview_stats", ttl=900, max_age=7 * 86400)
+#     entry = cache.get(twitch_userid)
+#     if entry:
+#         zeige(entry.value, veraltet=entry.stale)
+#     ...
+#     cache.put(twitch_userid, neue_werte)
+#
+# Schreiben ist atomar (temporäre Datei + os.replace). Eine kaputte oder
+# fehlende Datei bedeutet einfach "nichts im Cache".
+# -----------------------------------------------------------------------------
+
+
+class CacheEntry:
+    __slots__ = ("value", "saved_at", "stale")
+
+    def __init__(self, value, saved_at, stale):
+        self.value = value
+        self.saved_at = saved_at    # Unix-Zeit (Sekunden)
+        self.stale = stale          # älter als die TTL → neu laden
+
+    @property
+    def age(self):
+        return max(0.0, time.time() - self.saved_at)
+
+
+class JsonCache:
+    def __init__(self, name, ttl, max_age=None, directory=None):
+        self.path = Path(directory or Config.CACHE_DIR) / f"{name}.json"
+        self.ttl = float(ttl)
+        self.max_age = float(max_age) if max_age is not None else None
+        self._lock = threading.Lock()
+        self._data = None           # lazy geladen
+
+    # ---------- Datei ----------
+    def _load(self):
+        if self._data is not None:
+            return self._data
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            self._data = data if isinstance(data, dict) else {}
+        except FileNotFoundError:
+            self._data = {}
+        except Exception as e:
+            print(f"Cache {self.path.name} unlesbar, wird verworfen:", repr(e))
+            self._data = {}
+        return self._data
+
+    def _save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(prefix=self.path.stem + ".", suffix=".tmp", dir=str(self.path.parent))
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self._data, f, ensure_ascii=False)
+            os.replace(tmp, self.path)
+        except Exception:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+    # ---------- Zugriff ----------
+    def get(self, key):
+        """Liefert einen CacheEntry oder None (fehlt / älter als max_age)."""
+        if key is None:
+            return None
+        with self._lock:
+            raw = self._load().get(str(key))
+        if not isinstance(raw, dict) or "saved_at" not in raw:
+            return None
+        try:
+            saved_at = float(raw["saved_at"])
+        except (TypeError, ValueError):
+            return None
+        age = time.time() - saved_at
+        if self.max_age is not None and age > self.max_age:
+            return None
+        return CacheEntry(raw.get("value"), saved_at, age > self.ttl)
+
+    def put(self, key, value):
+        """Speichert value (muss JSON-serialisierbar sein). Fehler werden nur geloggt."""
+        if key is None:
+            return
+        with self._lock:
+            data = self._load()
+            data[str(key)] = {"saved_at": time.time(), "value": value}
+            try:
+                self._save()
+            except Exception as e:
+                print(f"Cache {self.path.name} konnte nicht geschrieben werden:", repr(e))
+
+    def delete(self, key):
+        with self._lock:
+            data = self._load()
+            if data.pop(str(key), None) is not None:
+                try:
+                    self._save()
+                except Exception as e:
+                    print(f"Cache {self.path.name} konnte nicht geschrieben werden:", repr(e))
@@ -1,11 +1,10 @@
 import customtkinter as ctk
 from tkinter import messagebox
-import threading
 from PIL import Image
 import os
-import mariadb
 
-from config import Config
+import background
+import db_pool
 from fremdsys import oauth
 from security import hash_password, verify_password
 from session_user import SessionUser, TwitchIdentity
@@ -41,18 +40,15 @@ class LoginWindow(ctk.CTk):
 
         self.build_login_view()
 
+        # Ergebnisse der Hintergrund-Worker im Tk-Thread abarbeiten
+        background.attach_ui(self)
+
     # ======================
     #  🔧 DATENBANK
     # ======================
     def _db(self):
-        Config.validate()
-        return mariadb.connect(
-            host=Config.DB_HOST,
-            port=Config.DB_PORT,
-            user=Config.DB_USER,
-            password=Config.DB_PASS,
-            database=Config.DB_NAME
-        )
+        """Leiht eine DB-Verbindung aus dem gemeinsamen Pool (Context-Manager)."""
+        return db_pool.connection()
 
     # ======================
     #   LOGIN UI
@@ -124,59 +120,62 @@ class LoginWindow(ctk.CTk):
             return
 
         def worker():
-            try:
-                token = oauth.gen()  # Token nur im RAM (oauth Modul)
-                self._register_streamer(username, email, pw, token)
-                self.after(0, lambda: messagebox.showinfo("Erfolg", "Streamer erfolgreich registriert!"))
-                self.after(0, self.build_login_view)
-            except Exception as e:
-                self.after(0, lambda: messagebox.showerror("Fehler", f"Registrierung fehlgeschlagen: {e}"))
-
-        threading.Thread(target=worker, daemon=True).start()
+            token = oauth.gen()  # Token nur im RAM (oauth Modul)
+            self._register_streamer(username, email, pw, token)
+
+        def done(_result):
+            messagebox.showinfo("Erfolg", "Streamer erfolgreich registriert!")
+            self.build_login_view()
+
+        background.submit(
+            worker,
+            on_done=done,
+            on_error=lambda e: messagebox.showerror("Fehler", f"Registrierung fehlgeschlagen: {e}"),
+            priority=background.PRIORITY_HIGH,
+            key="login-register",
+        )
         messagebox.showinfo("Weiter", "Twitch Login öffnet sich im Browser.")
 
     def _register_streamer(self, username: str, email: str, pw: str, token):
-        db = self._db()
-        cur = db.cursor()
-
-        # Username/Email uniqueness
-        cur.execute("SELECT user_id FROM users WHERE username=? OR email=? LIMIT 1", (username, email))
-        if cur.fetchone():
-            db.close()
-            raise RuntimeError("Benutzername oder E-Mail existiert bereits.")
-
-        pw_hash = hash_password(pw)
-
-        # user
-        cur.execute("INSERT INTO users (email, username, password_hash, created_at) VALUES (?,?,?, NOW())",
-                    (email, username, pw_hash))
-        user_id = cur.lastrowid
-
-        # role STREAMER (role_id = 1)
-        cur.execute("INSERT INTO user_roles (user_id, role_id) VALUES (?,1)", (user_id,))
-
-        # streamer table
-        cur.execute("INSERT INTO streamer (name, plattform, email, user_id, status) VALUES (?,'Twitch',?,?, 'Aktiv')",
-                    (token.displayname, email, user_id))
-
-        # twitch identity row (NO TOKENS STORED)
-        # ensure row exists
-        cur.execute("SELECT id FROM twitch_tokens WHERE user_id=? LIMIT 1", (user_id,))
-        row = cur.fetchone()
-        if row:
-            cur.execute("""UPDATE twitch_tokens
-                           SET twitch_userid=?, twitch_login=?, twitch_displayname=?,
-                               access_token=NULL, refresh_token=NULL, expires_in=NULL
-                           WHERE user_id=?""",
-                        (str(token.userid), token.loginname, token.displayname, user_id))
-        else:
-            cur.execute("""INSERT INTO twitch_tokens
-                           (user_id, twitch_userid, twitch_login, twitch_displayname, access_token, refresh_token, expires_in)
-                           VALUES (?,?,?,?, NULL, NULL, NULL)""",
-                        (user_id, str(token.userid), token.loginname, token.displayname))
-
-        db.commit()
-        db.close()
+        with self._db() as db:
+            cur = db.cursor()
+
+            # Username/Email uniqueness
+            cur.execute("SELECT user_id FROM users WHERE username=? OR email=? LIMIT 1", (username, email))
+            if cur.fetchone():
+                raise RuntimeError("Benutzername oder E-Mail existiert bereits.")
+
+            pw_hash = hash_password(pw)
+
+            # user
+            cur.execute("INSERT INTO users (email, username, password_hash, created_at) VALUES (?,?,?, NOW())",
+                        (email, username, pw_hash))
+            user_id = cur.lastrowid
+
+            # role STREAMER (role_id = 1)
+            cur.execute("INSERT INTO user_roles (user_id, role_id) VALUES (?,1)", (user_id,))
+
+            # streamer table
+            cur.execute("INSERT INTO streamer (name, plattform, email, user_id, status) VALUES (?,'Twitch',?,?, 'Aktiv')",
+                        (token.displayname, email, user_id))
+
+            # twitch identity row (NO TOKENS STORED)
+            # ensure row exists
+            cur.execute("SELECT id FROM twitch_tokens WHERE user_id=? LIMIT 1", (user_id,))
+            row = cur.fetchone()
+            if row:
+                cur.execute("""UPDATE twitch_tokens
+                               SET twitch_userid=?, twitch_login=?, twitch_displayname=?,
+                                   access_token=NULL, refresh_token=NULL, expires_in=NULL
+                               WHERE user_id=?""",
+                            (str(token.userid), token.loginname, token.displayname, user_id))
+            else:
+                cur.execute("""INSERT INTO twitch_tokens
+                               (user_id, twitch_userid, twitch_login, twitch_displayname, access_token, refresh_token, expires_in)
+                               VALUES (?,?,?,?, NULL, NULL, NULL)""",
+                            (user_id, str(token.userid), token.loginname, token.displayname))
+
+            db.commit()
 
     # ====================
     #   LOGIN FLOW
@@ -189,17 +188,15 @@ class LoginWindow(ctk.CTk):
             messagebox.showerror("Fehler", "Felder dürfen nicht leer sein.")
             return
 
-        def worker():
-            try:
-                session = self._login_and_build_session(username, pw)
-                # Dashboard NICHT im Worker-Thread starten (Tkinter ist nicht thread-safe).
-                # Stattdessen Session merken und mainloop sauber beenden.
-                self.after(0, lambda s=session: self._on_login_success(s))
-            except Exception as e:
-                msg = str(e)
-                self.after(0, lambda msg=msg: messagebox.showerror("Login fehlgeschlagen", msg))
-
-        threading.Thread(target=worker, daemon=True).start()
+        # Dashboard NICHT im Worker-Thread starten (Tkinter ist nicht thread-safe).
+        # on_done läuft im MAIN-Thread; mehrfaches Klicken startet keinen zweiten Login.
+        background.submit(
+            self._login_and_build_session, username, pw,
+            on_done=self._on_login_success,
+            on_error=lambda e: messagebox.showerror("Login fehlgeschlagen", str(e)),
+            priority=background.PRIORITY_HIGH,
+            key="login",
+        )
 
     def _on_login_success(self, session: SessionUser):
         """Wird im MAIN-Thread aufgerufen."""
@@ -213,124 +210,118 @@ class LoginWindow(ctk.CTk):
         self.after(0, self.quit)
 
     def _login_and_build_session(self, username: str, pw: str) -> SessionUser:
-        db = self._db()
-        cur = db.cursor(dictionary=True)
-
-        cur.execute("SELECT * FROM users WHERE username=? LIMIT 1", (username,))
-        user = cur.fetchone()
-        if not user:
-            db.close()
-            raise RuntimeError("Benutzerdaten falsch.")
-
-        ok, upgraded = verify_password(pw, user["password_hash"])
-        if not ok:
-            db.close()
-            raise RuntimeError("Benutzerdaten falsch.")
-
-        # migrate hash if needed
-        if upgraded:
-            cur.execute("UPDATE users SET password_hash=? WHERE user_id=?", (upgraded, user["user_id"]))
-            db.commit()
+        with self._db() as db:
+            cur = db.cursor(dictionary=True)
+
+            cur.execute("SELECT * FROM users WHERE username=? LIMIT 1", (username,))
+            user = cur.fetchone()
+            if not user:
+                raise RuntimeError("Benutzerdaten falsch.")
+
+            ok, upgraded = verify_password(pw, user["password_hash"])
+            if not ok:
+                raise RuntimeError("Benutzerdaten falsch.")
+
+            # migrate hash if needed
+            if upgraded:
+                cur.execute("UPDATE users SET password_hash=? WHERE user_id=?", (upgraded, user["user_id"]))
+                db.commit()
+
+            # role id (1/2/3)
+            cur.execute("SELECT role_id FROM user_roles WHERE user_id=? LIMIT 1", (user["user_id"],))
+            role_row = cur.fetchone()
+            if not role_row:
+                raise RuntimeError("Dem Benutzer ist keine Rolle zugewiesen.")
+            role_id = int(role_row["role_id"])
+
+            # streamer row (optional)
+            cur.execute("SELECT * FROM streamer WHERE user_id=? LIMIT 1", (user["user_id"],))
+            streamer_row = cur.fetchone()
+
+            # Für Moderator/Manager: Streamer-Zuordnung über Mapping-Tabellen (falls kein eigener Streamer-Account)
+            if streamer_row is None and role_id in (2, 3):
+                if role_id == 2:
+                    cur.execute(
+                        """SELECT s.*
+                           FROM streamer s
+                           JOIN streamer_moderator sm ON sm.streamer_id = s.streamer_id
+                           JOIN moderator m ON m.moderator_id = sm.moderator_id
+                           WHERE m.user_id = ?
+                           LIMIT 1""",
+                        (user["user_id"],)
+                    )
+                    streamer_row = cur.fetchone()
+                elif role_id == 3:
+                    # Manager -> streamer_manager
+                    cur.execute(
+                        """SELECT s.*
+                           FROM streamer s
+                           JOIN streamer_manager smg ON smg.streamer_id = s.streamer_id
+                           WHERE smg.user_id = ?
+                           LIMIT 1""",
+                        (user["user_id"],)
+                    )
+                    streamer_row = cur.fetchone()
 
-        # role id (1/2/3)
-        cur.execute("SELECT role_id FROM user_roles WHERE user_id=? LIMIT 1", (user["user_id"],))
-        role_row = cur.fetchone()
-        if not role_row:
-            db.close()
-            raise RuntimeError("Dem Benutzer ist keine Rolle zugewiesen.")
-        role_id = int(role_row["role_id"])
-
-        # streamer row (optional)
-        cur.execute("SELECT * FROM streamer WHERE user_id=? LIMIT 1", (user["user_id"],))
-        streamer_row = cur.fetchone()
-
-        # Für Moderator/Manager: Streamer-Zuordnung über Mapping-Tabellen (falls kein eigener Streamer-Account)
-        if streamer_row is None and role_id in (2, 3):
-            if role_id == 2:
-                cur.execute(
-                    """SELECT s.*
-                       FROM streamer s
-                       JOIN streamer_moderator sm ON sm.streamer_id = s.streamer_id
-                       JOIN moderator m ON m.moderator_id = sm.moderator_id
-                       WHERE m.user_id = ?
-                       LIMIT 1""",
-                    (user["user_id"],)
-                )
-                streamer_row = cur.fetchone()
-            elif role_id == 3:
-                # Manager -> streamer_manager
+        
+            # Ergänzung: Streamer-Twitch-ID (broadcaster_id) für Moderator/Manager-Aktionen
+            # Falls dem Streamer ein User-Account zugeordnet ist, holen wir dessen Twitch-Identity
+            if streamer_row is not None and streamer_row.get("user_id"):
                 cur.execute(
-                    """SELECT s.*
-                       FROM streamer s
-                       JOIN streamer_manager smg ON smg.streamer_id = s.streamer_id
-                       WHERE smg.user_id = ?
-                       LIMIT 1""",
-                    (user["user_id"],)
+                    "SELECT twitch_userid, twitch_login, twitch_displayname FROM twitch_tokens WHERE user_id=? LIMIT 1",
+                    (streamer_row["user_id"],)
                 )
-                streamer_row = cur.fetchone()
-
-        
-        # Ergänzung: Streamer-Twitch-ID (broadcaster_id) für Moderator/Manager-Aktionen
-        # Falls dem Streamer ein User-Account zugeordnet ist, holen wir dessen Twitch-Identity
-        if streamer_row is not None and streamer_row.get("user_id"):
-            cur.execute(
-                "SELECT twitch_userid, twitch_login, twitch_displayname FROM twitch_tokens WHERE user_id=? LIMIT 1",
-                (streamer_row["user_id"],)
+                s_trow = cur.fetchone()
+                if s_trow:
+                    streamer_row["twitch_userid"] = s_trow.get("twitch_userid")
+                    streamer_row["twitch_login"] = s_trow.get("twitch_login")
+                    streamer_row["twitch_displayname"] = s_trow.get("twitch_displayname")
+                else:
+                    streamer_row["twitch_userid"] = None
+                    streamer_row["twitch_login"] = None
+                    streamer_row["twitch_displayname"] = None
+
+            # twitch identity row (optional)
+            cur.execute("SELECT twitch_userid, twitch_login, twitch_displayname FROM twitch_tokens WHERE user_id=? LIMIT 1", (user["user_id"],))
+            trow = cur.fetchone()
+            twitch_identity = TwitchIdentity(
+                userid=(trow["twitch_userid"] if trow else None),
+                login=(trow["twitch_login"] if trow else None),
+                displayname=(trow["twitch_displayname"] if trow else None),
             )
-            s_trow = cur.fetchone()
-            if s_trow:
-                streamer_row["twitch_userid"] = s_trow.get("twitch_userid")
-                streamer_row["twitch_login"] = s_trow.get("twitch_login")
-                streamer_row["twitch_displayname"] = s_trow.get("twitch_displayname")
-            else:
-                streamer_row["twitch_userid"] = None
-                streamer_row["twitch_login"] = None
-                streamer_row["twitch_displayname"] = None
-
-# twitch identity row (optional)
-        cur.execute("SELECT twitch_userid, twitch_login, twitch_displayname FROM twitch_tokens WHERE user_id=? LIMIT 1", (user["user_id"],))
-        trow = cur.fetchone()
-        twitch_identity = TwitchIdentity(
-            userid=(trow["twitch_userid"] if trow else None),
-            login=(trow["twitch_login"] if trow else None),
-            displayname=(trow["twitch_displayname"] if trow else None),
-        )
-
-        # Twitch login for Streamer & Moderator
-        twitch_token = None
-        if role_id in (1, 2):
-            twitch_token = oauth.gen()  # caches in oauth module; no DB storage
-            # identity binding / verification
-            incoming_uid = str(twitch_token.userid)
 
-            if twitch_identity.userid and twitch_identity.userid != incoming_uid:
-                db.close()
-                raise RuntimeError("Twitch-Account stimmt nicht mit dem zugewiesenen Benutzer überein.")
-
-            # upsert identity without tokens
-            if trow:
-                cur.execute("""UPDATE twitch_tokens
-                               SET twitch_userid=?, twitch_login=?, twitch_displayname=?,
-                                   access_token=NULL, refresh_token=NULL, expires_in=NULL
-                               WHERE user_id=?""",
-                            (incoming_uid, twitch_token.loginname, twitch_token.displayname, user["user_id"]))
-            else:
-                cur.execute("""INSERT INTO twitch_tokens
-                               (user_id, twitch_userid, twitch_login, twitch_displayname, access_token, refresh_token, expires_in)
-                               VALUES (?,?,?,?, NULL, NULL, NULL)""",
-                            (user["user_id"], incoming_uid, twitch_token.loginname, twitch_token.displayname))
-            db.commit()
-            twitch_identity = TwitchIdentity(userid=incoming_uid, login=twitch_token.loginname, displayname=twitch_token.displayname)
-
-        db.close()
-
-        return SessionUser(
-            user_row=user,
-            role_id=role_id,
-            streamer_row=streamer_row,
-            twitch_identity=twitch_identity,
-            twitch_token=twitch_token
-        )
+            # Twitch login for Streamer & Moderator
+            twitch_token = None
+            if role_id in (1, 2):
+                twitch_token = oauth.gen()  # caches in oauth module; no DB storage
+                # identity binding / verification
+                incoming_uid = str(twitch_token.userid)
+
+                if twitch_identity.userid and twitch_identity.userid != incoming_uid:
+                    raise RuntimeError("Twitch-Account stimmt nicht mit dem zugewiesenen Benutzer überein.")
+
+                # upsert identity without tokens
+                if trow:
+                    cur.execute("""UPDATE twitch_tokens
+                                   SET twitch_userid=?, twitch_login=?, twitch_displayname=?,
+                                       access_token=NULL, refresh_token=NULL, expires_in=NULL
+                                   WHERE user_id=?""",
+                                (incoming_uid, twitch_token.loginname, twitch_token.displayname, user["user_id"]))
+                else:
+                    cur.execute("""INSERT INTO twitch_tokens
+                                   (user_id, twitch_userid, twitch_login, twitch_displayname, access_token, refresh_token, expires_in)
+                                   VALUES (?,?,?,?, NULL, NULL, NULL)""",
+                                (user["user_id"], incoming_uid, twitch_token.loginname, twitch_token.displayname))
+                db.commit()
+                twitch_identity = TwitchIdentity(userid=incoming_uid, login=twitch_token.loginname, displayname=twitch_token.displayname)
+
+            return SessionUser(
+                user_row=user,
+                role_id=role_id,
+                streamer_row=streamer_row,
+                twitch_identity=twitch_identity,
+                twitch_token=twitch_token
+            )
 
 
 if __name__ == "__main__":
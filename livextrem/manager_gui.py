@@ -1,11 +1,17 @@
 import customtkinter as ctk
-from config import Config
 import datetime
 import calendar
 import json
 import os
+import threading
+import time
+from collections import OrderedDict
 from PIL import Image   # für das Logo-Bild
-import mysql.connector  # <-- für die DB-Verbindung
+from contextlib import contextmanager
+import mariadb
+import background
+import db_pool  # <-- gemeinsamer Connection-Pool
+from render_scheduler import RenderScheduler
 
 
 # --- KONFIGURATION & FARBEN (Dein Design) ---
@@ -49,6 +55,19 @@ STREAMER_COLOR_CHOICES = {
 
 # --- DATENMODEL & PERSISTENZ (MySQL/MariaDB) ---
 
+CALENDAR_SLOTS = 6 * 7  # maximal 6 Wochen pro Monatsansicht
+
+
+class _DayCell:
+    """Eine feste Tageszelle im Kalender-Raster (Button wird wiederverwendet)."""
+    __slots__ = ("button", "date_key", "style")
+
+    def __init__(self):
+        self.button = None
+        self.date_key = None   # Ziel des Klicks (None = leere Zelle)
+        self.style = None      # zuletzt gesetzte Darstellung (None = ausgeblendet)
+
+
 class DataManager:
     """
     DataManager mit echter MySQL/MariaDB-Anbindung.
@@ -58,88 +77,159 @@ class DataManager:
       - streamer_manager
     """
 
+    MONTH_CACHE_SIZE = 6     # so viele Monate bleiben im Speicher (LRU)
+    MONTH_CACHE_TTL = 120    # Sekunden – Änderungen anderer Clients werden danach sichtbar
+    PERMISSION_CACHE_TTL = 60  # Sekunden – Sicherheitsnetz für Zuordnungsänderungen anderer Clients
+
     def __init__(self, data_file, manager_user_id=None, context_streamer_id=None):
         self.manager_user_id = int(manager_user_id) if manager_user_id else None
         self.context_streamer_id = int(context_streamer_id) if context_streamer_id else None
         # data_file bleibt nur wegen der Signatur, wird nicht genutzt.
         self.data_file = data_file
-        self._connect_db()
 
-    def _connect_db(self):
-        """Stellt die Verbindung zur Datenbank her."""
-        self.conn = mysql.connector.connect(host=Config.DB_HOST, user=Config.DB_USER, password=Config.DB_PASS, database=Config.DB_NAME, use_pure=True)
-        self.cursor = self.conn.cursor(dictionary=True)
+        # Monats-Cache: (jahr, monat) -> (geladen_um, {date_key: [events]})
+        self._month_cache = OrderedDict()
+        self._month_cache_lock = threading.Lock()
+        self._month_cache_gen = 0   # erhöht bei jeder Invalidierung
+
+        # Berechtigungs-Cache (siehe _permissions)
+        self._perm_lock = threading.RLock()
+        self._perm_managed = None
+        self._perm_events = {}
+        self._perm_loaded_at = 0.0
+
+    # ----------- DB-HILFEN (Verbindungen kommen aus db_pool) -----------
+
+    @contextmanager
+    def _cursor(self, commit=False):
+        """Dictionary-Cursor auf einer geliehenen Pool-Verbindung.
+
+        Verschachtelte Aufrufe im selben Thread teilen sich die Verbindung,
+        committet wird nur dort, wo commit=True gesetzt ist.
+        """
+        with db_pool.connection() as conn:
+            cur = conn.cursor(dictionary=True)
+            try:
+                yield cur
+                if commit:
+                    conn.commit()
+            finally:
+                cur.close()
+
+    def _fetchall(self, query, params=()):
+        with self._cursor() as cur:
+            cur.execute(query, params)
+            return cur.fetchall()
+
+    def _fetchone(self, query, params=()):
+        with self._cursor() as cur:
+            cur.execute(query, params)
+            return cur.fetchone()
 
     # ----------- BERECHTIGUNGS-/ZUORDNUNGS-HILFEN -----------
 
     def _is_manager_bound(self):
         return self.manager_user_id is not None or self.context_streamer_id is not None
 
+    # Berechtigungs-Cache: zugeordnete Streamer + Event -> Streamer. Wird beim
+    # ersten Zugriff komplett geladen, nach eigenen Zuordnungsänderungen explizit
+    # verworfen und spätestens nach PERMISSION_CACHE_TTL neu geladen.
+
+    def _permissions(self):
+        """(frozenset zugeordneter streamer_ids, {plan_id: streamer_id}) – lädt bei Bedarf."""
+        with self._perm_lock:
+            if (self._perm_managed is not None
+                    and time.monotonic() - self._perm_loaded_at <= self.PERMISSION_CACHE_TTL):
+                return self._perm_managed, self._perm_events
+
+            if self.context_streamer_id is not None:
+                managed = frozenset([int(self.context_streamer_id)])
+            else:
+                rows = self._fetchall(
+                    "SELECT streamer_id FROM streamer_manager WHERE user_id = %s",
+                    (self.manager_user_id,)
+                )
+                managed = frozenset(int(row["streamer_id"]) for row in rows if row.get("streamer_id") is not None)
+
+            events = {}
+            if managed:
+                placeholders = ", ".join(["%s"] * len(managed))
+                rows = self._fetchall(
+                    f"SELECT plan_id, streamer_id FROM stream_planung WHERE streamer_id IN ({placeholders})",
+                    tuple(managed)
+                )
+                events = {int(row["plan_id"]): int(row["streamer_id"]) for row in rows}
+
+            self._perm_managed = managed
+            self._perm_events = events
+            self._perm_loaded_at = time.monotonic()
+            return managed, events
+
+    def invalidate_permission_cache(self):
+        with self._perm_lock:
+            self._perm_managed = None
+            self._perm_events = {}
+
+    def _remember_event(self, event_id, streamer_id):
+        with self._perm_lock:
+            if self._perm_managed is not None:
+                if streamer_id is None:
+                    self._perm_events.pop(int(event_id), None)
+                else:
+                    self._perm_events[int(event_id)] = int(streamer_id)
+
     def get_managed_streamer_ids(self):
-        if self.context_streamer_id is not None:
-            return [self.context_streamer_id]
         if not self._is_manager_bound():
             return []
-        self.cursor.execute(
-            "SELECT streamer_id FROM streamer_manager WHERE user_id = %s",
-            (self.manager_user_id,)
-        )
-        return [int(row["streamer_id"]) for row in self.cursor.fetchall() if row.get("streamer_id") is not None]
+        managed, _events = self._permissions()
+        return sorted(managed)
 
     def manager_has_streamer_access(self, streamer_id):
-        if self.context_streamer_id is not None:
-            return int(streamer_id) == int(self.context_streamer_id)
         if not self._is_manager_bound():
             return True
-        self.cursor.execute(
-            "SELECT 1 FROM streamer_manager WHERE user_id = %s AND streamer_id = %s LIMIT 1",
-            (self.manager_user_id, int(streamer_id))
-        )
-        return self.cursor.fetchone() is not None
+        managed, _events = self._permissions()
+        return int(streamer_id) in managed
 
     def manager_has_event_access(self, event_id):
-        if self.context_streamer_id is not None:
-            self.cursor.execute(
-                "SELECT 1 FROM stream_planung WHERE plan_id = %s AND streamer_id = %s LIMIT 1",
-                (int(event_id), self.context_streamer_id)
-            )
-            return self.cursor.fetchone() is not None
         if not self._is_manager_bound():
             return True
-        self.cursor.execute(
-            """
-            SELECT 1
-            FROM stream_planung sp
-            JOIN streamer_manager smg ON smg.streamer_id = sp.streamer_id
-            WHERE sp.plan_id = %s
-              AND smg.user_id = %s
-            LIMIT 1
-            """,
-            (int(event_id), self.manager_user_id)
-        )
-        return self.cursor.fetchone() is not None
+        managed, events = self._permissions()
+        streamer_id = events.get(int(event_id))
+        if streamer_id is None:
+            # Von einem anderen Client angelegt (oder nicht zugeordnet) -> einzeln nachsehen
+            row = self._fetchone(
+                "SELECT streamer_id FROM stream_planung WHERE plan_id = %s",
+                (int(event_id),)
+            )
+            if row is None:
+                return False
+            streamer_id = int(row["streamer_id"])
+            if streamer_id in managed:
+                self._remember_event(event_id, streamer_id)
+        return streamer_id in managed
 
     def _ensure_streamer_mapping(self, streamer_id):
         if self.context_streamer_id is not None:
             return
         if not self._is_manager_bound():
             return
-        self.cursor.execute(
+        if not self._fetchone(
             "SELECT 1 FROM streamer_manager WHERE streamer_id = %s AND user_id = %s LIMIT 1",
             (int(streamer_id), self.manager_user_id)
-        )
-        if not self.cursor.fetchone():
-            self.cursor.execute(
-                "INSERT INTO streamer_manager (streamer_id, user_id) VALUES (%s, %s)",
-                (int(streamer_id), self.manager_user_id)
-            )
+        ):
+            with self._cursor() as cur:
+                cur.execute(
+                    "INSERT INTO streamer_manager (streamer_id, user_id) VALUES (%s, %s)",
+                    (int(streamer_id), self.manager_user_id)
+                )
+            self.invalidate_permission_cache()
 
     def get_protected_streamer_ids(self):
         """Streamer, die im aktuellen Kontext niemals archiviert werden dürfen."""
-        if self.context_streamer_id is not None:
-            return {int(self.context_streamer_id)}
-        managed_ids = self.get_managed_streamer_ids()
-        return {int(streamer_id) for streamer_id in managed_ids}
+        if not self._is_manager_bound():
+            return set()
+        managed, _events = self._permissions()
+        return set(managed)
 
     def is_protected_streamer(self, streamer_id):
         try:
@@ -155,7 +245,7 @@ class DataManager:
     def get_all_streamers(self):
         # Für Streamer-im-Manager-Kontext: nur den eigenen Streamer laden
         if self.context_streamer_id is not None:
-            self.cursor.execute("""
+            return self._fetchall("""
             SELECT 
                 streamer_id AS id,
                 name,
@@ -166,11 +256,10 @@ class DataManager:
               AND status <> 'Archiviert'
             ORDER BY name
             """, (self.context_streamer_id,))
-            return self.cursor.fetchall()
 
         # Für Manager: nur zugeordnete Streamer laden
         if self.manager_user_id:
-            self.cursor.execute("""
+            return self._fetchall("""
             SELECT 
                 s.streamer_id AS id,
                 s.name,
@@ -182,10 +271,9 @@ class DataManager:
               AND s.status <> 'Archiviert'
             ORDER BY s.name
             """, (self.manager_user_id,))
-            return self.cursor.fetchall()
 
         # Fallback: alle Streamer
-        self.cursor.execute("""
+        return self._fetchall("""
         SELECT 
             streamer_id AS id,
             name,
@@ -195,22 +283,23 @@ class DataManager:
         WHERE status <> 'Archiviert'      -- Archivierte ausblenden
         ORDER BY name
         """)
-        return self.cursor.fetchall()
 
 
 
 
     def add_streamer(self, name, status='Aktiv', color='#34C759'):
         """Neuen Streamer in der DB anlegen und bei Managern direkt zuordnen."""
-        self.cursor.execute("""
-            INSERT INTO streamer (name, plattform, email, status, farbe)
-            VALUES (%s, %s, %s, %s, %s)
-        """, (name, '', '', status, color))
+        with self._cursor(commit=True) as cur:
+            cur.execute("""
+                INSERT INTO streamer (name, plattform, email, status, farbe)
+                VALUES (%s, %s, %s, %s, %s)
+            """, (name, '', '', status, color))
 
-        new_id = self.cursor.lastrowid
-        self._ensure_streamer_mapping(new_id)
-        self.conn.commit()
+            new_id = cur.lastrowid
+            self._ensure_streamer_mapping(new_id)
 
+        # Nach dem Commit nochmals verwerfen, damit niemand den Stand vor dem Commit behält
+        self.invalidate_permission_cache()
         return {'id': new_id, 'name': name, 'status': status, 'color': color}
 
     def update_streamer(self, streamer_id, name, status, color):
@@ -220,28 +309,35 @@ class DataManager:
         if status == 'Archiviert' and self.is_protected_streamer(streamer_id):
             raise PermissionError("Der verantwortliche Streamer darf in diesem Kontext nicht archiviert werden.")
 
-        self.cursor.execute("""
-            UPDATE streamer
-            SET name = %s,
-                status = %s,
-                farbe = %s
-            WHERE streamer_id = %s
-        """, (name, status, color, streamer_id))
-        self.conn.commit()
-        return self.cursor.rowcount > 0
+        with self._cursor(commit=True) as cur:
+            cur.execute("""
+                UPDATE streamer
+                SET name = %s,
+                    status = %s,
+                    farbe = %s
+                WHERE streamer_id = %s
+            """, (name, status, color, streamer_id))
+            changed = cur.rowcount > 0
+        # Name/Farbe stecken in den gecachten Events aller Monate
+        if changed:
+            self.invalidate_month_cache()
+        return changed
 
     def delete_streamer(self, streamer_id):
         """Streamer NICHT löschen, sondern als 'Archiviert' markieren."""
         if not self.can_archive_streamer(streamer_id):
             return False
 
-        self.cursor.execute("""
-            UPDATE streamer
-            SET status = 'Archiviert'
-            WHERE streamer_id = %s
-        """, (streamer_id,))
-        self.conn.commit()
-        return self.cursor.rowcount > 0
+        with self._cursor(commit=True) as cur:
+            cur.execute("""
+                UPDATE streamer
+                SET status = 'Archiviert'
+                WHERE streamer_id = %s
+            """, (streamer_id,))
+            changed = cur.rowcount > 0
+        if changed:
+            self.invalidate_month_cache()
+        return changed
 
 
     # ------------ EVENT-FUNKTIONEN (stream_planung) ------------
@@ -251,16 +347,17 @@ class DataManager:
             raise PermissionError("Kein Zugriff auf den ausgewählten Streamer.")
 
         try:
-            self.cursor.execute("""
-                INSERT INTO stream_planung 
-                (streamer_id, content_id, datum, thema, status)
-                VALUES (%s, NULL, %s, %s, 'geplant')
-            """, (streamer_id, date_key + " 00:00:00", title))
+            with self._cursor(commit=True) as cur:
+                cur.execute("""
+                    INSERT INTO stream_planung 
+                    (streamer_id, content_id, datum, thema, status)
+                    VALUES (%s, NULL, %s, %s, 'geplant')
+                """, (streamer_id, date_key + " 00:00:00", title))
 
-            self.conn.commit()
-
-            plan_id = self.cursor.lastrowid
+                plan_id = cur.lastrowid
 
+            self.invalidate_month_cache(date_key)
+            self._remember_event(plan_id, streamer_id)
             return {
                 'id': plan_id,
                 'title': title,
@@ -270,7 +367,7 @@ class DataManager:
                 'date_key': date_key
             }
 
-        except mysql.connector.Error as err:
+        except mariadb.Error as err:
             print("DB-Fehler beim Event speichern:", err)
             raise
 
@@ -279,12 +376,17 @@ class DataManager:
         if not self.manager_has_event_access(event_id):
             return False
 
-        self.cursor.execute(
-            "DELETE FROM stream_planung WHERE plan_id = %s",
-            (event_id,)
-        )
-        self.conn.commit()
-        return self.cursor.rowcount > 0
+        with self._cursor(commit=True) as cur:
+            cur.execute(
+                "DELETE FROM stream_planung WHERE plan_id = %s",
+                (event_id,)
+            )
+            deleted = cur.rowcount > 0
+        if deleted:
+            self._remember_event(event_id, None)
+            # Ohne date_key ist der Monat unbekannt -> ganzer Cache wird verworfen
+            self.invalidate_month_cache(date_key)
+        return deleted
 
     def update_event(self, event_id, old_date_key, new_date_key,
                      new_title, new_streamer_id, new_streamer_name):
@@ -296,16 +398,22 @@ class DataManager:
 
         neues_datum = new_date_key + " 00:00:00"
 
-        self.cursor.execute("""
-            UPDATE stream_planung
-            SET thema = %s,
-                streamer_id = %s,
-                datum = %s
-            WHERE plan_id = %s
-        """, (new_title, new_streamer_id, neues_datum, event_id))
-
-        self.conn.commit()
-        return self.cursor.rowcount > 0
+        with self._cursor(commit=True) as cur:
+            cur.execute("""
+                UPDATE stream_planung
+                SET thema = %s,
+                    streamer_id = %s,
+                    datum = %s
+                WHERE plan_id = %s
+            """, (new_title, new_streamer_id, neues_datum, event_id))
+            changed = cur.rowcount > 0
+        if changed:
+            self._remember_event(event_id, new_streamer_id)
+            if old_date_key:
+                self.invalidate_month_cache(old_date_key, new_date_key)
+            else:
+                self.invalidate_month_cache()
+        return changed
 
     def get_event_by_id(self, event_id, date_key):
         """Ein einzelnes Event über seine ID holen."""
@@ -332,8 +440,7 @@ class DataManager:
             if self._is_manager_bound():
                 query += " AND smg.user_id = %s"
                 params.append(self.manager_user_id)
-        self.cursor.execute(query, tuple(params))
-        row = self.cursor.fetchone()
+        row = self._fetchone(query, tuple(params))
         if row:
             if hasattr(row['createdAt'], 'isoformat'):
                 row['createdAt'] = row['createdAt'].isoformat()
@@ -343,7 +450,20 @@ class DataManager:
 
     def get_events_for_day(self, date_key):
         """Alle Events für einen bestimmten Tag (YYYY-MM-DD)."""
-        params = [date_key]
+        # Halboffener Bereich statt DATE(sp.datum) = ..., damit der Index auf datum greift
+        day = datetime.date.fromisoformat(date_key)
+        return self.get_events_for_range(day, day + datetime.timedelta(days=1))
+
+    def get_events_for_range(self, start, end):
+        """Alle Events im halboffenen Zeitraum [start, end) – eine Abfrage statt einer pro Tag.
+
+        start/end: datetime.date oder 'YYYY-MM-DD'.
+        """
+        if isinstance(start, datetime.date):
+            start = start.isoformat()
+        if isinstance(end, datetime.date):
+            end = end.isoformat()
+        params = [start + " 00:00:00", end + " 00:00:00"]
         query = """
             SELECT 
                 sp.plan_id AS id,
@@ -357,18 +477,17 @@ class DataManager:
             JOIN streamer s ON sp.streamer_id = s.streamer_id
         """
         if self.context_streamer_id is not None:
-            query += " WHERE DATE(sp.datum) = %s AND sp.streamer_id = %s"
+            query += " WHERE sp.datum >= %s AND sp.datum < %s AND sp.streamer_id = %s"
             params.append(self.context_streamer_id)
         else:
             if self._is_manager_bound():
                 query += " JOIN streamer_manager smg ON smg.streamer_id = sp.streamer_id "
-            query += " WHERE DATE(sp.datum) = %s"
+            query += " WHERE sp.datum >= %s AND sp.datum < %s"
             if self._is_manager_bound():
                 query += " AND smg.user_id = %s"
                 params.append(self.manager_user_id)
         query += " ORDER BY sp.datum"
-        self.cursor.execute(query, tuple(params))
-        rows = self.cursor.fetchall()
+        rows = self._fetchall(query, tuple(params))
         for row in rows:
             if hasattr(row['createdAt'], 'isoformat'):
                 row['createdAt'] = row['createdAt'].isoformat()
@@ -376,6 +495,75 @@ class DataManager:
                 row['date_key'] = row['date_key'].isoformat()
         return rows
 
+    @staticmethod
+    def index_events_by_day(rows):
+        """{date_key: [events]} – Reihenfolge innerhalb eines Tages bleibt erhalten."""
+        index = {}
+        for row in rows:
+            index.setdefault(row['date_key'], []).append(row)
+        return index
+
+    # ------------ MONATS-CACHE (Kalender) ------------
+
+    @staticmethod
+    def _month_key(value):
+        """(jahr, monat) aus 'YYYY-MM-DD', datetime.date oder (jahr, monat)."""
+        if isinstance(value, tuple):
+            return int(value[0]), int(value[1])
+        if isinstance(value, datetime.date):
+            return value.year, value.month
+        return int(value[0:4]), int(value[5:7])
+
+    def peek_month(self, year, month):
+        """Gecachter Index {date_key: [events]} des Monats oder None (ohne DB-Zugriff)."""
+        key = (int(year), int(month))
+        with self._month_cache_lock:
+            entry = self._month_cache.get(key)
+            if entry is None:
+                return None
+            loaded_at, index = entry
+            if time.monotonic() - loaded_at > self.MONTH_CACHE_TTL:
+                del self._month_cache[key]
+                return None
+            self._month_cache.move_to_end(key)
+            return index
+
+    def get_events_for_month(self, year, month):
+        """Alle Events eines Monats als {date_key: [events]} – aus dem Cache oder mit einer Abfrage.
+
+        Thread-sicher (wird auch zum Vorausladen aus Hintergrund-Workern aufgerufen).
+        """
+        index = self.peek_month(year, month)
+        if index is not None:
+            return index
+
+        key = (int(year), int(month))
+        with self._month_cache_lock:
+            gen = self._month_cache_gen
+        start = datetime.date(key[0], key[1], 1)
+        end = datetime.date(key[0] + key[1] // 12, key[1] % 12 + 1, 1)
+        index = self.index_events_by_day(self.get_events_for_range(start, end))
+
+        with self._month_cache_lock:
+            # Während der Abfrage geschrieben? Dann nicht das alte Ergebnis cachen
+            if gen == self._month_cache_gen:
+                self._month_cache[key] = (time.monotonic(), index)
+                self._month_cache.move_to_end(key)
+                while len(self._month_cache) > self.MONTH_CACHE_SIZE:
+                    self._month_cache.popitem(last=False)
+        return index
+
+    def invalidate_month_cache(self, *dates):
+        """Verwirft die Monate der angegebenen Daten (ohne gültige Angabe: den ganzen Cache)."""
+        dates = [value for value in dates if value]
+        with self._month_cache_lock:
+            self._month_cache_gen += 1
+            if not dates:
+                self._month_cache.clear()
+                return
+            for value in dates:
+                self._month_cache.pop(self._month_key(value), None)
+
     def get_all_events_sorted(self):
         """Alle Events, sortiert nach Datum."""
         params = []
@@ -398,8 +586,7 @@ class DataManager:
             query += " JOIN streamer_manager smg ON smg.streamer_id = sp.streamer_id WHERE smg.user_id = %s"
             params.append(self.manager_user_id)
         query += " ORDER BY sp.datum"
-        self.cursor.execute(query, tuple(params))
-        rows = self.cursor.fetchall()
+        rows = self._fetchall(query, tuple(params))
         for row in rows:
             if hasattr(row['createdAt'], 'isoformat'):
                 row['createdAt'] = row['createdAt'].isoformat()
@@ -433,8 +620,7 @@ class DataManager:
                 query += " AND smg.user_id = %s"
                 params.append(self.manager_user_id)
         query += " ORDER BY sp.datum LIMIT 5"
-        self.cursor.execute(query, tuple(params))
-        rows = self.cursor.fetchall()
+        rows = self._fetchall(query, tuple(params))
         for row in rows:
             if hasattr(row['createdAt'], 'isoformat'):
                 row['createdAt'] = row['createdAt'].isoformat()
@@ -475,17 +661,18 @@ class ManagerDashboard(ctk.CTk):
         self.main_content_area.grid_columnconfigure(0, weight=1)
         self.main_content_area.grid_rowconfigure(1, weight=1)
 
+        # Fasst den ersten Render und das direkt folgende Map-Event zu einem Render zusammen
+        self._render_scheduler = RenderScheduler(self)
+        # Ergebnisse der Hintergrund-Worker kommen über die UI-Queue zurück
+        background.attach_ui(self)
         self.bind("<Map>", self._on_dashboard_mapped)
-        self.show_view("Startseite")
+        self._render_scheduler.request("view", self.refresh_current_view)
 
     # --- VIEW MANAGER ---
     def _on_dashboard_mapped(self, event=None):
         if event is not None and event.widget is not self:
             return
-        try:
-            self.after(0, self.refresh_current_view)
-        except Exception:
-            pass
+        self._render_scheduler.request("view", self.refresh_current_view)
 
     def refresh_current_view(self):
         self.show_view(getattr(self, "current_view", "Startseite"))
@@ -503,14 +690,6 @@ class ManagerDashboard(ctk.CTk):
     def show_view(self, view_name):
         self.current_view = view_name
 
-        try:
-            self.data_manager.conn.ping(reconnect=True, attempts=1, delay=0)
-        except Exception:
-            try:
-                self.data_manager._connect_db()
-            except Exception:
-                pass
-
         for widget in self.main_content_area.winfo_children():
             widget.destroy()
 
@@ -1346,6 +1525,108 @@ class ManagerDashboard(ctk.CTk):
         else:
             return "#FFD854"          # keine Farbe gesetzt -> Gelb
 
+    def _create_day_cells(self, container, full_view):
+        """Legt die festen 6x7 Tageszellen einmalig an; danach werden sie nur umkonfiguriert."""
+        cells = []
+        for slot in range(CALENDAR_SLOTS):
+            cell = _DayCell()
+            cell.button = ctk.CTkButton(
+                container,
+                text="",
+                command=lambda c=cell: self._show_event_dialog(c.date_key),
+                fg_color=UIConfig.PANEL_BG,
+                hover_color=UIConfig.PANEL_ACCENT,
+                text_color=UIConfig.TEXT_DARK,
+                height=70 if full_view else 40,
+                width=140 if full_view else 40,
+                corner_radius=8,
+                border_width=0,
+            )
+            cell.button.grid(row=1 + slot // 7, column=slot % 7, padx=2, pady=2, sticky="nsew")
+            cell.button.grid_remove()
+            cells.append(cell)
+        return cells
+
+    def _calendar_font(self, key):
+        fonts = getattr(self, "_calendar_fonts", None)
+        if fonts is None:
+            fonts = self._calendar_fonts = {
+                "full": ctk.CTkFont(size=14, weight="bold"),
+                "small": ctk.CTkFont(size=12),
+                "small_bold": ctk.CTkFont(size=12, weight="bold"),
+            }
+        return fonts[key]
+
+    def _day_cell_style(self, day, events_for_day, is_today, full_view):
+        """(text, fg, hover, text_color, font, border_width, border_color) für eine Tageszelle."""
+        has_events = bool(events_for_day)
+
+        # Basisfarben (heute vs normal)
+        fg_color = UIConfig.HEADER_ORANGE if is_today else UIConfig.PANEL_BG
+        text_color = UIConfig.TEXT_LIGHT if is_today else UIConfig.TEXT_DARK
+        hover_color = UIConfig.HEADER_HOVER if is_today else UIConfig.PANEL_ACCENT
+
+        # Border Standard
+        border_width = 0
+        border_color = None
+
+        # ---- Farben der Streamer analysieren ----
+        colors = []
+        if has_events:
+            for e in events_for_day:
+                c = e.get("streamerColor")
+                if c and c not in colors:
+                    colors.append(c)
+
+        has_multiple_colors = len(colors) > 1
+        single_color = colors[0] if len(colors) == 1 else None
+
+        # --------- GROSSER KALENDER (Kalender-View) ----------
+        if full_view:
+            text = f"{day}"
+            font = "full"
+
+            if has_events:
+                text += f"\n({len(events_for_day)} Events)"
+
+                if not is_today:
+                    if has_multiple_colors:
+                        # Mehrere Streamer -> weißer Button mit gelbem Rand
+                        fg_color = "white"
+                        text_color = "#000000"
+                        hover_color = "#F2F2F2"
+                        border_width = 3
+                        border_color = "#FFD854"
+                    else:
+                        # Genau ein Streamer -> Button in Streamerfarbe
+                        if single_color:
+                            fg_color = single_color
+                            text_color = "#000000"
+
+        # --------- KLEINER KALENDER (Dashboard) ----------
+        else:
+            text = f"{day}"
+            font = "small"
+
+            if has_events and not is_today:
+                if has_multiple_colors:
+                    # Mehrere Streamer -> weißer Button mit gelbem Rand
+                    fg_color = "white"
+                    hover_color = "white"
+                    text_color = "#000000"
+                    font = "small_bold"
+                    border_width = 2
+                    border_color = "#FFD854"
+                else:
+                    # Genau ein Streamer -> Button in Streamerfarbe
+                    if single_color:
+                        fg_color = single_color
+                        hover_color = single_color
+                        text_color = "#000000"
+                        font = "small_bold"
+
+        return (text, fg_color, hover_color, text_color, font, border_width, border_color)
+
     def update_calendar(self, full_view=False):
 
         # Welcher Kalender soll aktualisiert werden?
@@ -1353,158 +1634,76 @@ class ManagerDashboard(ctk.CTk):
             if not hasattr(self, 'calendar_grid_container_full') or not self.calendar_grid_container_full.winfo_exists():
                 return
             container = self.calendar_grid_container_full
-            day_buttons_list = self.calendar_day_buttons_full
+            day_cells = self.calendar_day_buttons_full
             month_label = self.month_year_label_full
         else:
             if not hasattr(self, 'calendar_grid_container') or not self.calendar_grid_container.winfo_exists():
                 return
             container = self.calendar_grid_container
-            day_buttons_list = self.calendar_day_buttons
+            day_cells = self.calendar_day_buttons
             month_label = self.month_year_label
 
-        # Alte Buttons löschen
-        for button in day_buttons_list:
-            button.destroy()
-        day_buttons_list.clear()
+        # Zellen nur beim ersten Mal bauen, danach wiederverwenden
+        if not day_cells:
+            day_cells.extend(self._create_day_cells(container, full_view))
 
         # Monat / Jahr setzen
         year, month = self.current_date.year, self.current_date.month
         month_label.configure(text=self.current_date.strftime("%B %Y"))
 
         cal = calendar.Calendar(firstweekday=calendar.MONDAY)
-        month_days = cal.itermonthdays2(year, month)
+        month_days = list(cal.itermonthdays(year, month))
+
+        # Alle Events des Monats aus dem Monats-Cache (höchstens EINE Abfrage), dann pro Tag nachschlagen
+        events_by_day = self.data_manager.get_events_for_month(year, month)
+        self._prefetch_adjacent_months(year, month)
 
-        row = 1
-        col = 0
         today_iso = datetime.date.today().isoformat()
 
-        for day, weekday in month_days:
-            # Leere Felder am Monatsanfang überspringen
+        for slot, cell in enumerate(day_cells):
+            day = month_days[slot] if slot < len(month_days) else 0
+
+            # Leere Felder vor/nach dem Monat ausblenden
             if day == 0:
-                col = (col + 1) % 7
-                if col == 0:
-                    row += 1
+                cell.date_key = None
+                if cell.style is not None:
+                    cell.button.grid_remove()
+                    cell.style = None
                 continue
 
-            date_obj = datetime.date(year, month, day)
-            date_key = date_obj.isoformat()
-
-            # Events für diesen Tag holen
-            events_for_day = self.data_manager.get_events_for_day(date_key)
-            has_events = bool(events_for_day)
-
-            # Heute?
-            is_today = date_key == today_iso
-
-            # Basisfarben (heute vs normal)
-            fg_color = UIConfig.HEADER_ORANGE if is_today else UIConfig.PANEL_BG
-            text_color = UIConfig.TEXT_LIGHT if is_today else UIConfig.TEXT_DARK
-            hover_color = UIConfig.HEADER_HOVER if is_today else UIConfig.PANEL_ACCENT
-
-            # Border Standard
-            border_width = 0
-            border_color = None
-
-            # ---- Farben der Streamer analysieren ----
-            colors = []
-            if has_events:
-                for e in events_for_day:
-                    c = e.get("streamerColor")
-                    if c and c not in colors:
-                        colors.append(c)
-
-            has_multiple_colors = len(colors) > 1
-            single_color = colors[0] if len(colors) == 1 else None
-
-            # --------- GROSSER KALENDER (Kalender-View) ----------
-            if full_view:
-                text = f"{day}"
-                height = 70
-
-                if has_events:
-                    text += f"\n({len(events_for_day)} Events)"
-
-                    if not is_today:
-                        if has_multiple_colors:
-                            # Mehrere Streamer -> weißer Button mit gelbem Rand
-                            fg_color = "white"
-                            text_color = "#000000"
-                            hover_color = "#F2F2F2"
-                            border_width = 3
-                            border_color = "#FFD854"
-                        else:
-                            # Genau ein Streamer -> Button in Streamerfarbe
-                            if single_color:
-                                fg_color = single_color
-                                text_color = "#000000"
-
-                day_button = ctk.CTkButton(
-                    container,
-                    text=text,
-                    command=lambda k=date_key: self._show_event_dialog(k),
-                    fg_color=fg_color,
-                    hover_color=hover_color,
-                    text_color=text_color,
-                    height=height,
-                    corner_radius=8,
-                    font=ctk.CTkFont(size=14, weight="bold"),
-                    border_width=border_width,
-                    border_color=border_color
-                )
-
-            # --------- KLEINER KALENDER (Dashboard) ----------
-            else:
-                text = f"{day}"
-
-                # Basis-Style
-                btn_fg_color = fg_color
-                btn_hover_color = hover_color
-                btn_text_color = text_color
-                btn_font = ctk.CTkFont(size=12)
-                btn_border_width = 0
-                btn_border_color = None
-
-                if has_events and not is_today:
-                    if has_multiple_colors:
-                        # Mehrere Streamer -> weißer Button mit gelbem Rand
-                        btn_fg_color = "white"
-                        btn_hover_color = "white"
-                        btn_text_color = "#000000"
-                        btn_font = ctk.CTkFont(size=12, weight="bold")
-                        btn_border_width = 2
-                        btn_border_color = "#FFD854"
-                    else:
-                        # Genau ein Streamer -> Button in Streamerfarbe
-                        if single_color:
-                            btn_fg_color = single_color
-                            btn_hover_color = single_color
-                            btn_text_color = "#000000"
-                            btn_font = ctk.CTkFont(size=12, weight="bold")
-
-                day_button = ctk.CTkButton(
-                    container,
-                    text=text,
-                    command=lambda k=date_key: self._show_event_dialog(k),
-                    fg_color=btn_fg_color,
-                    hover_color=btn_hover_color,
-                    text_color=btn_text_color,
-                    width=40,
-                    height=40,
-                    corner_radius=8,
-                    font=btn_font,
-                    border_width=btn_border_width,
-                    border_color=btn_border_color
-                )
-
-            # Button platzieren
-            day_button.grid(row=row, column=col, padx=2, pady=2, sticky="nsew")
-            day_buttons_list.append(day_button)
-
-            # Spalte/Zeile weiterschalten
-            col = (col + 1) % 7
-            if col == 0:
-                row += 1
+            date_key = datetime.date(year, month, day).isoformat()
+            cell.date_key = date_key
+            style = self._day_cell_style(day, events_by_day.get(date_key, []),
+                                         date_key == today_iso, full_view)
 
+            # Nur Zellen anfassen, deren Darstellung sich wirklich ändert
+            if style == cell.style:
+                continue
+            text, fg_color, hover_color, text_color, font, border_width, border_color = style
+            options = dict(text=text, fg_color=fg_color, hover_color=hover_color,
+                           text_color=text_color, font=self._calendar_font(font),
+                           border_width=border_width)
+            if border_color:
+                options["border_color"] = border_color
+            cell.button.configure(**options)
+            if cell.style is None:
+                cell.button.grid()
+            cell.style = style
+
+    def _prefetch_adjacent_months(self, year, month):
+        """Lädt Vor- und Folgemonat im Hintergrund, damit das Blättern sofort geht."""
+        for delta in (-1, 1):
+            index = year * 12 + (month - 1) + delta
+            y, m = divmod(index, 12)
+            m += 1
+            if self.data_manager.peek_month(y, m) is not None:
+                continue
+            background.submit(
+                self.data_manager.get_events_for_month, y, m,
+                on_error=lambda e: print("Kalender-Vorausladen fehlgeschlagen:", repr(e)),
+                priority=background.PRIORITY_LOW,
+                key=f"calendar-month:{y}-{m:02d}",
+            )
 
     def change_month(self, delta):
         new_month = self.current_date.month + delta
@@ -1576,12 +1775,22 @@ class ManagerDashboard(ctk.CTk):
         if not hasattr(self, 'upcoming_list_frame') or not self.upcoming_list_frame.winfo_exists():
             return
 
+        # DB-Abfrage im Hintergrund, gerendert wird im Tk-Thread
+        background.submit(
+            self.data_manager.get_upcoming_events,
+            on_done=self._render_upcoming_events,
+            on_error=lambda e: print("Upcoming Events Fehler:", repr(e)),
+            key="manager-upcoming-events",
+        )
+
+    def _render_upcoming_events(self, upcoming_events):
+        if not hasattr(self, 'upcoming_list_frame') or not self.upcoming_list_frame.winfo_exists():
+            return
+
         # alte Einträge löschen
         for widget in self.upcoming_list_frame.winfo_children():
             widget.destroy()
 
-        upcoming_events = self.data_manager.get_upcoming_events()
-
         if not upcoming_events:
             ctk.CTkLabel(
                 self.upcoming_list_frame,
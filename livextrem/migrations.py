@@ -0,0 +1,193 @@
+import threading
+
+import mariadb
+import db_pool
+from config import Config
+
+# -----------------------------------------------------------------------------
+# Versionierte Schema-Migrationen
+# -----------------------------------------------------------------------------
+# Jede Migration hat eine fortlaufende Nummer und wird genau einmal ausgeführt;
+# die erledigten Nummern stehen in der Tabelle `schema_version`.
+#
+# ensure_schema() wird einmal pro Prozess beim Start aufgerufen (router.py).
+# Danach kostet die Prüfung nichts mehr – DDL läuft nie im normalen Lade- oder
+# Speicherpfad der Dashboards (DDL nimmt Metadata-Locks auf dem geteilten Server).
+#
+# Neue Migrationen NUR hinten anhängen, bestehende nie ändern.
+# -----------------------------------------------------------------------------
+
+MIGRATIONS = [
+    (1, "Dashboard-Tabellen: ToDos, Finanzen, Content, Streamplanung", [
+        """CREATE TABLE IF NOT EXISTS streamer_todos (
+            todo_id INT AUTO_INCREMENT PRIMARY KEY,
+            streamer_id BIGINT(20) UNSIGNED NOT NULL,
+            task VARCHAR(60) NOT NULL,
+            done TINYINT(1) NOT NULL DEFAULT 0,
+            created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            updated_at DATETIME NULL,
+            INDEX idx_streamer_todos_streamer (streamer_id)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci""",
+        """CREATE TABLE IF NOT EXISTS streamer_finances (
+            finance_id INT AUTO_INCREMENT PRIMARY KEY,
+            streamer_id BIGINT(20) UNSIGNED NOT NULL,
+            booking_date DATETIME NOT NULL,
+            description VARCHAR(255) NOT NULL,
+            amount DECIMAL(10,2) NOT NULL,
+            entry_type VARCHAR(20) NOT NULL,
+            created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            updated_at DATETIME NULL,
+            INDEX idx_streamer_finances_streamer (streamer_id),
+            INDEX idx_streamer_finances_date (booking_date)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci""",
+        """CREATE TABLE IF NOT EXISTS content (
+            content_id BIGINT UNSIGNED NOT NULL AUTO_INCREMENT PRIMARY KEY,
+            titel VARCHAR(150) NOT NULL,
+            beschreibung TEXT DEFAULT NULL,
+            kategorie VARCHAR(50) DEFAULT NULL,
+            plattform VARCHAR(50) DEFAULT NULL,
+            erstellt_am DATETIME DEFAULT CURRENT_TIMESTAMP
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci""",
+        """CREATE TABLE IF NOT EXISTS stream_planung (
+            plan_id BIGINT UNSIGNED NOT NULL AUTO_INCREMENT PRIMARY KEY,
+            streamer_id BIGINT UNSIGNED NOT NULL,
+            content_id BIGINT UNSIGNED DEFAULT NULL,
+            datum DATETIME NOT NULL,
+            thema VARCHAR(200) DEFAULT NULL,
+            status VARCHAR(20) DEFAULT 'geplant',
+            INDEX fk_sp_streamer (streamer_id),
+            INDEX datum (datum),
+            INDEX fk_sp_content (content_id)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci""",
+    ]),
+    (2, "streamer_id in streamer_todos/streamer_finances an streamer angleichen (BIGINT UNSIGNED)", [
+        "ALTER TABLE streamer_todos MODIFY streamer_id BIGINT(20) UNSIGNED NOT NULL",
+        "ALTER TABLE streamer_finances MODIFY streamer_id BIGINT(20) UNSIGNED NOT NULL",
+    ]),
+    (3, "Delta-Sync: updated_at gepflegt + indiziert, Tombstones für Löschungen", [
+        """CREATE TABLE IF NOT EXISTS dashboard_tombstones (
+            tombstone_id BIGINT UNSIGNED NOT NULL AUTO_INCREMENT PRIMARY KEY,
+            table_name VARCHAR(40) NOT NULL,
+            row_id BIGINT UNSIGNED NOT NULL,
+            streamer_id BIGINT(20) UNSIGNED NOT NULL,
+            deleted_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            INDEX idx_tombstones_streamer (streamer_id, tombstone_id)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci""",
+        "UPDATE streamer_todos SET updated_at = created_at WHERE updated_at IS NULL",
+        """ALTER TABLE streamer_todos
+            MODIFY updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+            ADD INDEX IF NOT EXISTS idx_streamer_todos_sync (streamer_id, updated_at)""",
+        "UPDATE streamer_finances SET updated_at = created_at WHERE updated_at IS NULL",
+        """ALTER TABLE streamer_finances
+            MODIFY updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+            ADD INDEX IF NOT EXISTS idx_streamer_finances_sync (streamer_id, updated_at)""",
+    ]),
+    (4, "stream_planung: Composite-Index (streamer_id, datum) für Kalender und Planung", [
+        # Deckt "WHERE streamer_id = ? AND datum >= ? ... ORDER BY datum" ohne Filesort ab
+        """ALTER TABLE stream_planung
+            ADD INDEX IF NOT EXISTS idx_sp_streamer_datum (streamer_id, datum)""",
+    ]),
+    (5, "Delta-Sync: Tombstones nach Zeit lesen (streamer_id, deleted_at)", [
+        """ALTER TABLE dashboard_tombstones
+            ADD INDEX IF NOT EXISTS idx_tombstones_streamer_time (streamer_id, deleted_at)""",
+    ]),
+    (6, "Delta-Sync: Index auf deleted_at zum Aufräumen alter Tombstones", [
+        """ALTER TABLE dashboard_tombstones
+            ADD INDEX IF NOT EXISTS idx_tombstones_time (deleted_at)""",
+    ]),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+# Serverweiter Lock, damit zwei gleichzeitig startende Clients nicht
+# dieselbe Migration parallel ausführen.
+_LOCK_NAME = "livextrem_schema_migration"
+_LOCK_TIMEOUT = 30
+
+_checked = False
+_checked_lock = threading.Lock()
+
+
+def _current_version(cur):
+    """Höchste eingespielte Version (0 = noch nichts / Tabelle fehlt)."""
+    try:
+        cur.execute("SELECT MAX(version) FROM schema_version")
+    except mariadb.ProgrammingError:
+        return 0
+    row = cur.fetchone()
+    return int(row[0]) if row and row[0] is not None else 0
+
+
+def is_schema_current():
+    """Schnelle Prüfung: ein einziger Index-Read auf schema_version."""
+    if _checked:
+        return True
+    with db_pool.connection() as db:
+        return _current_version(db.cursor()) >= LATEST_VERSION
+
+
+def _apply_pending(db):
+    cur = db.cursor()
+    cur.execute(
+        """CREATE TABLE IF NOT EXISTS schema_version (
+            version INT UNSIGNED NOT NULL PRIMARY KEY,
+            beschreibung VARCHAR(200) NOT NULL,
+            applied_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci"""
+    )
+    # Unter dem Lock neu lesen – ein anderer Client kann inzwischen migriert haben
+    current = _current_version(cur)
+    for version, beschreibung, statements in MIGRATIONS:
+        if version <= current:
+            continue
+        print(f"Schema-Migration {version}: {beschreibung}")
+        for stmt in statements:
+            cur.execute(stmt)
+        cur.execute(
+            "INSERT INTO schema_version (version, beschreibung) VALUES (?, ?)",
+            (version, beschreibung[:200])
+        )
+        db.commit()
+
+
+def prune_tombstones(db):
+    """Löscht Tombstones älter als Config.SYNC_TOMBSTONE_RETENTION.
+
+    Ein Client, dessen Wasserstand älter ist, macht ohnehin einen vollen
+    Reload (siehe streamer_dashboard._db_load_snapshot) und braucht sie nicht.
+    """
+    cur = db.cursor()
+    cur.execute(
+        "DELETE FROM dashboard_tombstones WHERE deleted_at < NOW() - INTERVAL ? SECOND",
+        (int(Config.SYNC_TOMBSTONE_RETENTION),)
+    )
+    db.commit()
+    return cur.rowcount
+
+
+def ensure_schema():
+    """Spielt fehlende Migrationen ein und räumt alte Tombstones auf. Läuft pro Prozess nur einmal durch."""
+    global _checked
+    if _checked:
+        return
+    with _checked_lock:
+        if _checked:
+            return
+        with db_pool.connection() as db:
+            cur = db.cursor()
+            if _current_version(cur) < LATEST_VERSION:
+                cur.execute("SELECT GET_LOCK(?, ?)", (_LOCK_NAME, _LOCK_TIMEOUT))
+                row = cur.fetchone()
+                if not row or row[0] != 1:
+                    raise RuntimeError("Schema-Migration: Lock konnte nicht geholt werden.")
+                try:
+                    _apply_pending(db)
+                finally:
+                    cur.execute("SELECT RELEASE_LOCK(?)", (_LOCK_NAME,))
+                    cur.fetchone()
+            try:
+                prune_tombstones(db)
+            except mariadb.Error as e:
+                # Nur Aufräumen – der Start soll daran nicht scheitern
+                print("Tombstones konnten nicht aufgeräumt werden:", repr(e))
+        _checked = True
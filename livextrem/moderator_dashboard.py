@@ -5,6 +5,9 @@ import customtkinter as ctk
 from PIL import Image
 import tkinter.messagebox as mb
 from datetime import datetime
+import background
+from render_scheduler import RenderScheduler
+from chat_view import ChatView
 from database_connection import DatabaseManager
 from database_queries_moderator import ModeratorQueries
 
@@ -32,6 +35,9 @@ session = None  # wird vom Router gesetzt (SessionUser)
 db = None
 mod_queries = None
 twitch_token = None
+current_view = None  # "dashboard" | "chat" | "actions"
+chat_view = None      # ChatView des offenen Chat Monitors
+chat_title_label = None
 
 # ---------- Hauptfenster ----------
 app = ctk.CTk()
@@ -41,6 +47,12 @@ app.title("LiveXtrem - Moderator Dashboard")
 app.grid_columnconfigure(1, weight=1)
 app.grid_rowconfigure(0, weight=1)
 
+# Ergebnisse der Hintergrund-Worker im Tk-Thread abarbeiten
+background.attach_ui(app)
+
+# Fortschritts-Updates beim Chat-Laden zusammenfassen (nicht pro Seite neu rendern)
+_chat_render = RenderScheduler(app, window_ms=300)
+
 # ---------- Twitch Login ----------
 def twitch_login():
     """Twitch-Login (Token nur im RAM). Wenn bereits eingeloggt (oauth.gen), wird kein Browser geöffnet."""
@@ -78,16 +90,8 @@ def init_database():
         except Exception:
             pass
         
-        mb.showinfo("Chat laden", "Lade Chat-Nachrichten vom letzten VOD...\nDies kann einen Moment dauern.")
-        success = mod_queries.load_vod_chat()
-        
-        if not success:
-            error = mod_queries.get_chat_error()
-            mb.showwarning("Chat-Warnung", f"{error}\n\nDas Dashboard funktioniert trotzdem für Moderationsaktionen.")
-        else:
-            vod = mod_queries.get_vod_info()
-            if vod:
-                mb.showinfo("Chat geladen", f"Chat erfolgreich geladen!\n\nVOD: {vod.get('title', 'Unbekannt')}")
+        # Chat lädt im Hintergrund, das Dashboard ist währenddessen schon benutzbar
+        load_chat_async(_on_initial_chat_loaded)
         
         mod_queries.cleanup_expired_actions()
 
@@ -103,6 +107,68 @@ def init_database():
         mb.showerror("Datenbankfehler", f"Initialisierung fehlgeschlagen:\n{e}")
         return False
 
+# ---------- Chat im Hintergrund laden ----------
+def load_chat_async(on_loaded):
+    """Lädt den VOD-Chat auf einem Worker; on_loaded(success) läuft im Tk-Thread.
+
+    Jede geladene Seite meldet sich über _on_chat_progress, der Chat Monitor
+    zeigt die Nachrichten also schon während des Ladens an.
+    """
+    chat_progress_label.configure(text="💬 Chat wird geladen...")
+    background.submit(
+        mod_queries.load_vod_chat,
+        on_progress=lambda count: background.call_in_ui(_on_chat_progress, count),
+        on_done=on_loaded,
+        on_error=lambda e: mb.showerror("Chat-Fehler", f"Chat konnte nicht geladen werden:\n{e}"),
+        key="moderator-chat-load",
+    )
+
+def _on_chat_progress(count):
+    chat_progress_label.configure(text=f"💬 {count} Nachrichten geladen...")
+    if current_view == "chat":
+        _chat_render.request("chat", _update_chat_monitor)
+
+def _on_chat_loaded(success):
+    """Gemeinsamer Abschluss: Fortschrittsanzeige setzen, offenen Chat Monitor final rendern."""
+    if success:
+        chat_progress_label.configure(text=f"💬 {mod_queries.get_message_count()} Nachrichten")
+    else:
+        chat_progress_label.configure(text="💬 Chat nicht verfügbar")
+    if current_view == "chat":
+        if success and mod_queries.get_message_count():
+            _chat_render.request("chat", _update_chat_monitor)
+        else:
+            # Fehler- bzw. Leer-Zustand komplett neu aufbauen
+            _chat_render.request("chat", show_chat_monitor)
+        _chat_render.flush()
+
+def _on_initial_chat_loaded(success):
+    _on_chat_loaded(success)
+    if not success:
+        error = mod_queries.get_chat_error()
+        mb.showwarning("Chat-Warnung", f"{error}\n\nDas Dashboard funktioniert trotzdem für Moderationsaktionen.")
+
+def run_moderation_action(action, args, status_label, on_success):
+    """Führt ban/timeout/unban auf einem Worker aus und zeigt das Ergebnis im Status-Label."""
+    status_label.configure(text="⏳ Wird ausgeführt...", text_color="gray")
+
+    def done(result):
+        if not status_label.winfo_exists():
+            return
+        if result["success"]:
+            status_label.configure(text=f"✅ {result['message']}", text_color="green")
+            on_success()
+            app.after(3000, lambda: status_label.winfo_exists() and status_label.configure(text=""))
+        else:
+            status_label.configure(text=f"❌ {result['message']}", text_color="red")
+
+    background.submit(
+        action, *args,
+        on_done=done,
+        on_error=lambda e: status_label.winfo_exists() and status_label.configure(text=f"❌ Fehler: {e}", text_color="red"),
+        priority=background.PRIORITY_HIGH,
+    )
+
 # ---------- Sidebar ----------
 sidebar_container = ctk.CTkFrame(app, fg_color="transparent")
 sidebar_container.grid(row=0, column=0, sticky="nsw", padx=10, pady=10)
@@ -155,6 +221,10 @@ mod_info_label.pack(pady=(8, 2))
 mod_name_label = ctk.CTkLabel(mod_info_frame, text="...", font=("Arial", 19))
 mod_name_label.pack(pady=(0, 8))
 
+# Fortschritt des Chat-Ladens (statt blockierender Hinweis-Dialoge)
+chat_progress_label = ctk.CTkLabel(sidebar, text="", font=("Arial", 15))
+chat_progress_label.pack(pady=(0, 10), padx=10)
+
 # Buttons
 NORMAL_COLOR = "#1f538d"
 HOVER_COLOR = "#2a5f9f"
@@ -180,6 +250,8 @@ content.grid(row=0, column=1, sticky="nsew", padx=20, pady=20)
 
 # ---------- Dashboard View ----------
 def show_dashboard():
+    global current_view
+    current_view = "dashboard"
     clear_content()
     
     header_frame = ctk.CTkFrame(content, fg_color="transparent")
@@ -267,6 +339,9 @@ def show_dashboard():
 
 # ---------- Chat Monitor View ----------
 def show_chat_monitor():
+    global current_view, chat_view, chat_title_label
+    current_view = "chat"
+    chat_view = None
     clear_content()
     
     header_frame = ctk.CTkFrame(content, fg_color="transparent")
@@ -297,38 +372,33 @@ def show_chat_monitor():
                     font=("Arial", 29),text_color="#fcfcfc", wraplength=600).pack(pady=(0, 30))
         return
     
-    ctk.CTkLabel(chat_frame, text="📨 Chat-Nachrichten", 
-                font=("Arial", 25, "bold")).pack(pady=10)
-    
-    chat_scroll = ctk.CTkScrollableFrame(chat_frame, fg_color="transparent")
-    chat_scroll.pack(fill="both", expand=True, padx=10, pady=(0, 10))
-    
-    messages = mod_queries.get_all_messages(limit=200)
-    if messages and "data" in messages and messages["data"]:
-        for msg in reversed(messages["data"]):
-            msg_id, username, text, timestamp = msg
-            
-            msg_box = ctk.CTkFrame(chat_scroll, fg_color=("gray95", "#2a2a2a"), corner_radius=8)
-            msg_box.pack(fill="x", pady=3, padx=5)
-            
-            header_frame = ctk.CTkFrame(msg_box, fg_color="transparent")
-            header_frame.pack(fill="x", padx=10, pady=(8, 2))
-            
-            ctk.CTkLabel(header_frame, text=f"👤 {username}", 
-                        font=("Arial", 16, "bold"), anchor="w").pack(side="left")
-            
-            time_str = timestamp if isinstance(timestamp, str) else timestamp.strftime("%H:%M:%S")
-            ctk.CTkLabel(header_frame, text=time_str, 
-                        font=("Arial", 14), text_color=("gray40", "gray"), anchor="e").pack(side="right")
-            
-            ctk.CTkLabel(msg_box, text=text, font=("Arial", 17), 
-                        anchor="w", wraplength=800, justify="left").pack(padx=10, pady=(0, 8), fill="x")
-    else:
-        ctk.CTkLabel(chat_scroll, text="Keine Chat-Nachrichten verfügbar", 
-                    font=("Arial", 19)).pack(pady=20)
+    chat_title_label = ctk.CTkLabel(chat_frame, text=_chat_title(), 
+                font=("Arial", 25, "bold"))
+    chat_title_label.pack(pady=10)
+    
+    # Ein einziges Text-Widget über den ganzen Store statt Frames pro Nachricht
+    empty_text = "⏳ Chat-Nachrichten werden geladen..." if mod_queries.is_chat_loading() else "Keine Chat-Nachrichten verfügbar"
+    chat_view = ChatView(chat_frame, mod_queries.get_chat_store(), empty_text=empty_text)
+    chat_view.pack(fill="both", expand=True, padx=10, pady=(0, 10))
+
+def _chat_title():
+    title = "📨 Chat-Nachrichten"
+    if mod_queries.is_chat_loading():
+        title += f" (lädt... {mod_queries.get_loaded_count()})"
+    return title
+
+def _update_chat_monitor():
+    """Neue Nachrichten in den offenen Chat Monitor übernehmen (ohne ihn neu aufzubauen)."""
+    if chat_view is None or not chat_view.winfo_exists():
+        show_chat_monitor()
+        return
+    chat_title_label.configure(text=_chat_title())
+    chat_view.set_store(mod_queries.get_chat_store())
 
 # ---------- Aktionen View ----------
 def show_actions():
+    global current_view
+    current_view = "actions"
     clear_content()
     
     header = ctk.CTkLabel(content, text="⚡ Moderationsaktionen", 
@@ -379,17 +449,15 @@ def show_actions():
         
         try:
             dauer = int(duration) if duration else 10
-            result = mod_queries.timeout_user(username, dauer, reason)
-            
-            if result["success"]:
-                timeout_status.configure(text=f"✅ {result['message']}", text_color="green")
-                timeout_user_entry.delete(0, 'end')
-                timeout_reason_entry.delete(0, 'end')
-                app.after(3000, lambda: timeout_status.configure(text=""))
-            else:
-                timeout_status.configure(text=f"❌ {result['message']}", text_color="red")
         except ValueError:
             timeout_status.configure(text="❌ Ungültige Dauer", text_color="red")
+            return
+        
+        def clear_form():
+            timeout_user_entry.delete(0, 'end')
+            timeout_reason_entry.delete(0, 'end')
+        
+        run_moderation_action(mod_queries.timeout_user, (username, dauer, reason), timeout_status, clear_form)
     
     ctk.CTkButton(timeout_form, text="⏸️ Timeout ausführen", 
                  font=("Arial", 24, "bold"), height=60, width=350,
@@ -425,15 +493,11 @@ def show_actions():
         if not mb.askyesno("Bestätigung", f"User '{username}' wirklich permanent bannen?"):
             return
         
-        result = mod_queries.ban_user(username, reason)
-        
-        if result["success"]:
-            ban_status.configure(text=f"✅ {result['message']}", text_color="green")
+        def clear_form():
             ban_user_entry.delete(0, 'end')
             ban_reason_entry.delete(0, 'end')
-            app.after(3000, lambda: ban_status.configure(text=""))
-        else:
-            ban_status.configure(text=f"❌ {result['message']}", text_color="red")
+        
+        run_moderation_action(mod_queries.ban_user, (username, reason), ban_status, clear_form)
     
     ctk.CTkButton(ban_form, text="🚫 Ban ausführen", 
                  font=("Arial", 24, "bold"), height=60, width=350,
@@ -461,14 +525,8 @@ def show_actions():
             unban_status.configure(text="❌ Bitte Username eingeben", text_color="red")
             return
         
-        result = mod_queries.unban_user(username)
-        
-        if result["success"]:
-            unban_status.configure(text=f"✅ {result['message']}", text_color="green")
-            unban_user_entry.delete(0, 'end')
-            app.after(3000, lambda: unban_status.configure(text=""))
-        else:
-            unban_status.configure(text=f"❌ {result['message']}", text_color="red")
+        run_moderation_action(mod_queries.unban_user, (username,), unban_status,
+                              lambda: unban_user_entry.delete(0, 'end'))
     
     ctk.CTkButton(unban_form, text="✅ Unban ausführen", 
                  font=("Arial", 24, "bold"), height=60, width=350,
@@ -492,16 +550,16 @@ def refresh_data():
                 "(damit seine Twitch-ID in twitch_tokens gespeichert wird) und der Moderator/Manager korrekt zugeordnet ist."
             )
         
-        mb.showinfo("Chat neu laden", "Lade Chat-Nachrichten neu...")
-        success = mod_queries.load_vod_chat()
+        def on_loaded(success):
+            _on_chat_loaded(success)
+            if not success:
+                error = mod_queries.get_chat_error()
+                mb.showwarning("Chat-Warnung", f"{error}")
+            elif current_view == "dashboard":
+                show_dashboard()
         
-        if not success:
-            error = mod_queries.get_chat_error()
-            mb.showwarning("Chat-Warnung", f"{error}")
-        else:
-            mb.showinfo("Erfolg", "Chat erfolgreich neu geladen!")
-        
-        show_dashboard()
+        # Mehrfaches Klicken startet keinen zweiten Ladevorgang (on_loaded läuft trotzdem)
+        load_chat_async(on_loaded)
 
 # ---------- Button Commands ----------
 btn_dashboard.configure(command=show_dashboard)
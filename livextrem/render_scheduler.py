@@ -0,0 +1,74 @@
+# -----------------------------------------------------------------------------
+# Render-Scheduler (Coalescing / Debouncing für UI-Refreshes)
+# -----------------------------------------------------------------------------
+# Mehrere Refresh-Anfragen für denselben Schlüssel innerhalb eines kurzen
+# Fensters (Standard 33 ms ≈ 2 Frames) werden zu einem einzigen Aufruf
+# zusammengefasst. Die zuletzt angefragte Funktion gewinnt.
+#
+#     self._render_scheduler = RenderScheduler(self)
+#     self._render_scheduler.request("Overview", self._refresh_overview)
+#
+# Muss aus dem Tk-Thread heraus benutzt werden (nutzt widget.after).
+# -----------------------------------------------------------------------------
+
+DEFAULT_WINDOW_MS = 33
+
+
+class RenderScheduler:
+    def __init__(self, widget, window_ms=DEFAULT_WINDOW_MS):
+        self.widget = widget
+        self.window_ms = int(window_ms)
+        self._pending = {}      # key -> callback (Einfügereihenfolge = Ausführungsreihenfolge)
+        self._after_id = None
+
+        # Statistik
+        self.requested = 0
+        self.rendered = 0
+        self.suppressed = 0
+
+    def request(self, key, callback):
+        """Plant callback für den nächsten Flush; doppelte Keys werden zusammengefasst."""
+        self.requested += 1
+        if key in self._pending:
+            self.suppressed += 1
+        self._pending[key] = callback
+        if self._after_id is None:
+            try:
+                self._after_id = self.widget.after(self.window_ms, self._flush)
+            except Exception:
+                # Widget bereits zerstört
+                self._pending.clear()
+
+    def is_pending(self, key):
+        return key in self._pending
+
+    def flush(self):
+        """Führt alle anstehenden Renders sofort aus."""
+        if self._after_id is not None:
+            try:
+                self.widget.after_cancel(self._after_id)
+            except Exception:
+                pass
+        self._flush()
+
+    def cancel(self):
+        if self._after_id is not None:
+            try:
+                self.widget.after_cancel(self._after_id)
+            except Exception:
+                pass
+        self._after_id = None
+        self._pending.clear()
+
+    def stats(self):
+        return {"requested": self.requested, "rendered": self.rendered, "suppressed": self.suppressed}
+
+    def _flush(self):
+        self._after_id = None
+        pending, self._pending = self._pending, {}
+        for key, callback in pending.items():
+            self.rendered += 1
+            try:
+                callback()
+            except Exception as e:
+                print(f"Render-Fehler ({key}):", repr(e))
@@ -1,5 +1,7 @@
 from tkinter import messagebox
 
+import migrations
+
 
 def _open_streamer_dashboard(session):
     from streamer_dashboard import StreamerDashboard
@@ -46,6 +48,13 @@ def open_dashboard(session, target=None):
     """
     target = (target or "").strip().lower()
 
+    # Schema einmal pro Prozess prüfen/migrieren (danach ohne DB-Zugriff)
+    try:
+        migrations.ensure_schema()
+    except Exception as e:
+        messagebox.showerror("Datenbank", f"Datenbankschema konnte nicht aktualisiert werden:\n{e}")
+        return False
+
     if target == "streamer":
         return _open_streamer_dashboard(session)
     if target == "moderator":
@@ -6,15 +6,21 @@ import locale
 import tkinter.messagebox as mb
 from tkinter import filedialog
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
+from dataclasses import dataclass, field
+from typing import List
 import json
-import threading
 from PIL import Image
 
-import mariadb
-from config import Config
+import background
+import db_pool
+import migrations
+from virtual_list import VirtualList
+from render_scheduler import RenderScheduler
 from fremdsys import tapi_data
 from security import hash_password
+from config import Config
+from local_cache import JsonCache
 # Kalender-Widget Import (muss installiert sein: pip install tkcalendar)
 try:
     from tkcalendar import DateEntry
@@ -43,6 +49,13 @@ COLOR_TEXT    = ["gray10", "gray90"]
 COLOR_SUCCESS = "#008922"
 COLOR_DANGER  = "#c92a2a"
 
+# Letzte Overview-Statistiken je Twitch-User-ID (sofort anzeigen, im Hintergrund erneuern)
+_overview_stats_store = JsonCache(
+    "overview_stats",
+    ttl=Config.OVERVIEW_STATS_TTL,
+    max_age=Config.OVERVIEW_STATS_MAX_AGE,
+)
+
 # Versuche deutsches Locale für Datum zu setzen
 try:
     locale.setlocale(locale.LC_TIME, 'de_DE.UTF-8')
@@ -55,6 +68,13 @@ except:
 # ---------- LOKALE DATEN (persistiert) ----------
 
 
+def _alive(widget):
+    """True, solange ein (gecachtes) Widget noch existiert."""
+    try:
+        return widget is not None and bool(widget.winfo_exists())
+    except Exception:
+        return False
+
 def format_date_de(date_str):
     try:
         dt = datetime.strptime(date_str, "%Y-%m-%d %H:%M")
@@ -78,6 +98,116 @@ def get_next_stream(planned_streams):
     future_streams.sort(key=lambda x: x[0])
     return future_streams[0][1] if future_streams else None
 
+def _fmt_db_datetime(value):
+    """DATETIME aus der DB -> 'YYYY-MM-DD HH:MM' (wie im restlichen Dashboard)."""
+    if hasattr(value, "strftime"):
+        return value.strftime("%Y-%m-%d %H:%M")
+    return str(value or "")[:16]
+
+def _todo_from_row(r):
+    return {"id": r["id"], "task": r["task"], "done": bool(r["done"])}
+
+def _finance_from_row(r):
+    try:
+        amt = float(r["amount"])
+    except Exception:
+        amt = r["amount"]
+    return {
+        "id": r["id"],
+        "date": _fmt_db_datetime(r["date"]),
+        "desc": r["desc"],
+        "amount": amt,
+        "type": r["type"],
+    }
+
+def _plan_from_row(r):
+    return {
+        "id": int(r["plan_id"]),
+        "content_id": int(r["content_id"]) if r.get("content_id") is not None else None,
+        "title": (r.get("content_title") or r.get("thema") or "").strip(),
+        "game": (r.get("content_game") or "").strip(),
+        "date": _fmt_db_datetime(r.get("datum")),
+        "status": (r.get("status") or "geplant")
+    }
+
+@dataclass
+class DashboardSnapshot:
+    """Stand von ToDos, Finanzen und Streamplanung eines Streamers.
+
+    Bei is_delta=True enthalten todos/finances nur die seit dem letzten
+    Wasserstand geänderten Zeilen, `deleted` die seitdem gelöschten
+    (Tabelle, ID)-Paare. Die Streamplanung ist immer vollständig.
+    """
+    todos: List[dict] = field(default_factory=list)
+    finances: List[dict] = field(default_factory=list)
+    planned_streams: List[dict] = field(default_factory=list)
+    deleted: List[tuple] = field(default_factory=list)
+    marks: dict = field(default_factory=dict)
+    is_delta: bool = False
+
+# Delta-Sync-Wasserstand: Server-NOW() VOR dem Lesen minus Sicherheitsabstand.
+# updated_at/deleted_at werden beim Statement gestempelt, nicht beim Commit –
+# eine Transaktion, die nach unserem Lesen committet, kann also einen älteren
+# Zeitstempel tragen. Bis zu dieser Dauer wird sie beim nächsten Delta noch
+# erfasst; doppelt gelesene Zeilen sind harmlos (Merge ist idempotent).
+SYNC_SAFETY_MARGIN = timedelta(seconds=120)
+
+# Tombstones werden nach Config.SYNC_TOMBSTONE_RETENTION gelöscht (migrations.
+# prune_tombstones). Ist der Wasserstand so alt, dass Löschungen seitdem schon
+# weg sein können, gibt es statt eines Deltas einen vollen Reload.
+SYNC_MAX_DELTA_AGE = timedelta(seconds=Config.SYNC_TOMBSTONE_RETENTION) - SYNC_SAFETY_MARGIN
+
+# Ein Statement für alles: die Spalte `kind` sagt, zu welcher Liste eine Zeile
+# gehört. Spalten, die ein Teil nicht hat, sind NULL. {todo_since}/{fin_since}
+# sind im Delta-Modus "AND ... updated_at >= ?" (inklusiv, Merge ist idempotent).
+_SNAPSHOT_QUERY = """
+    SELECT 'todo' AS kind, t.todo_id AS id, t.task AS text, t.done AS done,
+           NULL AS amount, NULL AS entry_type, NULL AS ts,
+           NULL AS content_id, NULL AS thema, NULL AS game, NULL AS status,
+           t.updated_at AS upd, NULL AS seq
+      FROM streamer_todos t
+     WHERE t.streamer_id = ? {todo_since}
+    UNION ALL
+    SELECT 'finance', f.finance_id, f.description, NULL,
+           f.amount, f.entry_type, f.booking_date,
+           NULL, NULL, NULL, NULL,
+           f.updated_at, NULL
+      FROM streamer_finances f
+     WHERE f.streamer_id = ? {fin_since}
+    UNION ALL
+    SELECT 'plan', sp.plan_id, c.titel, NULL,
+           NULL, NULL, sp.datum,
+           sp.content_id, sp.thema, c.kategorie, sp.status,
+           NULL, NULL
+      FROM stream_planung sp
+ LEFT JOIN content c ON c.content_id = sp.content_id
+     WHERE sp.streamer_id = ?
+    {tombstones}
+"""
+
+# Delta: alle Löschungen seit dem Wasserstand (nach Zeit, nicht nach tombstone_id –
+# IDs werden wie updated_at vor dem Commit vergeben und können überholt werden)
+_TOMBSTONE_DELTA_PART = """
+    SELECT 'deleted', d.row_id, d.table_name, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL,
+           NULL, d.tombstone_id
+      FROM dashboard_tombstones d
+     WHERE d.streamer_id = ? AND d.deleted_at >= ?
+"""
+
+def _merge_rows(current, changed, deleted_ids):
+    """Upsert per id (Objektidentität bleibt erhalten) und entfernt gelöschte IDs."""
+    by_id = {row["id"]: row for row in current}
+    for row in changed:
+        existing = by_id.get(row["id"])
+        if existing is not None:
+            existing.update(row)
+        else:
+            current.append(row)
+            by_id[row["id"]] = row
+    if deleted_ids:
+        current[:] = [row for row in current if row["id"] not in deleted_ids]
+    return current
+
 # ---------- HAUPTKLASSE ----------
 class StreamerDashboard(ctk.CTk):
     def __init__(self, session=None):
@@ -106,24 +236,37 @@ class StreamerDashboard(ctk.CTk):
 
         # Lokale (persistierte) Daten laden (ToDos, Finanzen, Streamplanung)
         self._overview_stats_cache = None
-        self._overview_loading = False
+        self._overview_stats_failed = set()
+        self._overview_stats_pending = set()
+        self._overview_stats_stale = set()      # aus dem Platten-Cache, noch nicht erneuert
+        self._overview_stats_saved_at = None
         self.todos = []
         self.finances = []
         self.planned_streams = []
 
+        # View-Cache: jede View wird einmal gebaut und danach nur ein-/ausgeblendet.
+        # Views in _dirty_views werden beim nächsten Anzeigen aktualisiert.
+        self._views = {}
+        self._dirty_views = set()
+        # Fasst Refresh-Anfragen (Map-Events, Daten-Ankünfte) pro Frame-Fenster zusammen
+        self._render_scheduler = RenderScheduler(self)
+        # Ergebnisse der Hintergrund-Worker kommen über die UI-Queue zurück
+        background.attach_ui(self)
+
         # Remote/DB Daten laden (keine lokale Persistenz)
-        self._dashboard_loading = False
+        # Wasserstände für den Delta-Sync (None = noch kein vollständiger Load)
+        self._sync_marks = {"since": None}
         self._current_view = "Overview"
+        self._restore_overview_stats()
         self._load_dashboard_data_async()
         self.show_view("Overview")
 
     def _on_dashboard_mapped(self, event=None):
         if event is not None and event.widget is not self:
             return
-        try:
-            self.after(0, lambda: self._load_dashboard_data_async(force=True))
-        except Exception:
-            pass
+        # Map feuert u.a. bei jedem Wiederherstellen – mehrfache Events zusammenfassen.
+        # Läuft bereits ein Load, liefert der ohnehin frische Daten.
+        self._render_scheduler.request("reload", self._load_dashboard_data_async)
 
 
     # ---------- DASHBOARD DATA (DB / REMOTE) ----------
@@ -139,185 +282,217 @@ class StreamerDashboard(ctk.CTk):
                 pass
         return max_id + 1
 
-    def _load_dashboard_data_async(self, force: bool = False):
+    def _load_dashboard_data_async(self):
         """Lädt ToDos & Finanzen aus der DB (streamer-spezifisch).
         Streamplanung wird streamer-spezifisch aus der DB geladen (keine lokale Persistenz).
+
+        Nach dem ersten vollständigen Load werden ToDos/Finanzen nur noch
+        inkrementell (ab dem letzten Wasserstand, siehe SYNC_SAFETY_MARGIN) nachgeladen.
+        Läuft bereits ein Load, wird kein zweiter gestartet.
         """
-        if getattr(self, "_dashboard_loading", False) and not force:
-            return
-        self._dashboard_loading = True
+        background.submit(
+            self._db_load_snapshot, dict(self._sync_marks),
+            on_done=self._apply_snapshot,
+            on_error=self._on_dashboard_load_error,
+            key=f"streamer-dashboard-load:{self.streamer_id}",
+        )
 
-        def worker():
-            todos, finances, planned_streams = [], [], []
-            try:
-                self._ensure_dashboard_tables()
-                todos = self._db_load_todos()
-                finances = self._db_load_finances()
+    def _on_dashboard_load_error(self, error):
+        print("Dashboard Data Fehler:", repr(error))
+        self._apply_snapshot(None)
+
+    def _apply_snapshot(self, snapshot):
+        """Übernimmt einen (Delta-)Snapshot in die In-Memory-Listen (Tk-Thread)."""
+        if snapshot is not None:
+            if snapshot.is_delta:
+                deleted_todos = {rid for table, rid in snapshot.deleted if table == "streamer_todos"}
+                deleted_fin = {rid for table, rid in snapshot.deleted if table == "streamer_finances"}
+                _merge_rows(self.todos, snapshot.todos, deleted_todos)
+                _merge_rows(self.finances, snapshot.finances, deleted_fin)
+                self.todos.sort(key=lambda t: t["id"], reverse=True)
+                self.finances.sort(key=lambda f: (f["date"], f["id"]), reverse=True)
+            else:
+                self.todos = snapshot.todos
+                self.finances = snapshot.finances
+            self.planned_streams = snapshot.planned_streams
+            self._sync_marks.update(snapshot.marks)
+        self._invalidate_views("Overview", "Content", "Finance")
 
-                planned_streams = self._db_load_planned_streams()
-            except Exception as e:
-                print("Dashboard Data Fehler:", repr(e))
-            finally:
-                self.todos = todos or []
-                self.finances = finances or []
-                self.planned_streams = planned_streams or []
-                self._dashboard_loading = False
-                try:
-                    self.after(0, lambda: self.show_view(getattr(self, "_current_view", "Overview")))
-                except Exception:
-                    pass
-
-        threading.Thread(target=worker, daemon=True).start()
+    def _apply_planned_streams(self, planned_streams):
+        """Übernimmt die nach Speichern/Löschen neu geladene Streamplanung (Tk-Thread)."""
+        self.planned_streams = planned_streams
+        self._invalidate_views("Content", "Overview")
 
     # ---------- TWITCH / FREMDSYS ----------
+    # Reihenfolge = Reihenfolge der Stat-Karten in der Overview
+    _OVERVIEW_STATS = ("followers", "subs", "avg_views")
+
+    def _twitch_user_key(self):
+        """Twitch-User-ID des Streamers (Schlüssel für den Platten-Cache)."""
+        token = self._api_token()
+        if token is not None and getattr(token, "userid", None):
+            return str(token.userid)
+        try:
+            if self.session and self.session.streamer and self.session.streamer.get("twitch_userid"):
+                return str(self.session.streamer.get("twitch_userid"))
+        except Exception:
+            pass
+        return None
+
+    def _restore_overview_stats(self):
+        """Übernimmt die zuletzt gespeicherten Stats, damit die Karten sofort Werte zeigen.
+
+        Frische Einträge (jünger als die TTL) werden nicht neu geladen; veraltete
+        werden angezeigt, als veraltet markiert und im Hintergrund erneuert.
+        """
+        entry = _overview_stats_store.get(self._twitch_user_key())
+        if entry is None or not isinstance(entry.value, dict):
+            return
+        self._overview_stats_cache = dict(entry.value)
+        self._overview_stats_saved_at = entry.saved_at
+        if entry.stale:
+            self._overview_stats_stale = set(self._OVERVIEW_STATS)
+            self._load_overview_stats_async()
+
     def _load_overview_stats_async(self):
-        if self._overview_loading:
+        """Startet die drei Helix-Abfragen parallel; jede Karte füllt sich, sobald ihr Wert da ist."""
+        token = getattr(self.session, "twitch_token", None)
+        # {} statt None: Laden ist angestoßen, fehlende Keys gelten als "lädt…".
+        # Werte aus dem Platten-Cache bleiben bis zur Antwort sichtbar.
+        if self._overview_stats_cache is None:
+            self._overview_stats_cache = {}
+        self._overview_stats_failed = set()
+        if not token:
             return
-        self._overview_loading = True
+        self._overview_stats_pending = set(self._OVERVIEW_STATS)
+        timeout = Config.TWITCH_STATS_TIMEOUT
+        for name in self._OVERVIEW_STATS:
+            background.submit(
+                self._fetch_overview_stat, name, token, timeout,
+                on_done=self._apply_overview_stat,
+                on_error=lambda e, n=name: self._on_overview_stat_error(n, e),
+                priority=background.PRIORITY_LOW,
+                key=f"streamer-overview-{name}:{self.streamer_id}",
+            )
 
-        def worker():
-            try:
-                token = getattr(self.session, "twitch_token", None)
-                stats = self._fetch_overview_stats(token) if token else {}
-                self._overview_stats_cache = stats
-            except Exception as e:
-                print("Twitch Stats Fehler:", repr(e))
-                self._overview_stats_cache = {}
-            finally:
-                self._overview_loading = False
-                try:
-                    self.after(0, lambda: self.show_view("Overview"))
-                except Exception:
-                    pass
-
-        threading.Thread(target=worker, daemon=True).start()
-
-    def _fetch_overview_stats(self, token):
-        stats = {}
-        try:
-            fstats = tapi_data.follower_stats(token, days=7)
-            stats["followers_total"] = fstats.get("total")
-            stats["new_followers_7d"] = fstats.get("new_count")
-        except Exception as e:
-            print("Follower Stats Fehler:", repr(e))
-        try:
-            stats["subs_total"] = tapi_data.subscriber_total(token)
-        except Exception as e:
-            print("Sub Stats Fehler:", repr(e))
-        try:
-            stats["avg_views_last_streams"] = tapi_data.avg_vod_views(token, limit=10)
-        except Exception as e:
-            print("VOD Avg Fehler:", repr(e))
-        return stats
+    @staticmethod
+    def _fetch_overview_stat(name, token, timeout):
+        """Läuft im Worker. Liefert (name, Teil-Statistik)."""
+        if name == "followers":
+            fstats = tapi_data.follower_stats(token, days=7, timeout=timeout)
+            return name, {"followers_total": fstats.get("total"), "new_followers_7d": fstats.get("new_count")}
+        if name == "subs":
+            return name, {"subs_total": tapi_data.subscriber_total(token, timeout=timeout)}
+        if name == "avg_views":
+            return name, {"avg_views_last_streams": tapi_data.avg_vod_views(token, limit=10, timeout=timeout)}
+        raise ValueError(f"Unbekannte Statistik: {name}")
+
+    def _apply_overview_stat(self, result):
+        name, values = result
+        self._overview_stats_cache.update(values)
+        self._overview_stats_stale.discard(name)
+        self._refresh_stat_card(name)
+        self._overview_stat_settled(name)
+
+    def _on_overview_stat_error(self, name, error):
+        print(f"Twitch Stats Fehler ({name}):", repr(error))
+        self._overview_stats_failed.add(name)
+        self._refresh_stat_card(name)
+        self._overview_stat_settled(name)
+
+    def _overview_stat_settled(self, name):
+        """Sind alle drei Abfragen erfolgreich durch, wird der Stand auf Platte gesichert."""
+        self._overview_stats_pending.discard(name)
+        if self._overview_stats_pending or self._overview_stats_failed:
+            return
+        self._overview_stats_saved_at = None
+        background.submit(
+            _overview_stats_store.put, self._twitch_user_key(), dict(self._overview_stats_cache),
+            priority=background.PRIORITY_LOW,
+        )
 
 
     # --- SIDEBAR ---
     # ---------- DB HELPERS ----------
     def _db(self):
-        """Öffnet eine DB-Verbindung (Config via ENV oder config_local.json)."""
-        Config.validate()
-        return mariadb.connect(
-            host=Config.DB_HOST,
-            port=Config.DB_PORT,
-            user=Config.DB_USER,
-            password=Config.DB_PASS,
-            database=Config.DB_NAME
-        )
+        """Leiht eine DB-Verbindung aus dem gemeinsamen Pool (Context-Manager)."""
+        return db_pool.connection()
 
-    def _ensure_dashboard_tables(self):
-        """Stellt sicher, dass die Streamer-spezifischen Tabellen existieren."""
-        if not self.streamer_id:
-            raise ValueError("Kein streamer_id in der Session gefunden.")
-        db = self._db()
-        try:
-            cur = db.cursor()
-            # ToDos
-            cur.execute(
-                """CREATE TABLE IF NOT EXISTS streamer_todos (
-                    todo_id INT AUTO_INCREMENT PRIMARY KEY,
-                    streamer_id INT NOT NULL,
-                    task VARCHAR(60) NOT NULL,
-                    done TINYINT(1) NOT NULL DEFAULT 0,
-                    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
-                    updated_at DATETIME NULL,
-                    INDEX idx_streamer_todos_streamer (streamer_id)
-                )"""
-            )
-            # Finanzen / EÜR
-            cur.execute(
-                """CREATE TABLE IF NOT EXISTS streamer_finances (
-                    finance_id INT AUTO_INCREMENT PRIMARY KEY,
-                    streamer_id INT NOT NULL,
-                    booking_date DATETIME NOT NULL,
-                    description VARCHAR(255) NOT NULL,
-                    amount DECIMAL(10,2) NOT NULL,
-                    entry_type VARCHAR(20) NOT NULL,
-                    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
-                    updated_at DATETIME NULL,
-                    INDEX idx_streamer_finances_streamer (streamer_id),
-                    INDEX idx_streamer_finances_date (booking_date)
-                )"""
-            )
-            # Content Planung (Content + Streamplanung)
-            cur.execute(
-                """CREATE TABLE IF NOT EXISTS content (
-                    content_id BIGINT UNSIGNED NOT NULL AUTO_INCREMENT PRIMARY KEY,
-                    titel VARCHAR(150) NOT NULL,
-                    beschreibung TEXT DEFAULT NULL,
-                    kategorie VARCHAR(50) DEFAULT NULL,
-                    plattform VARCHAR(50) DEFAULT NULL,
-                    erstellt_am DATETIME DEFAULT CURRENT_TIMESTAMP
-                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci"""
-            )
-            cur.execute(
-                """CREATE TABLE IF NOT EXISTS stream_planung (
-                    plan_id BIGINT UNSIGNED NOT NULL AUTO_INCREMENT PRIMARY KEY,
-                    streamer_id BIGINT UNSIGNED NOT NULL,
-                    content_id BIGINT UNSIGNED DEFAULT NULL,
-                    datum DATETIME NOT NULL,
-                    thema VARCHAR(200) DEFAULT NULL,
-                    status VARCHAR(20) DEFAULT 'geplant',
-                    INDEX idx_stream_planung_streamer (streamer_id),
-                    INDEX idx_stream_planung_datum (datum),
-                    INDEX idx_stream_planung_content (content_id)
-                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci"""
-            )
+    # ---------- DB: SNAPSHOT ----------
+    def _db_load_snapshot(self, marks=None) -> DashboardSnapshot:
+        """Lädt ToDos, Finanzen und Streamplanung in einem Round-Trip.
 
-            db.commit()
-        finally:
-            try:
-                db.close()
-            except Exception:
-                pass
+        Ein einziges UNION-ALL-Statement auf einer Pool-Verbindung: alle
+        Listen stammen damit aus demselben Lese-Snapshot. Sind in `marks`
+        Wasserstände gesetzt, kommen nur Änderungen und Löschungen seitdem.
+        """
+        if not self.streamer_id:
+            return DashboardSnapshot()
+        sid = int(self.streamer_id)
+        since = (marks or {}).get("since")
 
-    # ---------- DB: TODOS ----------
-    def _db_load_todos(self):
-        db = self._db()
-        try:
+        with self._db() as db:
             cur = db.cursor(dictionary=True)
+            # Wasserstand VOR dem Lesen nehmen (Server-Uhr, gleiche wie für updated_at)
+            cur.execute("SELECT NOW() AS now")
+            read_started = cur.fetchone()["now"]
+
+            # Zu alter Wasserstand: Tombstones seitdem evtl. aufgeräumt → voll laden
+            is_delta = since is not None and since >= read_started - SYNC_MAX_DELTA_AGE
+            if is_delta:
+                todo_sql = "AND t.updated_at >= ?"
+                fin_sql = "AND f.updated_at >= ?"
+                tomb_sql = "UNION ALL" + _TOMBSTONE_DELTA_PART
+                params = [sid, since, sid, since, sid, sid, since]
+            else:
+                todo_sql = fin_sql = tomb_sql = ""
+                params = [sid, sid, sid]
+
+            query = _SNAPSHOT_QUERY.format(todo_since=todo_sql, fin_since=fin_sql, tombstones=tomb_sql)
+            cur.execute(query, tuple(params))
+            rows = cur.fetchall() or []
+
+        snap = DashboardSnapshot(is_delta=is_delta)
+        for r in rows:
+            kind = r["kind"]
+            if kind == "todo":
+                snap.todos.append(_todo_from_row({"id": r["id"], "task": r["text"], "done": r["done"]}))
+            elif kind == "finance":
+                snap.finances.append(_finance_from_row({
+                    "id": r["id"], "date": r["ts"], "desc": r["text"],
+                    "amount": r["amount"], "type": r["entry_type"],
+                }))
+            elif kind == "plan":
+                snap.planned_streams.append(_plan_from_row({
+                    "plan_id": r["id"], "content_id": r["content_id"], "datum": r["ts"],
+                    "thema": r["thema"], "status": r["status"],
+                    "content_title": r["text"], "content_game": r["game"],
+                }))
+            elif kind == "deleted":
+                snap.deleted.append((r["text"], int(r["id"])))
+        snap.marks = {"since": read_started - SYNC_SAFETY_MARGIN}
+
+        # Sortierung wie bei den Einzel-Loadern
+        snap.todos.sort(key=lambda t: t["id"], reverse=True)
+        snap.finances.sort(key=lambda f: (f["date"], f["id"]), reverse=True)
+        snap.planned_streams.sort(key=lambda p: p["date"])
+        return snap
+
+    def _db_write_tombstone(self, cur, table_name: str, row_id: int):
+        """Merkt eine Löschung für den Delta-Sync (gleiche Transaktion wie das DELETE)."""
+        if cur.rowcount:
             cur.execute(
-                """SELECT todo_id AS id, task, done
-                   FROM streamer_todos
-                  WHERE streamer_id = ?
-                  ORDER BY todo_id DESC""",
-                (int(self.streamer_id),)
+                """INSERT INTO dashboard_tombstones (table_name, row_id, streamer_id)
+                   VALUES (?, ?, ?)""",
+                (table_name, int(row_id), int(self.streamer_id))
             )
-            rows = cur.fetchall() or []
-            return [
-                {"id": r["id"], "task": r["task"], "done": bool(r["done"])}
-                for r in rows
-            ]
-        finally:
-            try:
-                db.close()
-            except Exception:
-                pass
+
+    # ---------- DB: TODOS ----------
 
     def _db_insert_todo(self, task: str) -> int:
         if not self.streamer_id:
             raise ValueError("Kein streamer_id in der Session gefunden.")
-        db = self._db()
-        try:
+        with self._db() as db:
             cur = db.cursor()
             cur.execute(
                 """INSERT INTO streamer_todos (streamer_id, task, done)
@@ -326,15 +501,9 @@ class StreamerDashboard(ctk.CTk):
             )
             db.commit()
             return int(cur.lastrowid)
-        finally:
-            try:
-                db.close()
-            except Exception:
-                pass
 
     def _db_update_todo_done(self, todo_id: int, done: int):
-        db = self._db()
-        try:
+        with self._db() as db:
             cur = db.cursor()
             cur.execute(
                 """UPDATE streamer_todos
@@ -343,15 +512,9 @@ class StreamerDashboard(ctk.CTk):
                 (int(done), int(todo_id), int(self.streamer_id))
             )
             db.commit()
-        finally:
-            try:
-                db.close()
-            except Exception:
-                pass
 
     def _db_update_todo_task(self, todo_id: int, task: str):
-        db = self._db()
-        try:
+        with self._db() as db:
             cur = db.cursor()
             cur.execute(
                 """UPDATE streamer_todos
@@ -360,68 +523,21 @@ class StreamerDashboard(ctk.CTk):
                 (task[:60], int(todo_id), int(self.streamer_id))
             )
             db.commit()
-        finally:
-            try:
-                db.close()
-            except Exception:
-                pass
 
     def _db_delete_todo(self, todo_id: int):
-        db = self._db()
-        try:
+        with self._db() as db:
             cur = db.cursor()
             cur.execute(
                 """DELETE FROM streamer_todos
                     WHERE todo_id = ? AND streamer_id = ?""",
                 (int(todo_id), int(self.streamer_id))
             )
+            self._db_write_tombstone(cur, "streamer_todos", todo_id)
             db.commit()
-        finally:
-            try:
-                db.close()
-            except Exception:
-                pass
 
     # ---------- DB: FINANCES ----------
-    def _db_load_finances(self):
-        db = self._db()
-        try:
-            cur = db.cursor(dictionary=True)
-            cur.execute(
-                """SELECT finance_id AS id,
-                          DATE_FORMAT(booking_date, '%Y-%m-%d %H:%i') AS date,
-                          description AS `desc`,
-                          amount,
-                          entry_type AS `type`
-                     FROM streamer_finances
-                    WHERE streamer_id = ?
-                    ORDER BY booking_date DESC, finance_id DESC""",
-                (int(self.streamer_id),)
-            )
-            rows = cur.fetchall() or []
-            out = []
-            for r in rows:
-                try:
-                    amt = float(r["amount"])
-                except Exception:
-                    amt = r["amount"]
-                out.append({
-                    "id": r["id"],
-                    "date": r["date"],
-                    "desc": r["desc"],
-                    "amount": amt,
-                    "type": r["type"],
-                })
-            return out
-        finally:
-            try:
-                db.close()
-            except Exception:
-                pass
-
     def _db_insert_finance(self, iso_date: str, desc: str, amount: float, entry_type: str) -> int:
-        db = self._db()
-        try:
+        with self._db() as db:
             cur = db.cursor()
             cur.execute(
                 """INSERT INTO streamer_finances (streamer_id, booking_date, description, amount, entry_type)
@@ -430,15 +546,9 @@ class StreamerDashboard(ctk.CTk):
             )
             db.commit()
             return int(cur.lastrowid)
-        finally:
-            try:
-                db.close()
-            except Exception:
-                pass
 
     def _db_update_finance(self, finance_id: int, iso_date: str, desc: str, amount: float, entry_type: str):
-        db = self._db()
-        try:
+        with self._db() as db:
             cur = db.cursor()
             cur.execute(
                 """UPDATE streamer_finances
@@ -447,27 +557,17 @@ class StreamerDashboard(ctk.CTk):
                 (iso_date, desc[:255], float(amount), str(entry_type)[:20], int(finance_id), int(self.streamer_id))
             )
             db.commit()
-        finally:
-            try:
-                db.close()
-            except Exception:
-                pass
 
     def _db_delete_finance(self, finance_id: int):
-        db = self._db()
-        try:
+        with self._db() as db:
             cur = db.cursor()
             cur.execute(
                 """DELETE FROM streamer_finances
                     WHERE finance_id = ? AND streamer_id = ?""",
                 (int(finance_id), int(self.streamer_id))
             )
+            self._db_write_tombstone(cur, "streamer_finances", finance_id)
             db.commit()
-        finally:
-            try:
-                db.close()
-            except Exception:
-                pass
 
 
     # ---------- DB: CONTENT PLANNING ----------
@@ -475,8 +575,7 @@ class StreamerDashboard(ctk.CTk):
         """Lädt Streamplanung streamer-spezifisch aus der DB."""
         if not self.streamer_id:
             return []
-        db = self._db()
-        try:
+        with self._db() as db:
             cur = db.cursor(dictionary=True)
             cur.execute(
                 """SELECT sp.plan_id, sp.content_id, sp.datum, sp.thema, sp.status,
@@ -488,35 +587,13 @@ class StreamerDashboard(ctk.CTk):
                 (int(self.streamer_id),)
             )
             rows = cur.fetchall() or []
-            out = []
-            for r in rows:
-                dt = r.get("datum")
-                if hasattr(dt, "strftime"):
-                    iso_date = dt.strftime("%Y-%m-%d %H:%M")
-                else:
-                    # Fallback: already string?
-                    iso_date = str(dt)[:16]
-                out.append({
-                    "id": int(r["plan_id"]),
-                    "content_id": int(r["content_id"]) if r.get("content_id") is not None else None,
-                    "title": (r.get("content_title") or r.get("thema") or "").strip(),
-                    "game": (r.get("content_game") or "").strip(),
-                    "date": iso_date,
-                    "status": (r.get("status") or "geplant")
-                })
-            return out
-        finally:
-            try:
-                db.close()
-            except Exception:
-                pass
+            return [_plan_from_row(r) for r in rows]
 
     def _db_create_planned_stream(self, title: str, game: str, iso_date: str) -> int:
         """Erstellt Content + Streamplanung (streamer-spezifisch). Gibt plan_id zurück."""
         if not self.streamer_id:
             raise ValueError("Kein streamer_id in der Session gefunden.")
-        db = self._db()
-        try:
+        with self._db() as db:
             cur = db.cursor()
             # Content-Datensatz anlegen (global, aber Zugriff erfolgt nur über stream_planung + streamer_id)
             cur.execute(
@@ -533,18 +610,12 @@ class StreamerDashboard(ctk.CTk):
             plan_id = cur.lastrowid
             db.commit()
             return int(plan_id)
-        finally:
-            try:
-                db.close()
-            except Exception:
-                pass
 
     def _db_update_planned_stream(self, plan_id: int, content_id, title: str, game: str, iso_date: str):
         """Aktualisiert Streamplanung + Content."""
         if not self.streamer_id:
             raise ValueError("Kein streamer_id in der Session gefunden.")
-        db = self._db()
-        try:
+        with self._db() as db:
             cur = db.cursor()
             # Content aktualisieren / neu anlegen falls fehlt
             if content_id:
@@ -570,18 +641,12 @@ class StreamerDashboard(ctk.CTk):
                 (iso_date, title[:200], new_content_id, int(plan_id), int(self.streamer_id))
             )
             db.commit()
-        finally:
-            try:
-                db.close()
-            except Exception:
-                pass
 
     def _db_delete_planned_stream(self, plan_id: int):
         """Löscht einen geplanten Stream streamer-spezifisch und entfernt verwaisten Content."""
         if not self.streamer_id:
             raise ValueError("Kein streamer_id in der Session gefunden.")
-        db = self._db()
-        try:
+        with self._db() as db:
             cur = db.cursor()
             cur.execute(
                 """SELECT content_id
@@ -619,17 +684,11 @@ class StreamerDashboard(ctk.CTk):
 
             db.commit()
             return True
-        finally:
-            try:
-                db.close()
-            except Exception:
-                pass
 
     def _load_team_from_db(self):
         """Lädt Moderator/Manager Nutzer aus der DB."""
         team = []
-        db = self._db()
-        try:
+        with self._db() as db:
             cur = db.cursor(dictionary=True)
             if self.streamer_id:
                 # Moderatoren, die diesem Streamer zugewiesen sind
@@ -727,11 +786,6 @@ class StreamerDashboard(ctk.CTk):
                         "role_id": role_id,
                         "since": r["created_at"].strftime("%Y-%m-%d %H:%M") if hasattr(r["created_at"], "strftime") else str(r["created_at"])
                     })
-        finally:
-            try:
-                db.close()
-            except Exception:
-                pass
         return team
 
     def _setup_sidebar(self):
@@ -803,12 +857,16 @@ class StreamerDashboard(ctk.CTk):
         self.content_frame.grid(row=0, column=1, sticky="nsew", padx=20, pady=20)
 
     def show_view(self, view_name):
+        builders = {
+            "Overview": self._view_overview,
+            "Content": self._view_content,
+            "Finance": self._view_finance,
+            "Team": self._view_team,
+        }
+        if view_name not in builders:
+            return
         self._current_view = view_name
         self.focus() # Prevent Widget Focus Error
-        
-        # Frame leeren
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
 
         # Navigation Highlight
         for name, btn in self.nav_buttons.items():
@@ -817,48 +875,58 @@ class StreamerDashboard(ctk.CTk):
             else:
                 btn.configure(fg_color="transparent", text_color=COLOR_TEXT)
 
-        # View laden
-        if view_name == "Overview": self._view_overview()
-        elif view_name == "Content": self._view_content()
-        elif view_name == "Finance": self._view_finance()
-        elif view_name == "Team": self._view_team()
+        # View beim ersten Aufruf bauen, danach nur noch bei Bedarf aktualisieren
+        view = self._views.get(view_name)
+        if view is None:
+            view = ctk.CTkFrame(self.content_frame, fg_color="transparent")
+            self._views[view_name] = view
+            self._dirty_views.discard(view_name)
+            builders[view_name](view)
+        elif view_name in self._dirty_views:
+            self._refresh_view(view_name)
+
+        for name, frame in self._views.items():
+            if name != view_name and frame.winfo_manager():
+                frame.pack_forget()
+        if not view.winfo_manager():
+            view.pack(fill="both", expand=True)
+
+    def _invalidate_views(self, *view_names):
+        """Markiert Views als veraltet; die sichtbare wird im nächsten Render-Fenster aktualisiert."""
+        for name in view_names:
+            self._dirty_views.add(name)
+        current = getattr(self, "_current_view", None)
+        if current in view_names and current in self._views:
+            self._render_scheduler.request(("view", current), lambda: self._render_if_dirty(current))
+
+    def _render_if_dirty(self, view_name):
+        # Zwischenzeitlich weggeschaltet oder schon aktualisiert -> nichts tun
+        if view_name == self._current_view and view_name in self._dirty_views:
+            self._refresh_view(view_name)
+
+    def _refresh_view(self, view_name):
+        self._dirty_views.discard(view_name)
+        if view_name == "Overview": self._refresh_overview()
+        elif view_name == "Content": self._refresh_content_list()
+        elif view_name == "Finance": self._refresh_finance_list()
+        elif view_name == "Team": self._refresh_team_list()
 
     # --- VIEW: OVERVIEW ---
     
-    def _view_overview(self):
-        self._add_title("Dashboard Übersicht")
-
-        # ---------- Twitch Stats (asynchron laden) ----------
-        stats = self._overview_stats_cache or {}
-
-        followers_total = stats.get("followers_total")
-        new_followers = stats.get("new_followers_7d")
-        subs_total = stats.get("subs_total")
-        avg_views = stats.get("avg_views_last_streams")
+    def _view_overview(self, parent):
+        self._add_title(parent, "Dashboard Übersicht")
 
-        # Fallback / Loading-Anzeigen
-        followers_val = str(followers_total) if followers_total is not None else "..."
-        followers_sub = f"+{new_followers} diese Woche" if isinstance(new_followers, int) else "lädt…"
-
-        subs_val = str(subs_total) if subs_total is not None else "…"
-        subs_sub = "Twitch" if subs_total is not None else "lädt…"
-
-        avg_val = str(avg_views) if avg_views is not None else "…"
-        avg_sub = "Ø Aufrufe (VODs)" if avg_views is not None else "lädt…"
-
-        stats_grid = ctk.CTkFrame(self.content_frame, fg_color="transparent")
+        stats_grid = ctk.CTkFrame(parent, fg_color="transparent")
         stats_grid.pack(fill="x", pady=10)
         stats_grid.columnconfigure((0,1,2), weight=1)
 
-        self._create_stat_card(stats_grid, 0, "Aktuelle Follower", followers_val, followers_sub, COLOR_PRIMARY)
-        self._create_stat_card(stats_grid, 1, "Subscriber", subs_val, subs_sub, "#D2601A")
-        self._create_stat_card(stats_grid, 2, "Ø Aufrufe", avg_val, avg_sub, COLOR_SUCCESS)
-
-        # Falls noch nicht geladen: im Hintergrund laden und danach View neu rendern
-        if self._overview_stats_cache is None and self.session and getattr(self.session, "twitch_token", None):
-            self._load_overview_stats_async()
+        self._overview_cards = (
+            self._create_stat_card(stats_grid, 0, "Aktuelle Follower", "...", "lädt…", COLOR_PRIMARY),
+            self._create_stat_card(stats_grid, 1, "Subscriber", "…", "lädt…", "#D2601A"),
+            self._create_stat_card(stats_grid, 2, "Ø Aufrufe", "…", "lädt…", COLOR_SUCCESS),
+        )
 
-        bottom_frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
+        bottom_frame = ctk.CTkFrame(parent, fg_color="transparent")
         bottom_frame.pack(fill="both", expand=True, pady=20)
         bottom_frame.columnconfigure((0, 1), weight=1)
         bottom_frame.rowconfigure(0, weight=1)
@@ -884,13 +952,72 @@ class StreamerDashboard(ctk.CTk):
 
         self.todo_list_scroll = ctk.CTkScrollableFrame(todo_frame, fg_color="transparent")
         self.todo_list_scroll.pack(fill="both", expand=True, padx=5, pady=5)
-        self._refresh_todo_list()
 
         # Nächster Stream Info (aus lokaler Planung)
         next_frame = ctk.CTkFrame(bottom_frame, fg_color=COLOR_CARD)
         next_frame.grid(row=0, column=1, sticky="nsew", padx=(10, 0))
 
         ctk.CTkLabel(next_frame, text="🚀 Nächster Stream", font=ctk.CTkFont(size=18, weight="bold")).pack(pady=15, padx=15, anchor="w")
+        self._next_stream_body = ctk.CTkFrame(next_frame, fg_color="transparent")
+        self._next_stream_body.pack(fill="both", expand=True)
+
+        self._refresh_overview()
+
+    def _refresh_overview(self):
+        """Aktualisiert Stat-Karten, ToDo-Liste und 'Nächster Stream' in der gecachten View."""
+        if not _alive(getattr(self, "_next_stream_body", None)):
+            return
+
+        # ---------- Twitch Stats (asynchron laden, je Karte einzeln) ----------
+        for name in self._OVERVIEW_STATS:
+            self._refresh_stat_card(name)
+
+        # Falls noch nicht geladen: im Hintergrund laden, die Karten füllen sich einzeln
+        if self._overview_stats_cache is None and self.session and getattr(self.session, "twitch_token", None):
+            self._load_overview_stats_async()
+
+        self._refresh_todo_list()
+        self._refresh_next_stream()
+
+    def _refresh_stat_card(self, name):
+        """Setzt Wert und Untertitel genau einer Stat-Karte."""
+        cards = getattr(self, "_overview_cards", None)
+        if not cards or not _alive(cards[0]):
+            return
+        stats = self._overview_stats_cache or {}
+
+        if name == "followers":
+            followers_total = stats.get("followers_total")
+            new_followers = stats.get("new_followers_7d")
+            has_value = followers_total is not None
+            val = str(followers_total) if has_value else "..."
+            sub = f"+{new_followers} diese Woche" if isinstance(new_followers, int) else "lädt…"
+        elif name == "subs":
+            subs_total = stats.get("subs_total")
+            has_value = subs_total is not None
+            val = str(subs_total) if has_value else "…"
+            sub = "Twitch" if has_value else "lädt…"
+        else:
+            avg_views = stats.get("avg_views_last_streams")
+            has_value = avg_views is not None
+            val = str(avg_views) if has_value else "…"
+            sub = "Ø Aufrufe (VODs)" if has_value else "lädt…"
+
+        if name in self._overview_stats_failed and not has_value:
+            val, sub = "–", "nicht verfügbar"
+        elif name in self._overview_stats_stale and has_value and self._overview_stats_saved_at:
+            # Wert aus dem Platten-Cache: anzeigen, aber als veraltet kennzeichnen
+            stand = datetime.fromtimestamp(self._overview_stats_saved_at).strftime("%d.%m. %H:%M")
+            sub = f"{sub} · Stand {stand}"
+
+        card = cards[self._OVERVIEW_STATS.index(name)]
+        card.value_label.configure(text=val)
+        card.sub_label.configure(text=sub)
+
+    def _refresh_next_stream(self):
+        body = self._next_stream_body
+        for w in body.winfo_children():
+            w.destroy()
 
         nxt = get_next_stream(self.planned_streams)
 
@@ -899,23 +1026,23 @@ class StreamerDashboard(ctk.CTk):
             date_part = de_date.split(" ")[0] if de_date else ""
             time_part = de_date.split(" ")[1] if " " in de_date else ""
 
-            ctk.CTkLabel(next_frame, text=f"{date_part} {time_part} Uhr", font=ctk.CTkFont(size=32, weight="bold"), text_color=COLOR_PRIMARY[1]).pack(pady=(20, 5))
-            ctk.CTkLabel(next_frame, text=nxt.get("title", ""), font=ctk.CTkFont(size=22)).pack(pady=5)
-            ctk.CTkLabel(next_frame, text=f"Game: {nxt.get('game','')}", font=ctk.CTkFont(size=16, slant="italic")).pack(pady=5)
+            ctk.CTkLabel(body, text=f"{date_part} {time_part} Uhr", font=ctk.CTkFont(size=32, weight="bold"), text_color=COLOR_PRIMARY[1]).pack(pady=(20, 5))
+            ctk.CTkLabel(body, text=nxt.get("title", ""), font=ctk.CTkFont(size=22)).pack(pady=5)
+            ctk.CTkLabel(body, text=f"Game: {nxt.get('game','')}", font=ctk.CTkFont(size=16, slant="italic")).pack(pady=5)
 
             score = nxt.get("score")
             if isinstance(score, int):
                 score_color = COLOR_SUCCESS if score > 80 else "#D2601A"
-                ctk.CTkLabel(next_frame, text=f"📈 KI-Potenzial Score: {score}/100", text_color=score_color, font=ctk.CTkFont(weight="bold")).pack(pady=20)
+                ctk.CTkLabel(body, text=f"📈 KI-Potenzial Score: {score}/100", text_color=score_color, font=ctk.CTkFont(weight="bold")).pack(pady=20)
         else:
-            ctk.CTkLabel(next_frame, text="Keine zukünftigen Streams geplant.", font=ctk.CTkFont(size=20), text_color="gray").pack(pady=50)
+            ctk.CTkLabel(body, text="Keine zukünftigen Streams geplant.", font=ctk.CTkFont(size=20), text_color="gray").pack(pady=50)
 
     # --- VIEW: CONTENT PLANNING ---
 
-    def _view_content(self):
-        self._add_title("Content & Stream Planung")
+    def _view_content(self, parent):
+        self._add_title(parent, "Content & Stream Planung")
         
-        grid = ctk.CTkFrame(self.content_frame, fg_color="transparent")
+        grid = ctk.CTkFrame(parent, fg_color="transparent")
         grid.pack(fill="both", expand=True)
         grid.columnconfigure(0, weight=2)
         grid.columnconfigure(1, weight=1)
@@ -926,11 +1053,13 @@ class StreamerDashboard(ctk.CTk):
         plan_frame.grid(row=0, column=0, sticky="nsew", padx=(0, 10))
         ctk.CTkLabel(plan_frame, text="Geplante Streams", font=ctk.CTkFont(size=18, weight="bold")).pack(pady=15, padx=15, anchor="w")
         
-        self.scroll_plan = ctk.CTkScrollableFrame(plan_frame, fg_color="transparent")
-        self.scroll_plan.pack(fill="both", expand=True, padx=10, pady=10)
-        self._refresh_content_list()
+        # Button vor der Liste packen, damit er bei wenig Platz nicht verdrängt wird
+        ctk.CTkButton(plan_frame, text="+ Neuen Stream planen", fg_color=COLOR_PRIMARY, height=40, command=lambda: self._content_popup(None)).pack(side="bottom", fill="x", padx=15, pady=15)
 
-        ctk.CTkButton(plan_frame, text="+ Neuen Stream planen", fg_color=COLOR_PRIMARY, height=40, command=lambda: self._content_popup(None)).pack(fill="x", padx=15, pady=15)
+        self.plan_list = VirtualList(plan_frame, row_height=40, row_gap=10,
+                                     create_row=self._create_plan_row, bind_row=self._bind_plan_row)
+        self.plan_list.pack(fill="both", expand=True, padx=10, pady=10)
+        self._refresh_content_list()
 
         # KI Chat
         ai_frame = ctk.CTkFrame(grid, fg_color=COLOR_CARD)
@@ -950,24 +1079,20 @@ class StreamerDashboard(ctk.CTk):
         ctk.CTkButton(entry_frame, text="Senden", width=60, command=self._send_ai_message).pack(side="right")
 
     # --- VIEW: FINANCE ---
-    def _view_finance(self):
-        self._add_title("Finanzen & EÜR")
+    def _view_finance(self, parent):
+        self._add_title(parent, "Finanzen & EÜR")
 
-        top_grid = ctk.CTkFrame(self.content_frame, fg_color="transparent")
+        top_grid = ctk.CTkFrame(parent, fg_color="transparent")
         top_grid.pack(fill="x", pady=10)
         top_grid.columnconfigure((0,1,2), weight=1)
 
-        income = sum(x["amount"] for x in self.finances if x["type"] == "Einnahme")
-        expenses = sum(x["amount"] for x in self.finances if x["type"] == "Ausgabe")
-        profit = income - expenses
-
-        self._create_stat_card(top_grid, 0, "Gesamteinnahmen", f"{income:.2f} €", "Dieser Monat", COLOR_SUCCESS)
-        self._create_stat_card(top_grid, 1, "Gesamtausgaben", f"{expenses:.2f} €", "Dieser Monat", "#D2601A")
-        
-        color_profit = COLOR_SUCCESS if profit >= 0 else COLOR_DANGER
-        self._create_stat_card(top_grid, 2, "Gewinn / Verlust", f"{profit:.2f} €", "Vor Steuern", color_profit)
+        self._fin_cards = (
+            self._create_stat_card(top_grid, 0, "Gesamteinnahmen", "", "Dieser Monat", COLOR_SUCCESS),
+            self._create_stat_card(top_grid, 1, "Gesamtausgaben", "", "Dieser Monat", "#D2601A"),
+            self._create_stat_card(top_grid, 2, "Gewinn / Verlust", "", "Vor Steuern", COLOR_SUCCESS),
+        )
 
-        list_container = ctk.CTkFrame(self.content_frame, fg_color=COLOR_CARD)
+        list_container = ctk.CTkFrame(parent, fg_color=COLOR_CARD)
         list_container.pack(fill="both", expand=True, pady=20)
         
         header = ctk.CTkFrame(list_container, fg_color="transparent")
@@ -980,17 +1105,27 @@ class StreamerDashboard(ctk.CTk):
         ctk.CTkButton(btn_frame, text="📄 PDF Export", command=self._export_pdf, fg_color="gray50", width=120).pack(side="left", padx=5)
         ctk.CTkButton(btn_frame, text="📊 CSV Export", command=self._export_csv, fg_color="gray50", width=120).pack(side="left", padx=5)
 
-        self.scroll_fin = ctk.CTkScrollableFrame(list_container, fg_color="transparent")
-        self.scroll_fin.pack(fill="both", expand=True, padx=10, pady=10)
+        head_row = ctk.CTkFrame(list_container, fg_color="transparent")
+        head_row.pack(fill="x", padx=10, pady=5)
+        ctk.CTkLabel(head_row, text="Datum", width=120, anchor="w", font=ctk.CTkFont(weight="bold")).pack(side="left", padx=5)
+        ctk.CTkLabel(head_row, text="Beschreibung", width=250, anchor="w", font=ctk.CTkFont(weight="bold")).pack(side="left", padx=5)
+        ctk.CTkLabel(head_row, text="Typ", width=80, anchor="w", font=ctk.CTkFont(weight="bold")).pack(side="left", padx=5)
+        ctk.CTkLabel(head_row, text="Betrag", width=80, anchor="e", font=ctk.CTkFont(weight="bold")).pack(side="left", padx=5)
+        ctk.CTkLabel(head_row, text="Aktion", width=80, anchor="e", font=ctk.CTkFont(weight="bold")).pack(side="right", padx=15)
+        ctk.CTkFrame(list_container, height=2, fg_color="gray50").pack(fill="x", padx=10, pady=5)
+
+        self.fin_list = VirtualList(list_container, row_height=32,
+                                    create_row=self._create_finance_row, bind_row=self._bind_finance_row)
+        self.fin_list.pack(fill="both", expand=True, padx=10, pady=10)
 
         self._refresh_finance_list()
 
     # --- VIEW: TEAM ---
-    def _view_team(self):
-        self._add_title("Team & Rollenverwaltung")
+    def _view_team(self, parent):
+        self._add_title(parent, "Team & Rollenverwaltung")
         
         # ... (Rest wie vorher)
-        list_frame = ctk.CTkFrame(self.content_frame, fg_color=COLOR_CARD)
+        list_frame = ctk.CTkFrame(parent, fg_color=COLOR_CARD)
         list_frame.pack(fill="both", expand=True)
         
         header = ctk.CTkFrame(list_frame, fg_color="transparent")
@@ -998,26 +1133,34 @@ class StreamerDashboard(ctk.CTk):
         ctk.CTkLabel(header, text="Aktive Rollen", font=ctk.CTkFont(size=20, weight="bold")).pack(side="left")
         ctk.CTkButton(header, text="+ Neuen Nutzer anlegen", command=self._role_popup, fg_color=COLOR_PRIMARY).pack(side="right")
 
-        self.scroll_team = ctk.CTkScrollableFrame(list_frame, fg_color="transparent")
-        self.scroll_team.pack(fill="both", expand=True, padx=20, pady=(0, 20))
+        self.team_list = VirtualList(list_frame, row_height=76, row_gap=10,
+                                     create_row=self._create_team_row, bind_row=self._bind_team_row,
+                                     empty_text="Keine Team-Mitglieder gefunden.")
+        self.team_list.pack(fill="both", expand=True, padx=20, pady=(0, 20))
         
         self._refresh_team_list()
 
     # --- HELPERS / REFRESHERS ---
-    def _add_title(self, text):
-        ctk.CTkLabel(self.content_frame, text=text, font=ctk.CTkFont(size=28, weight="bold"), anchor="w").pack(fill="x", pady=(0, 20))
+    def _add_title(self, parent, text):
+        ctk.CTkLabel(parent, text=text, font=ctk.CTkFont(size=28, weight="bold"), anchor="w").pack(fill="x", pady=(0, 20))
 
     def _create_stat_card(self, parent, col, title, value, subtext, color):
         card = ctk.CTkFrame(parent, fg_color=COLOR_CARD)
         card.grid(row=0, column=col, sticky="nsew", padx=10)
-        ctk.CTkFrame(card, height=5, fg_color=color, corner_radius=0).pack(fill="x")
+        card.accent = ctk.CTkFrame(card, height=5, fg_color=color, corner_radius=0)
+        card.accent.pack(fill="x")
         content = ctk.CTkFrame(card, fg_color="transparent")
         content.pack(padx=20, pady=20, fill="both")
         ctk.CTkLabel(content, text=title, font=ctk.CTkFont(size=14, weight="bold"), text_color="gray").pack(anchor="w")
-        ctk.CTkLabel(content, text=value, font=ctk.CTkFont(size=32, weight="bold")).pack(anchor="w", pady=(5, 0))
-        ctk.CTkLabel(content, text=subtext, font=ctk.CTkFont(size=12), text_color=color).pack(anchor="w", pady=(5, 0))
+        card.value_label = ctk.CTkLabel(content, text=value, font=ctk.CTkFont(size=32, weight="bold"))
+        card.value_label.pack(anchor="w", pady=(5, 0))
+        card.sub_label = ctk.CTkLabel(content, text=subtext, font=ctk.CTkFont(size=12), text_color=color)
+        card.sub_label.pack(anchor="w", pady=(5, 0))
+        return card
 
     def _refresh_todo_list(self):
+        if not _alive(getattr(self, "todo_list_scroll", None)):
+            return
         for w in self.todo_list_scroll.winfo_children(): w.destroy()
         
         for item in self.todos:
@@ -1040,119 +1183,150 @@ class StreamerDashboard(ctk.CTk):
                           command=lambda i=item: self._delete_todo(i)).pack(side="left", padx=2)
 
     def _refresh_content_list(self):
-        for w in self.scroll_plan.winfo_children(): w.destroy()
-        
+        if not _alive(getattr(self, "plan_list", None)):
+            return
         # Sortierte Anzeige (nur für die Liste, Originaldaten bleiben)
         sorted_streams = sorted(self.planned_streams, key=lambda x: datetime.strptime(x["date"], "%Y-%m-%d %H:%M"))
-
-        for stream in sorted_streams:
-            card = ctk.CTkFrame(self.scroll_plan, fg_color="gray80" if ctk.get_appearance_mode()=="Light" else "gray20")
-            card.pack(fill="x", pady=5)
-            
-            de_date = format_date_de(stream["date"])
-            
-            ctk.CTkLabel(card, text=de_date, width=150, font=ctk.CTkFont(weight="bold")).pack(side="left", padx=10)
-            ctk.CTkLabel(card, text=f"{stream['title']} ({stream['game']})", anchor="w").pack(side="left", fill="x", expand=True)
-            ctk.CTkButton(card, text="Bearbeiten", width=80, fg_color="transparent", border_width=1, text_color=COLOR_TEXT,
-                         command=lambda s=stream: self._content_popup(s)).pack(side="right", padx=10, pady=5)
+        self.plan_list.set_items(sorted_streams)
+
+    def _create_plan_row(self, frame):
+        row = {}
+        card = ctk.CTkFrame(frame, fg_color=("gray80", "gray20"))
+        card.pack(fill="both", expand=True)
+        row["date"] = ctk.CTkLabel(card, text="", width=150, font=ctk.CTkFont(weight="bold"))
+        row["date"].pack(side="left", padx=10)
+        row["title"] = ctk.CTkLabel(card, text="", anchor="w")
+        row["title"].pack(side="left", fill="x", expand=True)
+        ctk.CTkButton(card, text="Bearbeiten", width=80, fg_color="transparent", border_width=1, text_color=COLOR_TEXT,
+                      command=lambda: self._content_popup(row["item"])).pack(side="right", padx=10, pady=5)
+        return row
+
+    def _bind_plan_row(self, row, stream):
+        row["item"] = stream
+        row["date"].configure(text=format_date_de(stream["date"]))
+        row["title"].configure(text=f"{stream['title']} ({stream['game']})")
 
     def _refresh_finance_list(self):
-        # Frame leeren
-        for w in self.scroll_fin.winfo_children(): w.destroy()
-            
-        head_row = ctk.CTkFrame(self.scroll_fin, fg_color="transparent")
-        head_row.pack(fill="x", pady=5)
-        ctk.CTkLabel(head_row, text="Datum", width=120, anchor="w", font=ctk.CTkFont(weight="bold")).pack(side="left", padx=5)
-        ctk.CTkLabel(head_row, text="Beschreibung", width=250, anchor="w", font=ctk.CTkFont(weight="bold")).pack(side="left", padx=5)
-        ctk.CTkLabel(head_row, text="Typ", width=80, anchor="w", font=ctk.CTkFont(weight="bold")).pack(side="left", padx=5)
-        ctk.CTkLabel(head_row, text="Betrag", width=80, anchor="e", font=ctk.CTkFont(weight="bold")).pack(side="left", padx=5)
-        ctk.CTkLabel(head_row, text="Aktion", width=80, anchor="e", font=ctk.CTkFont(weight="bold")).pack(side="right", padx=15)
-        ctk.CTkFrame(self.scroll_fin, height=2, fg_color="gray50").pack(fill="x", pady=5)
-
+        if not _alive(getattr(self, "fin_list", None)):
+            return
         # Sortiere Finanzen nach Datum absteigend (neueste oben)
-        sorted_fin = sorted(self.finances, key=lambda x: x["date"], reverse=True)
-
-        for entry in sorted_fin:
-            row = ctk.CTkFrame(self.scroll_fin, fg_color="transparent")
-            row.pack(fill="x", pady=2)
-            
-            de_date = format_date_de(entry["date"])
-            
-            ctk.CTkLabel(row, text=de_date, width=120, anchor="w").pack(side="left", padx=5)
-            ctk.CTkLabel(row, text=entry["desc"], width=250, anchor="w").pack(side="left", padx=5)
-            
-            type_color = COLOR_SUCCESS if entry["type"] == "Einnahme" else "#D2601A"
-            ctk.CTkLabel(row, text=entry["type"], width=80, text_color=type_color, anchor="w").pack(side="left", padx=5)
-            
-            ctk.CTkLabel(row, text=f"{entry['amount']:.2f} €", width=80, anchor="e").pack(side="left", padx=5)
-
-            btn_box = ctk.CTkFrame(row, fg_color="transparent")
-            btn_box.pack(side="right", padx=5)
-            ctk.CTkButton(btn_box, text="✏️", width=30, fg_color="transparent", text_color="gray",
-                         command=lambda e=entry: self._finance_popup(e)).pack(side="left")
-            ctk.CTkButton(btn_box, text="🗑", width=30, fg_color="transparent", text_color=COLOR_DANGER,
-                         command=lambda e=entry: self._delete_finance(e)).pack(side="left")
+        self.fin_list.set_items(sorted(self.finances, key=lambda x: x["date"], reverse=True))
+        self._update_finance_totals()
 
+    def _place_finance_entry(self, entry):
+        """Sortiert eine neue/geänderte Buchung in die Liste ein, ohne sie neu aufzubauen."""
+        if not _alive(getattr(self, "fin_list", None)):
+            return
+        self.fin_list.remove(entry)
+        items = self.fin_list.items
+        idx = len(items)
+        for i, other in enumerate(items):
+            if other["date"] < entry["date"]:
+                idx = i
+                break
+        self.fin_list.insert(idx, entry)
+        self._update_finance_totals()
+
+    def _update_finance_totals(self):
+        cards = getattr(self, "_fin_cards", None)
+        if not cards or not _alive(cards[0]):
+            return
+        income = sum(x["amount"] for x in self.finances if x["type"] == "Einnahme")
+        expenses = sum(x["amount"] for x in self.finances if x["type"] == "Ausgabe")
+        profit = income - expenses
+        income_card, expense_card, profit_card = cards
+        income_card.value_label.configure(text=f"{income:.2f} €")
+        expense_card.value_label.configure(text=f"{expenses:.2f} €")
+        profit_card.value_label.configure(text=f"{profit:.2f} €")
+        color_profit = COLOR_SUCCESS if profit >= 0 else COLOR_DANGER
+        profit_card.accent.configure(fg_color=color_profit)
+        profit_card.sub_label.configure(text_color=color_profit)
+
+    def _create_finance_row(self, frame):
+        row = {}
+        row["date"] = ctk.CTkLabel(frame, text="", width=120, anchor="w")
+        row["date"].pack(side="left", padx=5)
+        row["desc"] = ctk.CTkLabel(frame, text="", width=250, anchor="w")
+        row["desc"].pack(side="left", padx=5)
+        row["type"] = ctk.CTkLabel(frame, text="", width=80, anchor="w")
+        row["type"].pack(side="left", padx=5)
+        row["amount"] = ctk.CTkLabel(frame, text="", width=80, anchor="e")
+        row["amount"].pack(side="left", padx=5)
+
+        btn_box = ctk.CTkFrame(frame, fg_color="transparent")
+        btn_box.pack(side="right", padx=5)
+        ctk.CTkButton(btn_box, text="✏️", width=30, fg_color="transparent", text_color="gray",
+                      command=lambda: self._finance_popup(row["item"])).pack(side="left")
+        ctk.CTkButton(btn_box, text="🗑", width=30, fg_color="transparent", text_color=COLOR_DANGER,
+                      command=lambda: self._delete_finance(row["item"])).pack(side="left")
+        return row
+
+    def _bind_finance_row(self, row, entry):
+        row["item"] = entry
+        row["date"].configure(text=format_date_de(entry["date"]))
+        row["desc"].configure(text=entry["desc"])
+        type_color = COLOR_SUCCESS if entry["type"] == "Einnahme" else "#D2601A"
+        row["type"].configure(text=entry["type"], text_color=type_color)
+        row["amount"].configure(text=f"{entry['amount']:.2f} €")
 
     def _refresh_team_list(self):
-        for w in self.scroll_team.winfo_children():
-            w.destroy()
-
+        if not _alive(getattr(self, "team_list", None)):
+            return
         try:
             team = self._load_team_from_db()
         except Exception as e:
             mb.showerror("DB Fehler", f"Team konnte nicht geladen werden:\n{e}")
             team = []
-
-        if not team:
-            ctk.CTkLabel(self.scroll_team, text="Keine Team-Mitglieder gefunden.", text_color="gray").pack(pady=15)
-            return
-
-        for user in team:
-            card = ctk.CTkFrame(
-                self.scroll_team,
-                fg_color="gray80" if ctk.get_appearance_mode() == "Light" else "gray25",
-                corner_radius=10
-            )
-            card.pack(fill="x", pady=5)
-
-            ctk.CTkLabel(card, text="👤", font=ctk.CTkFont(size=24)).pack(side="left", padx=15, pady=10)
-
-            info = ctk.CTkFrame(card, fg_color="transparent")
-            info.pack(side="left", fill="y", pady=5)
-
-            ctk.CTkLabel(info, text=user.get("name", ""), font=ctk.CTkFont(size=16, weight="bold"), anchor="w").pack(fill="x")
-
-            de_since = format_date_de(user.get("since", ""))
-            ctk.CTkLabel(info, text=f"Seit: {de_since}", font=ctk.CTkFont(size=12), text_color="gray", anchor="w").pack(fill="x")
-
-            badge_color = "#1c31ba" if user.get("role") == "Manager" else COLOR_SUCCESS
-
-            btn_box = ctk.CTkFrame(card, fg_color="transparent")
-            btn_box.pack(side="right", padx=10)
-
-            ctk.CTkButton(btn_box, text=user.get("role", ""), fg_color=badge_color, width=100, hover=False).pack(side="top", pady=2)
-
-            action_row = ctk.CTkFrame(btn_box, fg_color="transparent")
-            action_row.pack(side="bottom", pady=2)
-
-            # Passwort ändern
-            ctk.CTkButton(
-                action_row, text="🔑", width=30, fg_color="transparent", text_color=COLOR_PRIMARY[1],
-                command=lambda u=user: self._change_password_popup(u)
-            ).pack(side="left")
-
-            # Rolle bearbeiten
-            ctk.CTkButton(
-                action_row, text="✏️", width=30, fg_color="transparent", text_color="gray",
-                command=lambda u=user: self._role_popup(u)
-            ).pack(side="left")
-
-            # Löschen
-            ctk.CTkButton(
-                action_row, text="🗑", width=30, fg_color="transparent", text_color=COLOR_DANGER,
-                command=lambda u=user: self._delete_team_member(u)
-            ).pack(side="left")
+        self.team_list.set_items(team)
+
+    def _create_team_row(self, frame):
+        row = {}
+        card = ctk.CTkFrame(frame, fg_color=("gray80", "gray25"), corner_radius=10)
+        card.pack(fill="both", expand=True)
+
+        ctk.CTkLabel(card, text="👤", font=ctk.CTkFont(size=24)).pack(side="left", padx=15, pady=10)
+
+        info = ctk.CTkFrame(card, fg_color="transparent")
+        info.pack(side="left", fill="y", pady=5)
+        row["name"] = ctk.CTkLabel(info, text="", font=ctk.CTkFont(size=16, weight="bold"), anchor="w")
+        row["name"].pack(fill="x")
+        row["since"] = ctk.CTkLabel(info, text="", font=ctk.CTkFont(size=12), text_color="gray", anchor="w")
+        row["since"].pack(fill="x")
+
+        btn_box = ctk.CTkFrame(card, fg_color="transparent")
+        btn_box.pack(side="right", padx=10)
+
+        row["role"] = ctk.CTkButton(btn_box, text="", width=100, hover=False)
+        row["role"].pack(side="top", pady=2)
+
+        action_row = ctk.CTkFrame(btn_box, fg_color="transparent")
+        action_row.pack(side="bottom", pady=2)
+
+        # Passwort ändern
+        ctk.CTkButton(
+            action_row, text="🔑", width=30, fg_color="transparent", text_color=COLOR_PRIMARY[1],
+            command=lambda: self._change_password_popup(row["item"])
+        ).pack(side="left")
+
+        # Rolle bearbeiten
+        ctk.CTkButton(
+            action_row, text="✏️", width=30, fg_color="transparent", text_color="gray",
+            command=lambda: self._role_popup(row["item"])
+        ).pack(side="left")
+
+        # Löschen
+        ctk.CTkButton(
+            action_row, text="🗑", width=30, fg_color="transparent", text_color=COLOR_DANGER,
+            command=lambda: self._delete_team_member(row["item"])
+        ).pack(side="left")
+        return row
+
+    def _bind_team_row(self, row, user):
+        row["item"] = user
+        row["name"].configure(text=user.get("name", ""))
+        row["since"].configure(text=f"Seit: {format_date_de(user.get('since', ''))}")
+        badge_color = "#1c31ba" if user.get("role") == "Manager" else COLOR_SUCCESS
+        row["role"].configure(text=user.get("role", ""), fg_color=badge_color)
 
     def _toggle_todo(self, item, var):
         """Setzt done-Status und speichert in DB (streamer-spezifisch)."""
@@ -1203,7 +1377,9 @@ class StreamerDashboard(ctk.CTk):
 
         if entry in self.finances:
             self.finances.remove(entry)
-        self.show_view("Finance")  # Refresh
+        if _alive(getattr(self, "fin_list", None)):
+            self.fin_list.remove(entry)
+        self._update_finance_totals()
     def _delete_team_member(self, user):
         if not user or not user.get("user_id"):
             return
@@ -1219,21 +1395,14 @@ class StreamerDashboard(ctk.CTk):
         if not mb.askyesno("Nutzer löschen", f"Soll der Nutzer '{user.get('name')}' wirklich gelöscht werden?"):
             return
 
-        db = None
         try:
-            db = self._db()
-            cur = db.cursor()
-            cur.execute("DELETE FROM users WHERE user_id=?", (int(user["user_id"]),))
-            db.commit()
+            with self._db() as db:
+                cur = db.cursor()
+                cur.execute("DELETE FROM users WHERE user_id=?", (int(user["user_id"]),))
+                db.commit()
             self._refresh_team_list()
         except Exception as e:
             mb.showerror("Fehler", f"Löschen fehlgeschlagen:\n{e}")
-        finally:
-            try:
-                if db:
-                    db.close()
-            except Exception:
-                pass
 
     # ---------- TEAM / USER MANAGEMENT ----------
     def _create_user(self, username: str, email: str, password: str, role_id: int):
@@ -1251,8 +1420,7 @@ class StreamerDashboard(ctk.CTk):
 
         pw_hash = hash_password(password)
 
-        db = self._db()
-        try:
+        with self._db() as db:
             cur = db.cursor()
             cur.execute("SELECT user_id FROM users WHERE username=? OR email=? LIMIT 1", (username, email))
             if cur.fetchone():
@@ -1284,18 +1452,12 @@ class StreamerDashboard(ctk.CTk):
                     cur.execute("INSERT INTO streamer_manager (streamer_id, user_id) VALUES (?,?)", (self.streamer_id, user_id))
             db.commit()
             return user_id
-        finally:
-            try:
-                db.close()
-            except Exception:
-                pass
 
     def _update_user_role(self, user_id: int, role_id: int):
         if role_id not in (2, 3):
             raise RuntimeError("Ungültige Rolle (nur Moderator/Manager).")
 
-        db = self._db()
-        try:
+        with self._db() as db:
             cur = db.cursor()
             cur.execute("DELETE FROM user_roles WHERE user_id=?", (int(user_id),))
             cur.execute("INSERT INTO user_roles (user_id, role_id) VALUES (?,?)", (int(user_id), int(role_id)))
@@ -1338,11 +1500,6 @@ class StreamerDashboard(ctk.CTk):
                     cur.execute("DELETE FROM streamer_manager WHERE user_id=?", (int(user_id),))
 
             db.commit()
-        finally:
-            try:
-                db.close()
-            except Exception:
-                pass
 
     def _set_user_password(self, user_id: int, new_password: str):
         new_password = (new_password or "").strip()
@@ -1351,16 +1508,10 @@ class StreamerDashboard(ctk.CTk):
 
         new_hash = hash_password(new_password)
 
-        db = self._db()
-        try:
+        with self._db() as db:
             cur = db.cursor()
             cur.execute("UPDATE users SET password_hash=? WHERE user_id=?", (new_hash, int(user_id)))
             db.commit()
-        finally:
-            try:
-                db.close()
-            except Exception:
-                pass
 
     def _toggle_theme(self):
         if ctk.get_appearance_mode() == "Dark":
@@ -1369,6 +1520,7 @@ class StreamerDashboard(ctk.CTk):
         else:
             ctk.set_appearance_mode("Dark")
             self.btn_theme.configure(text="🌙 Modus wechseln")
+        self._dirty_views.update(self._views)
         self.show_view("Overview") 
 
     def _fit_popup_to_content(self, window, width, min_height=0, padding=24):
@@ -1491,35 +1643,28 @@ class StreamerDashboard(ctk.CTk):
                 game_val = (e_game.get() or "").strip()
 
                 def worker():
-                    try:
-                        self._ensure_dashboard_tables()
-                        if stream_data:
-                            self._db_update_planned_stream(
-                                plan_id=int(stream_data.get("id")),
-                                content_id=stream_data.get("content_id"),
-                                title=title_val,
-                                game=game_val,
-                                iso_date=iso_date
-                            )
-                        else:
-                            self._db_create_planned_stream(
-                                title=title_val,
-                                game=game_val,
-                                iso_date=iso_date
-                            )
-                        self.planned_streams = self._db_load_planned_streams()
-                        try:
-                            self.after(0, self._refresh_content_list)
-                        except Exception:
-                            pass
-                    except Exception as e:
-                        print("Content Planung DB Fehler:", repr(e))
-                        try:
-                            self.after(0, lambda: mb.showerror("Fehler", f"Speichern fehlgeschlagen: {e}"))
-                        except Exception:
-                            pass
-
-                threading.Thread(target=worker, daemon=True).start()
+                    if stream_data:
+                        self._db_update_planned_stream(
+                            plan_id=int(stream_data.get("id")),
+                            content_id=stream_data.get("content_id"),
+                            title=title_val,
+                            game=game_val,
+                            iso_date=iso_date
+                        )
+                    else:
+                        self._db_create_planned_stream(
+                            title=title_val,
+                            game=game_val,
+                            iso_date=iso_date
+                        )
+                    return self._db_load_planned_streams()
+
+                def on_error(e):
+                    print("Content Planung DB Fehler:", repr(e))
+                    mb.showerror("Fehler", f"Speichern fehlgeschlagen: {e}")
+
+                background.submit(worker, on_done=self._apply_planned_streams, on_error=on_error,
+                                  priority=background.PRIORITY_HIGH)
                 d.destroy()
             except ValueError:
                 mb.showerror("Fehler", "Ungültiges Datum.")
@@ -1537,24 +1682,18 @@ class StreamerDashboard(ctk.CTk):
                     return
 
                 def worker():
-                    try:
-                        self._ensure_dashboard_tables()
-                        success = self._db_delete_planned_stream(int(stream_data.get("id")))
-                        if not success:
-                            raise ValueError("Der ausgewählte Stream konnte nicht gelöscht werden.")
-                        self.planned_streams = self._db_load_planned_streams()
-                        try:
-                            self.after(0, self._refresh_content_list)
-                        except Exception:
-                            pass
-                    except Exception as e:
-                        print("Content Planung DB Fehler:", repr(e))
-                        try:
-                            self.after(0, lambda: mb.showerror("Fehler", f"Löschen fehlgeschlagen: {e}"))
-                        except Exception:
-                            pass
-
-                threading.Thread(target=worker, daemon=True).start()
+                    success = self._db_delete_planned_stream(int(stream_data.get("id")))
+                    if not success:
+                        raise ValueError("Der ausgewählte Stream konnte nicht gelöscht werden.")
+                    return self._db_load_planned_streams()
+
+                def on_error(e):
+                    print("Content Planung DB Fehler:", repr(e))
+                    mb.showerror("Fehler", f"Löschen fehlgeschlagen: {e}")
+
+                background.submit(worker, on_done=self._apply_planned_streams, on_error=on_error,
+                                  priority=background.PRIORITY_HIGH,
+                                  key=f"streamer-plan-delete:{stream_data.get('id')}")
                 d.destroy()
 
             ctk.CTkButton(action_frame, text="Archivieren", command=delete_stream, fg_color=COLOR_DANGER, hover_color="#a61e1e").grid(row=0, column=1, sticky="ew", padx=(5, 0))
@@ -1651,17 +1790,19 @@ class StreamerDashboard(ctk.CTk):
                     entry_data["amount"] = real_amt
                     entry_data["type"] = ftype.get()
                     entry_data["date"] = iso_date
+                    entry = entry_data
                 else:
                     entry_id = self._db_insert_finance(iso_date, txt, real_amt, ftype.get())
-                    self.finances.append({
+                    entry = {
                         "id": entry_id,
                         "date": iso_date,
                         "desc": txt,
                         "amount": real_amt,
                         "type": ftype.get()
-                    })
+                    }
+                    self.finances.append(entry)
 
-                self.show_view("Finance")
+                self._place_finance_entry(entry)
                 d.destroy()
             except ValueError:
                 mb.showerror("Fehler", "Ungültiger Betrag (Format: 00,00)")
@@ -1844,5 +1985,6 @@ class StreamerDashboard(ctk.CTk):
 
 
 if __name__ == "__main__":
+    migrations.ensure_schema()
     app = StreamerDashboard()
     app.mainloop()
\ No newline at end of file
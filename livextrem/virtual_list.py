@@ -0,0 +1,219 @@
+import math
+import weakref
+import customtkinter as ctk
+
+# -----------------------------------------------------------------------------
+# Virtualisierte Liste mit Widget-Recycling
+# -----------------------------------------------------------------------------
+# Statt pro Datensatz eigene Widgets zu bauen (CTkScrollableFrame), existieren
+# hier nur so viele Zeilen-Widgets, wie in den sichtbaren Bereich passen. Beim
+# Scrollen, Einfügen, Ändern oder Löschen werden diese Zeilen nur neu befüllt –
+# die Kosten hängen an der Zahl sichtbarer Zeilen, nicht an der Listenlänge.
+#
+#     def create_row(frame):            # einmal pro Pool-Zeile
+#         row = {"label": ctk.CTkLabel(frame)}
+#         row["label"].pack(side="left")
+#         return row
+#
+#     def bind_row(row, item):          # bei jedem (Neu-)Befüllen
+#         row["item"] = item
+#         row["label"].configure(text=item["name"])
+#
+#     lst = VirtualList(parent, row_height=34, create_row=create_row, bind_row=bind_row)
+#     lst.pack(fill="both", expand=True)
+#     lst.set_items(daten)
+#
+# Callbacks in den Zeilen sollten den aktuellen Datensatz über row["item"]
+# lesen (nicht per Default-Argument binden), da die Zeile wiederverwendet wird.
+# -----------------------------------------------------------------------------
+
+WHEEL_STEP = 3  # Zeilen pro Mausrad-Raster
+
+# Mausrad wird pro Tk-Root nur einmal global gebunden und an die Liste
+# weitergereicht, über der der Zeiger steht (Tk liefert Wheel-Events an das
+# Widget unter dem Zeiger, nicht an den Container).
+_wheel_targets = weakref.WeakSet()
+_wheel_roots = set()
+
+
+def _dispatch_wheel(event):
+    for target in list(_wheel_targets):
+        if target._on_mousewheel(event):
+            return
+
+
+def _bind_wheel_once(widget):
+    root = widget.winfo_toplevel()
+    key = str(root._w) + str(id(root.tk))
+    if key in _wheel_roots:
+        return
+    _wheel_roots.add(key)
+    for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+        widget.bind_all(seq, _dispatch_wheel, add="+")
+
+
+class VirtualList(ctk.CTkFrame):
+    def __init__(self, master, row_height, create_row, bind_row, empty_text="", row_gap=0, **kwargs):
+        kwargs.setdefault("fg_color", "transparent")
+        super().__init__(master, **kwargs)
+        self.row_height = int(row_height)
+        self.row_gap = int(row_gap)
+        self._create_row = create_row
+        self._bind_row = bind_row
+
+        self._items = []
+        self._offset = 0        # Index des obersten sichtbaren Datensatzes
+        self._pool = []         # [(frame, row_handle)]
+        self._placed = []       # ist die Pool-Zeile gerade platziert?
+        self._slots = 0         # benötigte Pool-Zeilen für die aktuelle Höhe
+
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(0, weight=1)
+
+        self._viewport = ctk.CTkFrame(self, fg_color="transparent")
+        self._viewport.grid(row=0, column=0, sticky="nsew")
+        self._scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar)
+        self._scrollbar.grid(row=0, column=1, sticky="ns")
+
+        self._empty_label = ctk.CTkLabel(self._viewport, text=empty_text, text_color="gray") if empty_text else None
+        self._empty_shown = False
+
+        self._viewport.bind("<Configure>", self._on_resize)
+        _wheel_targets.add(self)
+        _bind_wheel_once(self)
+
+    # ---------- Daten ----------
+    @property
+    def items(self):
+        return self._items
+
+    def set_items(self, items, keep_position=True):
+        """Ersetzt die Daten komplett (nur sichtbare Zeilen werden neu befüllt)."""
+        self._items = list(items or [])
+        if not keep_position:
+            self._offset = 0
+        self._render()
+
+    def insert(self, index, item):
+        self._items.insert(index, item)
+        self._render()
+
+    def append(self, item):
+        self.insert(len(self._items), item)
+
+    def remove(self, item):
+        """Entfernt einen Datensatz (Vergleich per Identität)."""
+        idx = self.index_of(item)
+        if idx is None:
+            return False
+        del self._items[idx]
+        self._render()
+        return True
+
+    def update_item(self, item):
+        """Befüllt die Zeile eines geänderten Datensatzes neu – falls sie sichtbar ist."""
+        idx = self.index_of(item)
+        if idx is None:
+            return
+        slot = idx - self._offset
+        if 0 <= slot < self._slots and slot < len(self._pool):
+            self._bind_row(self._pool[slot][1], item)
+
+    def index_of(self, item):
+        for i, it in enumerate(self._items):
+            if it is item:
+                return i
+        return None
+
+    def scroll_to(self, index):
+        self._offset = int(index)
+        self._render()
+
+    def refresh(self):
+        self._render()
+
+    # ---------- Layout ----------
+    def _stride(self):
+        return self.row_height + self.row_gap
+
+    def _page_rows(self):
+        """Anzahl vollständig sichtbarer Zeilen."""
+        return max(1, self._viewport.winfo_height() // self._stride())
+
+    def _on_resize(self, event=None):
+        height = max(1, self._viewport.winfo_height())
+        self._slots = math.ceil(height / self._stride())
+        while len(self._pool) < self._slots:
+            frame = ctk.CTkFrame(self._viewport, height=self.row_height, fg_color="transparent")
+            frame.pack_propagate(False)
+            self._pool.append((frame, self._create_row(frame)))
+            self._placed.append(False)
+        self._render()
+
+    def _clamp(self):
+        max_offset = max(0, len(self._items) - self._page_rows())
+        self._offset = max(0, min(self._offset, max_offset))
+
+    def _render(self):
+        self._clamp()
+        n = len(self._items)
+
+        if self._empty_label is not None:
+            if n == 0 and not self._empty_shown:
+                self._empty_label.pack(pady=15)
+                self._empty_shown = True
+            elif n and self._empty_shown:
+                self._empty_label.pack_forget()
+                self._empty_shown = False
+
+        stride = self._stride()
+        for slot, (frame, row) in enumerate(self._pool):
+            idx = self._offset + slot
+            if slot < self._slots and idx < n:
+                self._bind_row(row, self._items[idx])
+                if not self._placed[slot]:
+                    frame.place(x=0, y=slot * stride, relwidth=1)
+                    self._placed[slot] = True
+            elif self._placed[slot]:
+                frame.place_forget()
+                self._placed[slot] = False
+
+        if n <= self._page_rows():
+            self._scrollbar.set(0, 1)
+        else:
+            self._scrollbar.set(self._offset / n, min(1, (self._offset + self._page_rows()) / n))
+
+    # ---------- Scrollen ----------
+    def _on_scrollbar(self, *args):
+        if not args:
+            return
+        if args[0] == "moveto":
+            self._offset = int(round(float(args[1]) * len(self._items)))
+        elif args[0] == "scroll":
+            step = int(float(args[1]))
+            if len(args) > 2 and args[2] == "pages":
+                step *= self._page_rows()
+            self._offset += step
+        self._render()
+
+    def _contains(self, widget):
+        me = str(self)
+        w = str(widget)
+        return w == me or w.startswith(me + ".")
+
+    def _on_mousewheel(self, event):
+        """Scrollt, falls der Zeiger über dieser Liste steht (gibt dann True zurück)."""
+        try:
+            if not self.winfo_exists() or not self._contains(event.widget):
+                return False
+        except Exception:
+            return False
+        if getattr(event, "num", None) == 4:
+            direction = -1
+        elif getattr(event, "num", None) == 5:
+            direction = 1
+        else:
+            direction = -1 if event.delta > 0 else 1
+        self._offset += direction * WHEEL_STEP
+        self._render()
+        return True
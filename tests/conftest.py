@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Die Module in livextrem/ importieren sich flach (import db_pool, from config import Config)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "livextrem"))